@@ -0,0 +1,74 @@
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from opengeh_bronze.domain.constants.column_names.bronze_submitted_transactions_column_names import (
+    BronzeSubmittedTransactionsColumnNames,
+)
+
+
+@dataclass(frozen=True)
+class ReplayArguments:
+    topic: str
+    partition: int | None
+    range_column: str
+    range_start: int | datetime
+    range_end: int | datetime
+    slice_length: int | timedelta
+    parallelism: int
+
+
+def parse_replay_arguments(command_line_args: list[str]) -> ReplayArguments:
+    parser = argparse.ArgumentParser(description="Replay a range of bronze submitted transactions")
+    parser.add_argument("--topic", required=True)
+    parser.add_argument("--partition", type=int)
+    parser.add_argument("--offset-from", type=int, help="The first offset to replay")
+    parser.add_argument("--offset-to", type=int, help="The offset after the last offset to replay")
+    parser.add_argument("--time-from", type=_utc_datetime, help="The first Kafka timestamp to replay")
+    parser.add_argument("--time-to", type=_utc_datetime, help="The Kafka timestamp after the last one to replay")
+    parser.add_argument("--offsets-per-slice", type=int, default=1_000_000)
+    parser.add_argument("--hours-per-slice", type=int, default=1)
+    parser.add_argument("--parallelism", type=int, default=4)
+    args = parser.parse_args(command_line_args)
+
+    is_offset_range = args.offset_from is not None or args.offset_to is not None
+    is_time_range = args.time_from is not None or args.time_to is not None
+    if is_offset_range == is_time_range:
+        parser.error("Either --offset-from and --offset-to or --time-from and --time-to must be given")
+    if args.parallelism <= 0:
+        parser.error("--parallelism must be positive")
+
+    if is_offset_range:
+        if args.partition is None or args.offset_from is None or args.offset_to is None:
+            parser.error("--partition, --offset-from and --offset-to must be given together")
+        if args.offset_from >= args.offset_to:
+            parser.error("--offset-from must be before --offset-to")
+        if args.offsets_per_slice <= 0:
+            parser.error("--offsets-per-slice must be positive")
+        range_column = BronzeSubmittedTransactionsColumnNames.offset
+        range_start, range_end, slice_length = args.offset_from, args.offset_to, args.offsets_per_slice
+    else:
+        if args.time_from is None or args.time_to is None:
+            parser.error("--time-from and --time-to must be given together")
+        if args.time_from >= args.time_to:
+            parser.error("--time-from must be before --time-to")
+        if args.hours_per_slice <= 0:
+            parser.error("--hours-per-slice must be positive")
+        range_column = BronzeSubmittedTransactionsColumnNames.timestamp
+        range_start, range_end, slice_length = args.time_from, args.time_to, timedelta(hours=args.hours_per_slice)
+
+    return ReplayArguments(
+        topic=args.topic,
+        partition=args.partition,
+        range_column=range_column,
+        range_start=range_start,
+        range_end=range_end,
+        slice_length=slice_length,
+        parallelism=args.parallelism,
+    )
+
+
+def _utc_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 datetime. Datetimes without a time zone are in UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
@@ -3,5 +3,8 @@ from pyspark.sql.session import SparkSession
 
 
 def initialize_spark() -> SparkSession:
-    spark_conf = SparkConf(loadDefaults=True).set("spark.sql.session.timeZone", "UTC")
+    # The fair scheduler lets the streams of the supervisor run in their own scheduler pools
+    spark_conf = (
+        SparkConf(loadDefaults=True).set("spark.sql.session.timeZone", "UTC").set("spark.scheduler.mode", "FAIR")
+    )
     return SparkSession.builder.config(conf=spark_conf).getOrCreate()
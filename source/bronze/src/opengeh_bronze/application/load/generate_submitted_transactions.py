@@ -0,0 +1,52 @@
+import logging
+from functools import partial
+from typing import Callable
+
+from pyspark.sql import DataFrame
+
+import opengeh_bronze.application.config.spark_session as spark_session
+import opengeh_bronze.infrastructure.load.submitted_transactions_generator as generator
+from opengeh_bronze.application.load.load_generator import LoadGenerator
+from opengeh_bronze.application.settings.ingest_settings import IngestSettings, SubmittedTransactionsSource
+from opengeh_bronze.application.settings.load_generator_settings import LoadGeneratorSettings
+
+
+def generate_submitted_transactions() -> None:
+    """Generate submitted transactions at a constant rate for the local source of the ingest stream.
+
+    The records are written to the source of the `IngestSettings`, so the ingest stream started with the same
+    environment variables reads them.
+    """
+    logging.basicConfig(level=logging.INFO)
+    ingest_settings = IngestSettings()
+    load_settings = LoadGeneratorSettings()
+    write = _get_writer(ingest_settings)
+    spark = spark_session.initialize_spark()
+
+    def write_batch(first_sequence_number: int, count: int) -> None:
+        records = generator.generate_submitted_transactions(
+            spark,
+            first_sequence_number,
+            count,
+            load_settings.load_partitions,
+            ingest_settings.local_kafka_topic,
+            load_settings.load_points_per_transaction,
+        )
+        write(records)
+
+    LoadGenerator(
+        write_batch,
+        load_settings.load_records_per_second,
+        interval_seconds=load_settings.load_interval_seconds,
+    ).run(load_settings.load_duration_seconds, load_settings.load_first_sequence_number)
+
+
+def _get_writer(ingest_settings: IngestSettings) -> Callable[[DataFrame], None]:
+    source = ingest_settings.submitted_transactions_source
+    if source == SubmittedTransactionsSource.FILES:
+        return partial(generator.write_to_files, path=ingest_settings.get_recorded_submitted_transactions_path())
+    if source == SubmittedTransactionsSource.LOCAL_KAFKA:
+        return partial(generator.write_to_kafka, bootstrap_servers=ingest_settings.local_kafka_bootstrap_servers)
+
+    # The load is not generated for the Event Hub, which is shared with the other subsystems
+    raise ValueError(f"Cannot generate submitted transactions for the source {source.value}")
@@ -0,0 +1,56 @@
+import logging
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class LoadGenerator:
+    """Write batches of generated records at a constant rate.
+
+    Every interval a batch of `records_per_second * interval_seconds` records is written, and the generator waits
+    for the start of the next interval. When writing a batch takes longer than the interval, the next batch is written
+    right away and a warning is logged, as the target rate cannot be sustained.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[int, int], None],
+        records_per_second: int,
+        interval_seconds: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._write_batch = write_batch
+        self._records_per_interval = max(1, round(records_per_second * interval_seconds))
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+    def run(self, duration_seconds: float, first_sequence_number: int = 0) -> int:
+        """Write batches of records until the duration has passed.
+
+        Args:
+            duration_seconds (float): How long to generate records.
+            first_sequence_number (int, optional): The sequence number of the first record.
+
+        Returns:
+            int: The number of records written.
+        """
+        start = self._clock()
+        next_sequence_number = first_sequence_number
+        next_batch_start = start
+        while next_batch_start - start < duration_seconds:
+            self._write_batch(next_sequence_number, self._records_per_interval)
+            next_sequence_number += self._records_per_interval
+            next_batch_start += self._interval_seconds
+
+            behind_seconds = self._clock() - next_batch_start
+            if behind_seconds > 0:
+                logger.warning(f"Load generation is {behind_seconds:.1f} seconds behind the target rate")
+            else:
+                self._sleep(-behind_seconds)
+
+        written = next_sequence_number - first_sequence_number
+        logger.info(f"Generated {written} records in {self._clock() - start:.1f} seconds")
+        return written
@@ -0,0 +1,42 @@
+import logging
+import sys
+
+import telemetry_logging.logging_configuration as config
+from opentelemetry.trace import SpanKind
+from telemetry_logging.span_recording import span_record_exception
+
+import opengeh_bronze.application.config.spark_session as spark_session
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.domain.constants.table_names import TableNames
+from opengeh_bronze.infrastructure.maintenance.table_maintenance import TableMaintenanceSettings, maintain_table
+
+# The bronze tables are only read by streams, so no statistics are computed for them
+TABLES_TO_MAINTAIN = [
+    TableMaintenanceSettings(
+        table_name=f"{DatabaseNames.bronze_database}.{TableNames.bronze_submitted_transactions_table}",
+        min_num_files_to_optimize=100,
+    ),
+    TableMaintenanceSettings(
+        table_name=f"{DatabaseNames.bronze_database}.{TableNames.bronze_measurements_table}",
+        min_num_files_to_optimize=100,
+    ),
+]
+
+
+def maintain(applicationinsights_connection_string: str | None = None) -> None:
+    config.configure_logging(
+        cloud_role_name="dbr-measurements-bronze",
+        tracer_name="maintenance-bronze-job",
+        applicationinsights_connection_string=applicationinsights_connection_string,
+        extras={"Subsystem": "measurements"},
+    )
+    logging.basicConfig(level=logging.INFO)
+
+    with config.get_tracer().start_as_current_span(__name__, kind=SpanKind.SERVER) as span:
+        try:
+            spark = spark_session.initialize_spark()
+            for settings in TABLES_TO_MAINTAIN:
+                maintain_table(spark, settings)
+        except Exception as e:
+            span_record_exception(e, span)
+            sys.exit(4)
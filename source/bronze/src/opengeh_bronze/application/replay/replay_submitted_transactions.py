@@ -0,0 +1,108 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from pyspark.sql import Column, SparkSession
+from pyspark.sql import functions as F
+
+import opengeh_bronze.application.config.spark_session as spark_session
+import opengeh_bronze.domain.transformations.submitted_transactions_transformation as submitted_transactions_transformation
+from opengeh_bronze.application.config.replay_arguments import parse_replay_arguments
+from opengeh_bronze.domain.constants.column_names.bronze_submitted_transactions_column_names import (
+    BronzeSubmittedTransactionsColumnNames,
+)
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.domain.constants.table_names import TableNames
+
+logger = logging.getLogger(__name__)
+
+REPLAY_RANGE_COLUMNS = [BronzeSubmittedTransactionsColumnNames.offset, BronzeSubmittedTransactionsColumnNames.timestamp]
+
+
+@dataclass(frozen=True)
+class ReplaySlice:
+    """The submitted transactions of a topic, and optionally a partition, with a range column in `[start, end)`."""
+
+    topic: str
+    partition: int | None
+    range_column: str
+    start: int | datetime
+    end: int | datetime
+
+    def condition(self) -> Column:
+        condition = (
+            (F.col(BronzeSubmittedTransactionsColumnNames.topic) == F.lit(self.topic))
+            & (F.col(self.range_column) >= F.lit(self.start))
+            & (F.col(self.range_column) < F.lit(self.end))
+        )
+        if self.partition is not None:
+            condition &= F.col(BronzeSubmittedTransactionsColumnNames.partition) == F.lit(self.partition)
+        return condition
+
+
+def replay(command_line_args: list[str]) -> None:
+    logging.basicConfig(level=logging.INFO)
+    arguments = parse_replay_arguments(command_line_args)
+    slices = list(
+        get_replay_slices(
+            arguments.topic,
+            arguments.partition,
+            arguments.range_column,
+            arguments.range_start,
+            arguments.range_end,
+            arguments.slice_length,
+        )
+    )
+    spark = spark_session.initialize_spark()
+    replay_submitted_transactions(spark, slices, arguments.parallelism)
+
+
+def get_replay_slices(
+    topic: str,
+    partition: int | None,
+    range_column: str,
+    range_start: int | datetime,
+    range_end: int | datetime,
+    slice_length: int | timedelta,
+) -> Iterator[ReplaySlice]:
+    """Split a range of submitted transactions into slices of at most `slice_length` offsets or time.
+
+    Raises:
+        ValueError: If the range column is not supported, or an offset range is not within a partition.
+    """
+    if range_column not in REPLAY_RANGE_COLUMNS:
+        raise ValueError(f"Replay range column must be one of {', '.join(REPLAY_RANGE_COLUMNS)}")
+    if range_column == BronzeSubmittedTransactionsColumnNames.offset and partition is None:
+        raise ValueError("Offset ranges must be within a partition")
+
+    slice_start = range_start
+    while slice_start < range_end:
+        slice_end = min(slice_start + slice_length, range_end)
+        yield ReplaySlice(topic, partition, range_column, slice_start, slice_end)
+        slice_start = slice_end
+
+
+def replay_submitted_transactions(spark: SparkSession, slices: list[ReplaySlice], parallelism: int = 4) -> None:
+    """Decode the submitted transactions of the slices into the bronze measurements as batch jobs.
+
+    The submitted transactions are read as a static DataFrame, so the checkpoints of the streams are neither used
+    nor changed. The submitted transactions table is clustered by partition and offset, so a slice only reads the
+    files with its offsets. Up to `parallelism` slices are decoded at the same time, as the appends to the bronze
+    measurements do not conflict. Each slice is decoded like a micro-batch of the decode stream, so the replayed
+    transactions are appended again, like transactions that are submitted again.
+    """
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        # Consuming the results raises the first error after the running slices have completed
+        list(executor.map(lambda replay_slice: _replay_slice(spark, replay_slice), slices))
+
+
+def _replay_slice(spark: SparkSession, replay_slice: ReplaySlice) -> None:
+    source_table_name = f"{DatabaseNames.bronze_database}.{TableNames.bronze_submitted_transactions_table}"
+    target_table_name = f"{DatabaseNames.bronze_database}.{TableNames.bronze_measurements_table}"
+
+    submitted_transactions = spark.read.table(source_table_name).where(replay_slice.condition())
+    bronze_measurements = submitted_transactions_transformation.transform(submitted_transactions)
+    bronze_measurements.write.format("delta").mode("append").saveAsTable(target_table_name)
+    logger.info(f"Replayed {replay_slice.range_column} [{replay_slice.start}, {replay_slice.end})")
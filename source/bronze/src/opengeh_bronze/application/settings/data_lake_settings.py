@@ -0,0 +1,19 @@
+from pydantic_settings import BaseSettings
+
+
+class DataLakeSettings(BaseSettings):
+    """Configuration class inheriting pydantic's BaseSettings to automatically load environmental variable.
+
+    Used to define and validate settings for the storage account holding the bronze checkpoints.
+
+    Attributes:
+    datalake_storage_account (str): The name of the data lake storage account.
+
+    Config:
+    case_sensitive (bool): Indicates whether the settings are case-sensitive. Defaults to False.
+    """
+
+    datalake_storage_account: str
+
+    class Config:
+        case_sensitive = False
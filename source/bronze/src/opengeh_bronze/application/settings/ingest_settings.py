@@ -0,0 +1,76 @@
+from enum import Enum
+
+from pydantic_settings import BaseSettings
+
+
+class SubmittedTransactionsSource(str, Enum):
+    EVENT_HUB = "event_hub"
+    """The submitted transactions Event Hub, read with the Kafka protocol."""
+
+    LOCAL_KAFKA = "local_kafka"
+    """A local Kafka broker without authentication, e.g. a broker in a container on the developer machine."""
+
+    FILES = "files"
+    """Recorded Kafka records in Parquet files with the schema of the submitted transactions table."""
+
+
+class IngestSettings(BaseSettings):
+    """Configuration class inheriting pydantic's BaseSettings to automatically load environmental variable.
+
+    Used to define where the submitted transactions are ingested from, and how fast they are read.
+
+    Attributes:
+    submitted_transactions_source (SubmittedTransactionsSource): The source of the submitted transactions. Defaults
+        to the Event Hub, which is connected to with the `SubmittedTransactionsStreamSettings`.
+    max_offsets_per_trigger (int | None): The maximum number of offsets read per micro-batch from Kafka, split
+        proportionally across the partitions. Defaults to no limit.
+    min_partitions (int | None): The minimum number of Spark partitions to read per micro-batch from Kafka. When it is
+        above the number of Kafka partitions, large partitions are split across several tasks. Defaults to one task per
+        Kafka partition.
+    trigger_processing_time (str | None): The interval between micro-batches, e.g. `30 seconds`. Defaults to starting
+        the next micro-batch as soon as the previous one has completed.
+    local_kafka_bootstrap_servers (str): The bootstrap servers of the local Kafka broker. Defaults to `localhost:9092`.
+    local_kafka_topic (str): The topic of the local Kafka broker. Defaults to `submitted-transactions`.
+    recorded_submitted_transactions_path (str | None): The directory of the recorded Kafka records.
+    max_files_per_trigger (int | None): The maximum number of recorded files read per micro-batch. Defaults to no
+        limit.
+    ingest_checkpoint_path (str | None): The checkpoint location of the ingest stream, e.g. a local directory when
+        ingesting from a local source. Defaults to the checkpoint in the data lake.
+
+    Config:
+    case_sensitive (bool): Indicates whether the settings are case-sensitive. Defaults to False.
+    """
+
+    submitted_transactions_source: SubmittedTransactionsSource = SubmittedTransactionsSource.EVENT_HUB
+    max_offsets_per_trigger: int | None = None
+    min_partitions: int | None = None
+    trigger_processing_time: str | None = None
+    local_kafka_bootstrap_servers: str = "localhost:9092"
+    local_kafka_topic: str = "submitted-transactions"
+    recorded_submitted_transactions_path: str | None = None
+    max_files_per_trigger: int | None = None
+    ingest_checkpoint_path: str | None = None
+
+    class Config:
+        case_sensitive = False
+
+    def create_rate_limit_options(self) -> dict:
+        options = {}
+        if self.max_offsets_per_trigger is not None:
+            options["maxOffsetsPerTrigger"] = str(self.max_offsets_per_trigger)
+        if self.min_partitions is not None:
+            options["minPartitions"] = str(self.min_partitions)
+        return options
+
+    def create_local_kafka_options(self) -> dict:
+        return {
+            "kafka.bootstrap.servers": self.local_kafka_bootstrap_servers,
+            "subscribe": self.local_kafka_topic,
+            "startingOffsets": "earliest",
+            **self.create_rate_limit_options(),
+        }
+
+    def get_recorded_submitted_transactions_path(self) -> str:
+        if not self.recorded_submitted_transactions_path:
+            raise ValueError("RECORDED_SUBMITTED_TRANSACTIONS_PATH must be set when reading recorded files")
+        return self.recorded_submitted_transactions_path
@@ -0,0 +1,31 @@
+from pydantic_settings import BaseSettings
+
+
+class LoadGeneratorSettings(BaseSettings):
+    """Configuration class inheriting pydantic's BaseSettings to automatically load environmental variable.
+
+    Used to define the load of submitted transactions generated for ingest benchmarks.
+
+    Attributes:
+    load_records_per_second (int): The number of records generated per second. Defaults to 1000.
+    load_duration_seconds (float): How long records are generated. Defaults to 60.
+    load_interval_seconds (float): The interval between the batches of generated records. Defaults to 1.
+    load_partitions (int): The number of partitions of the generated records. Only used for recorded files, as a
+        Kafka broker assigns the partitions itself. Defaults to 4.
+    load_points_per_transaction (int): The number of points of each generated transaction. Defaults to 24.
+    load_first_sequence_number (int): The sequence number of the first generated record. Defaults to 0, so records
+        generated again for the same target must start after the records that were already generated.
+
+    Config:
+    case_sensitive (bool): Indicates whether the settings are case-sensitive. Defaults to False.
+    """
+
+    load_records_per_second: int = 1000
+    load_duration_seconds: float = 60
+    load_interval_seconds: float = 1
+    load_partitions: int = 4
+    load_points_per_transaction: int = 24
+    load_first_sequence_number: int = 0
+
+    class Config:
+        case_sensitive = False
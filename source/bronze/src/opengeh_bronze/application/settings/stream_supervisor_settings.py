@@ -0,0 +1,32 @@
+from pydantic_settings import BaseSettings
+
+
+class StreamSupervisorSettings(BaseSettings):
+    """Configuration class inheriting pydantic's BaseSettings to automatically load environmental variable.
+
+    Used to define which streams the stream supervisor runs, and how failed streams are restarted.
+
+    Attributes:
+    supervised_streams (str | None): Comma separated names of the streams to run. Defaults to all streams.
+    stream_max_restarts (int): The number of times in a row a failing stream is restarted. Defaults to 5.
+    stream_initial_backoff_seconds (float): The wait before the first restart of a failed stream. Defaults to 10.
+    stream_max_backoff_seconds (float): The longest wait before restarting a failed stream. Defaults to 600.
+    stream_min_healthy_seconds (float): How long a stream must run before its backoff is reset. Defaults to 600.
+
+    Config:
+    case_sensitive (bool): Indicates whether the settings are case-sensitive. Defaults to False.
+    """
+
+    supervised_streams: str | None = None
+    stream_max_restarts: int = 5
+    stream_initial_backoff_seconds: float = 10
+    stream_max_backoff_seconds: float = 600
+    stream_min_healthy_seconds: float = 600
+
+    class Config:
+        case_sensitive = False
+
+    def get_stream_names(self) -> list[str] | None:
+        if not self.supervised_streams:
+            return None
+        return [name.strip() for name in self.supervised_streams.split(",")]
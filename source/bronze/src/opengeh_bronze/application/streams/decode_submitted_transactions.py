@@ -0,0 +1,40 @@
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.streaming import StreamingQuery
+
+import opengeh_bronze.application.config.spark_session as spark_session
+import opengeh_bronze.domain.transformations.submitted_transactions_transformation as submitted_transactions_transformation
+from opengeh_bronze.application.settings.data_lake_settings import DataLakeSettings
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.domain.constants.table_names import TableNames
+from opengeh_bronze.infrastructure.config.container_names import ContainerNames
+from opengeh_bronze.infrastructure.helpers.path_helper import get_checkpoint_path
+from opengeh_bronze.infrastructure.streams import writer
+from opengeh_bronze.infrastructure.streams.bronze_repository import BronzeRepository
+
+QUERY_NAME = "bronze_submitted_transactions_to_bronze_measurements"
+
+
+def decode_submitted_transactions() -> None:
+    spark = spark_session.initialize_spark()
+    start_decode_submitted_transactions(spark).awaitTermination()
+
+
+def start_decode_submitted_transactions(spark: SparkSession) -> StreamingQuery:
+    submitted_transactions = BronzeRepository(spark).read_submitted_transactions()
+    checkpoint_path = get_checkpoint_path(
+        DataLakeSettings().datalake_storage_account,
+        ContainerNames.bronze,
+        TableNames.bronze_measurements_table,
+    )
+    return writer.start_stream(
+        submitted_transactions,
+        QUERY_NAME,
+        checkpoint_path,
+        _batch_operations,
+    )
+
+
+def _batch_operations(df: DataFrame, batchId: int) -> None:
+    df = submitted_transactions_transformation.transform(df)
+    target_table_name = f"{DatabaseNames.bronze_database}.{TableNames.bronze_measurements_table}"
+    df.write.format("delta").mode("append").saveAsTable(target_table_name)
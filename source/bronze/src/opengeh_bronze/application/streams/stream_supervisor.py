@@ -0,0 +1,114 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from pyspark.errors import StreamingQueryException
+from pyspark.sql import SparkSession
+from pyspark.sql.streaming import StreamingQuery
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SupervisedStream:
+    """A streaming query started by the supervisor in its own fair scheduler pool."""
+
+    name: str
+    start: Callable[[SparkSession], StreamingQuery]
+    scheduler_pool: str
+
+
+class StreamSupervisor:
+    """Run several streaming queries in one Spark application.
+
+    The queries are started in their own fair scheduler pools, so a large micro-batch of one query does not hold
+    back the others. A failed query is restarted after an exponential backoff. The backoff is reset when the failed
+    query was healthy: it had processed rows in one of its recent micro-batches, or it had run for at least
+    `min_healthy_seconds`. Micro-batches without rows do not count, so a query that fails on every batch with data
+    reaches `max_restarts` even when it reports idle progress in between. When the supervisor stops, for any reason,
+    all its queries are stopped.
+    """
+
+    def __init__(
+        self,
+        spark: SparkSession,
+        streams: list[SupervisedStream],
+        max_restarts: int = 5,
+        initial_backoff_seconds: float = 10,
+        max_backoff_seconds: float = 600,
+        min_healthy_seconds: float = 600,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._spark = spark
+        self._streams = {stream.name: stream for stream in streams}
+        self._max_restarts = max_restarts
+        self._initial_backoff_seconds = initial_backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._min_healthy_seconds = min_healthy_seconds
+        self._sleep = sleep
+        self._clock = clock
+        self._queries: dict[str, StreamingQuery] = {}
+        self._started: dict[str, float] = {}
+        self._restarts: dict[str, int] = {}
+
+    def run(self) -> None:
+        """Start the queries and supervise them until all of them have stopped.
+
+        Raises:
+            RuntimeError: If a query has failed more than `max_restarts` times in a row.
+        """
+        try:
+            for name in self._streams:
+                self._start(name)
+
+            while self._queries:
+                try:
+                    self._spark.streams.awaitAnyTermination()
+                except StreamingQueryException:
+                    # The failed queries are handled below, like the queries that stopped
+                    pass
+                self._spark.streams.resetTerminated()
+                for name, query in list(self._queries.items()):
+                    if not query.isActive:
+                        self._handle_termination(name, query)
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        for name, query in self._queries.items():
+            if query.isActive:
+                logger.info(f"Stopping stream {name}")
+                query.stop()
+        self._queries.clear()
+
+    def _start(self, name: str) -> None:
+        stream = self._streams[name]
+        # The scheduler pool is a local property of the thread that starts the query
+        self._spark.sparkContext.setLocalProperty("spark.scheduler.pool", stream.scheduler_pool)
+        self._queries[name] = stream.start(self._spark)
+        self._started[name] = self._clock()
+        logger.info(f"Started stream {name} in scheduler pool {stream.scheduler_pool}")
+
+    def _handle_termination(self, name: str, query: StreamingQuery) -> None:
+        del self._queries[name]
+        exception = query.exception()
+        if exception is None:
+            logger.info(f"Stream {name} has stopped")
+            return
+
+        restarts = 0 if self._was_healthy(name, query) else self._restarts.get(name, 0)
+        if restarts >= self._max_restarts:
+            raise RuntimeError(f"Stream {name} has failed {restarts + 1} times in a row") from exception
+
+        backoff_seconds = min(self._initial_backoff_seconds * 2**restarts, self._max_backoff_seconds)
+        logger.warning(f"Stream {name} failed, restarting in {backoff_seconds} seconds: {exception}")
+        self._sleep(backoff_seconds)
+        self._restarts[name] = restarts + 1
+        self._start(name)
+
+    def _was_healthy(self, name: str, query: StreamingQuery) -> bool:
+        if self._clock() - self._started[name] >= self._min_healthy_seconds:
+            return True
+        return any(progress["numInputRows"] > 0 for progress in query.recentProgress)
@@ -1,11 +1,75 @@
+from typing import Callable
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.streaming import StreamingQuery
+
 import opengeh_bronze.application.config.spark_session as spark_session
 import opengeh_bronze.infrastructure.streams.kafka_stream as kafka_stream
+from opengeh_bronze.application.settings.data_lake_settings import DataLakeSettings
+from opengeh_bronze.application.settings.ingest_settings import IngestSettings, SubmittedTransactionsSource
 from opengeh_bronze.application.settings.submitted_transactions_stream_settings import (
     SubmittedTransactionsStreamSettings,
 )
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.domain.constants.table_names import TableNames
+from opengeh_bronze.infrastructure.config.container_names import ContainerNames
+from opengeh_bronze.infrastructure.helpers.path_helper import get_checkpoint_path
+from opengeh_bronze.infrastructure.streams import writer
+
+QUERY_NAME = "event_hub_to_bronze_submitted_transactions"
 
 
-def submit_transactions() -> None:
+def ingest_submitted_transactions() -> None:
     spark = spark_session.initialize_spark()
-    kafka_options = SubmittedTransactionsStreamSettings().create_kafka_options()
-    kafka_stream.submit_transactions(spark, kafka_options)
+    start_ingest_submitted_transactions(spark).awaitTermination()
+
+
+def start_ingest_submitted_transactions(spark: SparkSession) -> StreamingQuery:
+    ingest_settings = IngestSettings()
+    submitted_transactions = _read_submitted_transactions(spark, ingest_settings)
+    checkpoint_path = ingest_settings.ingest_checkpoint_path or get_checkpoint_path(
+        DataLakeSettings().datalake_storage_account,
+        ContainerNames.bronze,
+        TableNames.bronze_submitted_transactions_table,
+    )
+    return writer.start_stream(
+        submitted_transactions,
+        QUERY_NAME,
+        checkpoint_path,
+        _create_batch_operations(checkpoint_path),
+        trigger_processing_time=ingest_settings.trigger_processing_time,
+    )
+
+
+def _read_submitted_transactions(spark: SparkSession, ingest_settings: IngestSettings) -> DataFrame:
+    source = ingest_settings.submitted_transactions_source
+    if source == SubmittedTransactionsSource.FILES:
+        return kafka_stream.read_recorded_kafka_stream(
+            spark,
+            ingest_settings.get_recorded_submitted_transactions_path(),
+            ingest_settings.max_files_per_trigger,
+        )
+    if source == SubmittedTransactionsSource.LOCAL_KAFKA:
+        return kafka_stream.read_kafka_stream(spark, ingest_settings.create_local_kafka_options())
+
+    kafka_options = {
+        **SubmittedTransactionsStreamSettings().create_kafka_options(),
+        **ingest_settings.create_rate_limit_options(),
+    }
+    return kafka_stream.read_kafka_stream(spark, kafka_options)
+
+
+def _create_batch_operations(checkpoint_path: str) -> Callable[[DataFrame, int], None]:
+    txn_app_id = None
+
+    def batch_operations(df: DataFrame, batchId: int) -> None:
+        # The batch id is recorded as the Delta transaction version of the query, so a micro-batch that is replayed
+        # after a failure is skipped instead of appended twice. The app id is read once per start of the query.
+        nonlocal txn_app_id
+        txn_app_id = txn_app_id or writer.get_txn_app_id(df.sparkSession, QUERY_NAME, checkpoint_path)
+        target_table_name = f"{DatabaseNames.bronze_database}.{TableNames.bronze_submitted_transactions_table}"
+        df.write.format("delta").mode("append").option("txnAppId", txn_app_id).option(
+            "txnVersion", batchId
+        ).saveAsTable(target_table_name)
+
+    return batch_operations
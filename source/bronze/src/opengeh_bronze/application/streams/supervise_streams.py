@@ -0,0 +1,46 @@
+import logging
+import signal
+import sys
+
+import opengeh_bronze.application.config.spark_session as spark_session
+import opengeh_bronze.application.streams.decode_submitted_transactions as decode_stream
+import opengeh_bronze.application.streams.submitted_transactions as ingest_stream
+from opengeh_bronze.application.settings.stream_supervisor_settings import StreamSupervisorSettings
+from opengeh_bronze.application.streams.stream_supervisor import StreamSupervisor, SupervisedStream
+
+STREAMS = [
+    SupervisedStream(
+        name="ingest_submitted_transactions",
+        start=ingest_stream.start_ingest_submitted_transactions,
+        scheduler_pool="ingest_submitted_transactions",
+    ),
+    SupervisedStream(
+        name="decode_submitted_transactions",
+        start=decode_stream.start_decode_submitted_transactions,
+        scheduler_pool="decode_submitted_transactions",
+    ),
+]
+
+
+def supervise_streams() -> None:
+    logging.basicConfig(level=logging.INFO)
+    settings = StreamSupervisorSettings()
+    stream_names = settings.get_stream_names()
+    if stream_names is not None:
+        unknown_names = set(stream_names) - {stream.name for stream in STREAMS}
+        if unknown_names:
+            raise ValueError(f"Unknown streams: {', '.join(sorted(unknown_names))}")
+
+    spark = spark_session.initialize_spark()
+    supervisor = StreamSupervisor(
+        spark,
+        [stream for stream in STREAMS if stream_names is None or stream.name in stream_names],
+        max_restarts=settings.stream_max_restarts,
+        initial_backoff_seconds=settings.stream_initial_backoff_seconds,
+        max_backoff_seconds=settings.stream_max_backoff_seconds,
+        min_healthy_seconds=settings.stream_min_healthy_seconds,
+    )
+
+    # Exiting on SIGTERM makes the supervisor stop its queries before the job is cancelled
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    supervisor.run()
@@ -0,0 +1,105 @@
+from itertools import chain
+
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql.protobuf.functions import from_protobuf
+from pyspark.sql.types import StringType
+
+import opengeh_bronze.infrastructure.contracts.persist_submitted_transaction as contract
+from opengeh_bronze.domain.constants.column_names.bronze_measurements_column_names import (
+    BronzeMeasurementsColumnNames,
+)
+from opengeh_bronze.domain.constants.column_names.bronze_submitted_transactions_column_names import (
+    BronzeSubmittedTransactionsColumnNames,
+)
+from opengeh_bronze.infrastructure.contracts.decimal_value import to_decimal_column
+from opengeh_bronze.infrastructure.contracts.persist_submitted_transaction import PersistSubmittedTransaction
+
+_DECODED = "decoded"
+
+
+def transform(submitted_transactions: DataFrame, descriptor_path: str | None = None) -> DataFrame:
+    """Decode the protobuf payloads of the submitted transactions into bronze measurements.
+
+    Both the decoding and the mapping are Spark expressions, so no rows are serialized to Python.
+    Payloads that cannot be decoded are kept as base64 in the `_rescued_data` column.
+    """
+    decoded = unpack_submitted_transactions(submitted_transactions, descriptor_path)
+    return map_to_bronze_measurements(decoded)
+
+
+def unpack_submitted_transactions(submitted_transactions: DataFrame, descriptor_path: str | None = None) -> DataFrame:
+    return submitted_transactions.select(
+        from_protobuf(
+            F.col(BronzeSubmittedTransactionsColumnNames.value),
+            contract.MESSAGE_NAME,
+            descFilePath=descriptor_path or contract.get_descriptor_path(),
+            options={"mode": "PERMISSIVE"},
+        ).alias(_DECODED),
+        F.col(BronzeSubmittedTransactionsColumnNames.value),
+    )
+
+
+def map_to_bronze_measurements(decoded: DataFrame) -> DataFrame:
+    """Map decoded `PersistSubmittedTransaction` messages to the bronze measurements schema.
+
+    Expects a `decoded` struct column with the message and the raw `value` column.
+    """
+    transaction = F.col(_DECODED)
+    return decoded.select(
+        _map_enum(
+            transaction.getField(PersistSubmittedTransaction.orchestration_type), contract.ORCHESTRATION_TYPES
+        ).alias(BronzeMeasurementsColumnNames.orchestration_type),
+        transaction.getField(PersistSubmittedTransaction.orchestration_instance_id).alias(
+            BronzeMeasurementsColumnNames.orchestration_instance_id
+        ),
+        transaction.getField(PersistSubmittedTransaction.metering_point_id).alias(
+            BronzeMeasurementsColumnNames.metering_point_id
+        ),
+        transaction.getField(PersistSubmittedTransaction.transaction_id).alias(
+            BronzeMeasurementsColumnNames.transaction_id
+        ),
+        transaction.getField(PersistSubmittedTransaction.transaction_creation_datetime).alias(
+            BronzeMeasurementsColumnNames.transaction_creation_datetime
+        ),
+        _map_enum(
+            transaction.getField(PersistSubmittedTransaction.metering_point_type), contract.METERING_POINT_TYPES
+        ).alias(BronzeMeasurementsColumnNames.metering_point_type),
+        transaction.getField(PersistSubmittedTransaction.product).alias(BronzeMeasurementsColumnNames.product),
+        _map_enum(transaction.getField(PersistSubmittedTransaction.unit), contract.UNITS).alias(
+            BronzeMeasurementsColumnNames.unit
+        ),
+        _map_enum(transaction.getField(PersistSubmittedTransaction.resolution), contract.RESOLUTIONS).alias(
+            BronzeMeasurementsColumnNames.resolution
+        ),
+        transaction.getField(PersistSubmittedTransaction.start_datetime).alias(
+            BronzeMeasurementsColumnNames.start_datetime
+        ),
+        transaction.getField(PersistSubmittedTransaction.end_datetime).alias(
+            BronzeMeasurementsColumnNames.end_datetime
+        ),
+        F.transform(transaction.getField(PersistSubmittedTransaction.points), _map_point).alias(
+            BronzeMeasurementsColumnNames.points
+        ),
+        F.when(transaction.isNull(), F.base64(F.col(BronzeSubmittedTransactionsColumnNames.value)))
+        .otherwise(F.lit(None).cast(StringType()))
+        .alias(BronzeMeasurementsColumnNames.rescued_data),
+        F.current_timestamp().alias(BronzeMeasurementsColumnNames.created),
+    )
+
+
+def _map_point(point: Column) -> Column:
+    return F.struct(
+        point.getField(PersistSubmittedTransaction.Point.position).alias(BronzeMeasurementsColumnNames.Points.position),
+        to_decimal_column(point.getField(PersistSubmittedTransaction.Point.quantity)).alias(
+            BronzeMeasurementsColumnNames.Points.quantity
+        ),
+        _map_enum(point.getField(PersistSubmittedTransaction.Point.quality), contract.QUALITIES).alias(
+            BronzeMeasurementsColumnNames.Points.quality
+        ),
+    )
+
+
+def _map_enum(column: Column, mapping: dict[str, str]) -> Column:
+    lookup = F.create_map([F.lit(value) for value in chain(*mapping.items())])
+    return lookup[column]
@@ -1,5 +1,38 @@
+import os
+import sys
+
+import opengeh_bronze.application.load.generate_submitted_transactions as load_generation
+import opengeh_bronze.application.maintenance.maintain_tables as maintain_tables
+import opengeh_bronze.application.replay.replay_submitted_transactions as replay_transactions
+import opengeh_bronze.application.streams.decode_submitted_transactions as decode_stream
+import opengeh_bronze.application.streams.submitted_transactions as ingest_stream
+import opengeh_bronze.application.streams.supervise_streams as supervised_streams
 import opengeh_bronze.migrations.migrations_runner as migrations_runner
 
 
 def migrate() -> None:
     migrations_runner.migrate()
+
+
+def ingest_submitted_transactions() -> None:
+    ingest_stream.ingest_submitted_transactions()
+
+
+def decode_submitted_transactions() -> None:
+    decode_stream.decode_submitted_transactions()
+
+
+def maintain() -> None:
+    maintain_tables.maintain(os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING"))
+
+
+def supervise_streams() -> None:
+    supervised_streams.supervise_streams()
+
+
+def generate_submitted_transactions() -> None:
+    load_generation.generate_submitted_transactions()
+
+
+def replay_submitted_transactions() -> None:
+    replay_transactions.replay(sys.argv[1:])
@@ -0,0 +1,2 @@
+class ContainerNames:
+    bronze = "bronze"
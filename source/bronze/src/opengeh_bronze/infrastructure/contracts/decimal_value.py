@@ -1,3 +1,10 @@
+from decimal import Decimal
+
+from pyspark.sql import Column
+from pyspark.sql import functions as F
+from pyspark.sql.types import DecimalType
+
+
 # ProtoBuf doesn't support decimal.
 # This implementation is inspired by https://docs.microsoft.com/en-us/aspnet/core/grpc/protobuf?view=aspnetcore-5.0#decimals.
 #
@@ -14,9 +21,22 @@ class DecimalValue:
 
     @staticmethod
     def from_decimal(value):
+        # Floats are converted by their shortest representation, so 12345.6789 has exactly 678900000 nanos
+        value = value if isinstance(value, Decimal) else Decimal(str(value))
         units = int(value)
         nanos = int((value - units) * DecimalValue.NanoFactor)
         return DecimalValue(units, nanos)
 
     def to_decimal(self):
-        return self.units + self.nanos / DecimalValue.NanoFactor
+        return Decimal(self.units) + Decimal(self.nanos).scaleb(-9)
+
+
+def to_decimal_column(decimal_value: Column, precision: int = 18, scale: int = 3) -> Column:
+    """Convert a decoded `DecimalValue` struct column to a decimal column.
+
+    The conversion is a pure Spark expression, so it is evaluated in the JVM for the whole batch.
+    `nanos` is scaled by multiplication with an exact 10^-9 literal to avoid floating point rounding.
+    """
+    units = decimal_value.getField("units").cast(DecimalType(19, 0))
+    nanos = decimal_value.getField("nanos").cast(DecimalType(10, 0)) * F.lit(Decimal("1E-9"))
+    return (units + nanos).cast(DecimalType(precision, scale))
@@ -0,0 +1,90 @@
+import os
+
+# The descriptor set is compiled from `PersistSubmittedTransaction.proto` and committed, so it is packaged in the wheel.
+# Recompile it when the contract changes, which the `compile-proto` action checks:
+# protoc --include_imports --descriptor_set_out=assets/persist_submitted_transaction.binpb PersistSubmittedTransaction.proto
+DESCRIPTOR_FILE_NAME = "persist_submitted_transaction.binpb"
+MESSAGE_NAME = "PersistSubmittedTransaction"
+
+
+def get_descriptor_path() -> str:
+    return os.path.join(os.path.dirname(__file__), "assets", DESCRIPTOR_FILE_NAME)
+
+
+class PersistSubmittedTransaction:
+    """Field names of the `PersistSubmittedTransaction` protobuf message."""
+
+    version = "version"
+    orchestration_instance_id = "orchestration_instance_id"
+    orchestration_type = "orchestration_type"
+    metering_point_id = "metering_point_id"
+    transaction_id = "transaction_id"
+    transaction_creation_datetime = "transaction_creation_datetime"
+    start_datetime = "start_datetime"
+    end_datetime = "end_datetime"
+    metering_point_type = "metering_point_type"
+    product = "product"
+    unit = "unit"
+    resolution = "resolution"
+    points = "points"
+
+    class Point:
+        position = "position"
+        quantity = "quantity"
+        quality = "quality"
+
+
+# Mappings from the protobuf enum names to the values stored in the measurements tables.
+# The `*_UNSPECIFIED` values are intentionally left out, so they are mapped to null.
+ORCHESTRATION_TYPES = {
+    "OT_SUBMITTED_MEASURE_DATA": "submitted_measure_data",
+}
+
+QUALITIES = {
+    "Q_MISSING": "missing",
+    "Q_ESTIMATED": "estimated",
+    "Q_MEASURED": "measured",
+    "Q_CALCULATED": "calculated",
+}
+
+METERING_POINT_TYPES = {
+    "MPT_CONSUMPTION": "consumption",
+    "MPT_PRODUCTION": "production",
+    "MPT_EXCHANGE": "exchange",
+    "MPT_VE_PRODUCTION": "ve_production",
+    "MPT_ANALYSIS": "analysis",
+    "MPT_NOT_USED": "not_used",
+    "MPT_SURPLUS_PRODUCTION_GROUP_6": "surplus_production_group_6",
+    "MPT_NET_PRODUCTION": "net_production",
+    "MPT_SUPPLY_TO_GRID": "supply_to_grid",
+    "MPT_CONSUMPTION_FROM_GRID": "consumption_from_grid",
+    "MPT_WHOLESALE_SERVICES_INFORMATION": "wholesale_services_information",
+    "MPT_OWN_PRODUCTION": "own_production",
+    "MPT_NET_FROM_GRID": "net_from_grid",
+    "MPT_NET_TO_GRID": "net_to_grid",
+    "MPT_TOTAL_CONSUMPTION": "total_consumption",
+    "MPT_NET_LOSS_CORRECTION": "net_loss_correction",
+    "MPT_ELECTRICAL_HEATING": "electrical_heating",
+    "MPT_NET_CONSUMPTION": "net_consumption",
+    "MPT_OTHER_CONSUMPTION": "other_consumption",
+    "MPT_OTHER_PRODUCTION": "other_production",
+    "MPT_EFFECT_PAYMENT": "effect_payment",
+    "MPT_EXCHANGE_REACTIVE_ENERGY": "exchange_reactive_energy",
+    "MPT_COLLECTIVE_NET_PRODUCTION": "collective_net_production",
+    "MPT_COLLECTIVE_NET_CONSUMPTION": "collective_net_consumption",
+}
+
+UNITS = {
+    "U_KWH": "kWh",
+    "U_KW": "kW",
+    "U_MW": "MW",
+    "U_MWH": "MWh",
+    "U_TONNE": "Tonne",
+    "U_KVARH": "kVArh",
+    "U_MVAR": "MVAr",
+}
+
+RESOLUTIONS = {
+    "R_PT15M": "PT15M",
+    "R_PT1H": "PT1H",
+}
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.protobuf.functions import to_protobuf
+
+import opengeh_bronze.infrastructure.contracts.persist_submitted_transaction as contract
+from opengeh_bronze.domain.constants.column_names.bronze_submitted_transactions_column_names import (
+    BronzeSubmittedTransactionsColumnNames,
+)
+from opengeh_bronze.infrastructure.contracts.persist_submitted_transaction import PersistSubmittedTransaction
+
+_SEQUENCE_NUMBER = "id"
+_FIRST_START_DATETIME = datetime(2025, 1, 1)
+
+
+def generate_submitted_transactions(
+    spark: SparkSession,
+    first_sequence_number: int,
+    count: int,
+    partitions: int,
+    topic: str,
+    points_per_transaction: int = 24,
+    descriptor_path: str | None = None,
+) -> DataFrame:
+    """Generate Kafka records with `PersistSubmittedTransaction` payloads.
+
+    The payloads are encoded with `to_protobuf`, so they are generated in the JVM like they are decoded. Each
+    sequence number is a transaction of its own metering point and day with hourly points. The sequence numbers are
+    spread round-robin across the partitions, and the offset of a record is its position in its partition.
+
+    Returns:
+        DataFrame: The records with the schema of the submitted transactions table.
+    """
+    sequence_number = F.col(_SEQUENCE_NUMBER)
+    return spark.range(first_sequence_number, first_sequence_number + count).select(
+        sequence_number.cast("string").cast("binary").alias(BronzeSubmittedTransactionsColumnNames.key),
+        to_protobuf(
+            _transaction(sequence_number, points_per_transaction),
+            contract.MESSAGE_NAME,
+            descFilePath=descriptor_path or contract.get_descriptor_path(),
+        ).alias(BronzeSubmittedTransactionsColumnNames.value),
+        F.lit(topic).alias(BronzeSubmittedTransactionsColumnNames.topic),
+        (sequence_number % partitions).cast("int").alias(BronzeSubmittedTransactionsColumnNames.partition),
+        F.floor(sequence_number / partitions).cast("long").alias(BronzeSubmittedTransactionsColumnNames.offset),
+        F.current_timestamp().alias(BronzeSubmittedTransactionsColumnNames.timestamp),
+        F.lit(0).alias(BronzeSubmittedTransactionsColumnNames.timestampType),
+    )
+
+
+def write_to_files(records: DataFrame, path: str) -> None:
+    """Append the records as Parquet files, which are replayed by `kafka_stream.read_recorded_kafka_stream`."""
+    records.write.mode("append").parquet(path)
+
+
+def write_to_kafka(records: DataFrame, bootstrap_servers: str) -> None:
+    """Produce the records to their topic of a Kafka broker, which assigns their partitions and offsets."""
+    records.select(
+        BronzeSubmittedTransactionsColumnNames.key,
+        BronzeSubmittedTransactionsColumnNames.value,
+        BronzeSubmittedTransactionsColumnNames.topic,
+    ).write.format("kafka").option("kafka.bootstrap.servers", bootstrap_servers).save()
+
+
+def _transaction(sequence_number: Column, points_per_transaction: int) -> Column:
+    start_datetime = F.lit(_FIRST_START_DATETIME) + F.make_dt_interval(days=sequence_number % 365)
+    return F.struct(
+        F.lit("1").alias(PersistSubmittedTransaction.version),
+        F.expr("uuid()").alias(PersistSubmittedTransaction.orchestration_instance_id),
+        F.lit("OT_SUBMITTED_MEASURE_DATA").alias(PersistSubmittedTransaction.orchestration_type),
+        F.format_string("57%016d", sequence_number).alias(PersistSubmittedTransaction.metering_point_id),
+        F.expr("uuid()").alias(PersistSubmittedTransaction.transaction_id),
+        F.current_timestamp().alias(PersistSubmittedTransaction.transaction_creation_datetime),
+        start_datetime.alias(PersistSubmittedTransaction.start_datetime),
+        (start_datetime + F.lit(timedelta(hours=points_per_transaction))).alias(
+            PersistSubmittedTransaction.end_datetime
+        ),
+        F.lit("MPT_CONSUMPTION").alias(PersistSubmittedTransaction.metering_point_type),
+        F.lit("8716867000030").alias(PersistSubmittedTransaction.product),
+        F.lit("U_KWH").alias(PersistSubmittedTransaction.unit),
+        F.lit("R_PT1H").alias(PersistSubmittedTransaction.resolution),
+        F.transform(
+            F.sequence(F.lit(1), F.lit(points_per_transaction)),
+            lambda position: _point(position, sequence_number),
+        ).alias(PersistSubmittedTransaction.points),
+    )
+
+
+def _point(position: Column, sequence_number: Column) -> Column:
+    return F.struct(
+        position.alias(PersistSubmittedTransaction.Point.position),
+        F.struct(
+            ((sequence_number + position) % 100).cast("long").alias("units"),
+            F.lit(500_000_000).alias("nanos"),
+        ).alias(PersistSubmittedTransaction.Point.quantity),
+        F.lit("Q_MEASURED").alias(PersistSubmittedTransaction.Point.quality),
+    )
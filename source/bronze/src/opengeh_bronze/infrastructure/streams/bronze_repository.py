@@ -0,0 +1,21 @@
+from pyspark.sql import DataFrame, SparkSession
+
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.domain.constants.table_names import TableNames
+
+
+class BronzeRepository:
+    def __init__(
+        self,
+        spark: SparkSession,
+    ) -> None:
+        self._spark = spark
+
+    def read_submitted_transactions(self) -> DataFrame:
+        options = {
+            "ignoreDeletes": "true",
+            "skipChangeCommits": "true",
+        }
+
+        source_table_name = f"{DatabaseNames.bronze_database}.{TableNames.bronze_submitted_transactions_table}"
+        return self._spark.readStream.format("delta").options(**options).table(source_table_name)
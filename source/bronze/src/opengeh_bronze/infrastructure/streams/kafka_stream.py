@@ -1,10 +1,23 @@
-from pyspark.sql import SparkSession
+from pyspark.sql import DataFrame, SparkSession
 
-from opengeh_bronze.domain.constants.database_names import DatabaseNames
-from opengeh_bronze.domain.constants.table_names import TableNames
+from opengeh_bronze.domain.schemas.submitted_transactions import submitted_transactions_schema
 
 
-def submit_transactions(spark: SparkSession, kafka_options: dict) -> None:
-    spark.readStream.format("kafka").options(**kafka_options).load().writeTo(
-        f"{DatabaseNames.bronze_database}.{TableNames.bronze_submitted_transactions_table}"
-    )
+def read_kafka_stream(spark: SparkSession, kafka_options: dict) -> DataFrame:
+    """Read the records of a Kafka topic as a stream.
+
+    The records have the columns `key`, `value`, `topic`, `partition`, `offset`, `timestamp` and `timestampType`.
+    """
+    return spark.readStream.format("kafka").options(**kafka_options).load()
+
+
+def read_recorded_kafka_stream(spark: SparkSession, path: str, max_files_per_trigger: int | None = None) -> DataFrame:
+    """Replay recorded Kafka records from Parquet files as a stream.
+
+    The records have the same columns as the records read by `read_kafka_stream`, so they are ingested in the same
+    way. Files added to the directory while the stream runs are read in later micro-batches.
+    """
+    reader = spark.readStream.schema(submitted_transactions_schema)
+    if max_files_per_trigger is not None:
+        reader = reader.option("maxFilesPerTrigger", max_files_per_trigger)
+    return reader.parquet(path)
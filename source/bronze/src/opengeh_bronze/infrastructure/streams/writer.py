@@ -0,0 +1,33 @@
+from typing import Callable
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.streaming import StreamingQuery
+
+
+def start_stream(
+    df_source_stream: DataFrame,
+    query_name: str,
+    checkpoint_path: str,
+    batch_operation: Callable[["DataFrame", int], None],
+    trigger_processing_time: str | None = None,
+) -> StreamingQuery:
+    stream_writer = (
+        df_source_stream.writeStream.format("delta")
+        .queryName(query_name)
+        .option("checkpointLocation", checkpoint_path)
+        .foreachBatch(batch_operation)
+    )
+    if trigger_processing_time is not None:
+        stream_writer = stream_writer.trigger(processingTime=trigger_processing_time)
+    return stream_writer.start()
+
+
+def get_txn_app_id(spark: SparkSession, query_name: str, checkpoint_path: str) -> str:
+    """Get the Delta transaction app id of the micro-batches of a streaming query.
+
+    The batch ids start over when a checkpoint is reset, so the app id includes the id of the query from the metadata
+    of its checkpoint. It is written when the query is started with a new checkpoint, before the first micro-batch,
+    so the micro-batches of a reset checkpoint are not skipped as already committed.
+    """
+    checkpoint_id = spark.read.json(f"{checkpoint_path}/metadata").first()["id"]
+    return f"{query_name}-{checkpoint_id}"
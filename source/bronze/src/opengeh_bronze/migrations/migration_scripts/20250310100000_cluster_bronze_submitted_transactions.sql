@@ -0,0 +1,2 @@
+ALTER TABLE {bronze_database}.{bronze_submitted_transactions_table}
+CLUSTER BY (partition, offset)
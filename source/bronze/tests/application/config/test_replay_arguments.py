@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from opengeh_bronze.application.config.replay_arguments import parse_replay_arguments
+
+
+def test__parse_replay_arguments__with_offset_range__returns_offset_range():
+    # Act
+    actual = parse_replay_arguments(
+        ["--topic", "topic", "--partition", "2", "--offset-from", "10", "--offset-to", "20", "--offsets-per-slice", "5"]
+    )
+
+    # Assert
+    assert actual.partition == 2
+    assert actual.range_column == "offset"
+    assert (actual.range_start, actual.range_end, actual.slice_length) == (10, 20, 5)
+
+
+def test__parse_replay_arguments__with_time_range__returns_utc_time_range():
+    # Act
+    actual = parse_replay_arguments(
+        ["--topic", "topic", "--time-from", "2025-01-01T00:00:00", "--time-to", "2025-01-02T00:00:00Z"]
+    )
+
+    # Assert
+    assert actual.partition is None
+    assert actual.range_column == "timestamp"
+    assert actual.range_start == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert actual.range_end == datetime(2025, 1, 2, tzinfo=timezone.utc)
+    assert actual.slice_length == timedelta(hours=1)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--topic", "topic"],
+        ["--topic", "topic", "--offset-from", "10", "--offset-to", "20"],
+        ["--topic", "topic", "--partition", "0", "--offset-from", "10", "--time-to", "2025-01-01"],
+        ["--topic", "topic", "--partition", "0", "--offset-from", "20", "--offset-to", "10"],
+    ],
+)
+def test__parse_replay_arguments__with_invalid_range__exits(args: list[str]):
+    with pytest.raises(SystemExit):
+        parse_replay_arguments(args)
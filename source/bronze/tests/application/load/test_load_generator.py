@@ -0,0 +1,51 @@
+from opengeh_bronze.application.load.load_generator import LoadGenerator
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test__run__writes_batches_at_target_rate():
+    # Arrange
+    clock = FakeClock()
+    batches = []
+    generator = LoadGenerator(
+        lambda first, count: batches.append((first, count)),
+        records_per_second=100,
+        interval_seconds=0.5,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    # Act
+    actual = generator.run(duration_seconds=2, first_sequence_number=1000)
+
+    # Assert
+    assert actual == 200
+    assert batches == [(1000, 50), (1050, 50), (1100, 50), (1150, 50)]
+    assert clock.now == 2
+
+
+def test__run__when_writing_is_slower_than_interval__writes_next_batch_right_away():
+    # Arrange
+    clock = FakeClock()
+    sleeps = []
+
+    def write_batch(first: int, count: int) -> None:
+        clock.now += 1.5
+
+    generator = LoadGenerator(write_batch, records_per_second=10, clock=clock, sleep=sleeps.append)
+
+    # Act
+    actual = generator.run(duration_seconds=2)
+
+    # Assert
+    assert actual == 20
+    assert sleeps == []
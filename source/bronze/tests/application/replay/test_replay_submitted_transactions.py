@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from opengeh_bronze.application.replay.replay_submitted_transactions import ReplaySlice, get_replay_slices
+
+
+def test__get_replay_slices__splits_offset_range_into_slices():
+    # Act
+    actual = list(get_replay_slices("topic", 3, "offset", 100, 350, 100))
+
+    # Assert
+    assert actual == [
+        ReplaySlice("topic", 3, "offset", 100, 200),
+        ReplaySlice("topic", 3, "offset", 200, 300),
+        ReplaySlice("topic", 3, "offset", 300, 350),
+    ]
+
+
+def test__get_replay_slices__splits_time_range_into_slices():
+    # Act
+    actual = list(
+        get_replay_slices("topic", None, "timestamp", datetime(2025, 1, 1), datetime(2025, 1, 1, 2), timedelta(hours=1))
+    )
+
+    # Assert
+    assert [(replay_slice.start, replay_slice.end) for replay_slice in actual] == [
+        (datetime(2025, 1, 1), datetime(2025, 1, 1, 1)),
+        (datetime(2025, 1, 1, 1), datetime(2025, 1, 1, 2)),
+    ]
+
+
+def test__get_replay_slices__when_offset_range_has_no_partition__raises():
+    with pytest.raises(ValueError, match="within a partition"):
+        list(get_replay_slices("topic", None, "offset", 0, 10, 5))
+
+
+def test__get_replay_slices__when_range_column_is_not_supported__raises():
+    with pytest.raises(ValueError, match="must be one of"):
+        list(get_replay_slices("topic", 0, "key", 0, 10, 5))
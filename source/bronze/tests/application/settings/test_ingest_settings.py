@@ -0,0 +1,34 @@
+from opengeh_bronze.application.settings.ingest_settings import IngestSettings, SubmittedTransactionsSource
+
+
+def test__create_rate_limit_options__when_rate_limits_are_set__should_include_them(monkeypatch):
+    monkeypatch.setenv("MAX_OFFSETS_PER_TRIGGER", "100000")
+    monkeypatch.setenv("MIN_PARTITIONS", "64")
+
+    actual = IngestSettings().create_rate_limit_options()
+
+    assert actual == {"maxOffsetsPerTrigger": "100000", "minPartitions": "64"}
+
+
+def test__create_rate_limit_options__when_rate_limits_are_not_set__should_be_empty(monkeypatch):
+    monkeypatch.delenv("MAX_OFFSETS_PER_TRIGGER", raising=False)
+    monkeypatch.delenv("MIN_PARTITIONS", raising=False)
+
+    actual = IngestSettings().create_rate_limit_options()
+
+    assert actual == {}
+
+
+def test__create_local_kafka_options__should_read_topic_of_local_broker_with_rate_limits(monkeypatch):
+    monkeypatch.setenv("SUBMITTED_TRANSACTIONS_SOURCE", "local_kafka")
+    monkeypatch.setenv("LOCAL_KAFKA_BOOTSTRAP_SERVERS", "localhost:19092")
+    monkeypatch.setenv("MAX_OFFSETS_PER_TRIGGER", "100000")
+
+    settings = IngestSettings()
+    actual = settings.create_local_kafka_options()
+
+    assert settings.submitted_transactions_source == SubmittedTransactionsSource.LOCAL_KAFKA
+    assert actual["kafka.bootstrap.servers"] == "localhost:19092"
+    assert actual["subscribe"] == "submitted-transactions"
+    assert actual["maxOffsetsPerTrigger"] == "100000"
+    assert "kafka.sasl.mechanism" not in actual
@@ -0,0 +1,118 @@
+from unittest import mock
+
+import pytest
+
+from opengeh_bronze.application.streams.stream_supervisor import StreamSupervisor, SupervisedStream
+
+
+def _query(is_active: bool = False, exception: Exception | None = None, input_rows: tuple[int, ...] = ()) -> mock.Mock:
+    query = mock.Mock()
+    query.isActive = is_active
+    query.exception.return_value = exception
+    query.recentProgress = [{"numInputRows": rows} for rows in input_rows]
+    return query
+
+
+def _supervisor(
+    *queries: mock.Mock, sleeps: list[float], max_restarts: int = 5, clock: mock.Mock | None = None
+) -> StreamSupervisor:
+    stream = SupervisedStream(name="stream", start=mock.Mock(side_effect=queries), scheduler_pool="pool")
+    return StreamSupervisor(
+        mock.Mock(),
+        [stream],
+        max_restarts=max_restarts,
+        min_healthy_seconds=600,
+        sleep=sleeps.append,
+        clock=clock or mock.Mock(return_value=0),
+    )
+
+
+def test__run__when_query_fails__restarts_query_after_backoff():
+    # Arrange
+    sleeps = []
+    supervisor = _supervisor(_query(exception=Exception("failed")), _query(), sleeps=sleeps)
+
+    # Act
+    supervisor.run()
+
+    # Assert
+    assert sleeps == [10]
+
+
+def test__run__when_query_keeps_failing__doubles_backoff_until_max_restarts():
+    # Arrange
+    sleeps = []
+    supervisor = _supervisor(*[_query(exception=Exception("failed")) for _ in range(3)], sleeps=sleeps, max_restarts=2)
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="failed 3 times in a row"):
+        supervisor.run()
+    assert sleeps == [10, 20]
+
+
+def test__run__when_failed_query_had_processed_rows__resets_backoff():
+    # Arrange
+    sleeps = []
+    supervisor = _supervisor(
+        _query(exception=Exception("failed")),
+        _query(exception=Exception("failed"), input_rows=(0, 5)),
+        _query(),
+        sleeps=sleeps,
+    )
+
+    # Act
+    supervisor.run()
+
+    # Assert
+    assert sleeps == [10, 10]
+
+
+def test__run__when_failed_query_only_had_idle_progress__does_not_reset_backoff():
+    # Arrange
+    sleeps = []
+    supervisor = _supervisor(
+        _query(exception=Exception("failed"), input_rows=(0,)),
+        _query(exception=Exception("failed"), input_rows=(0, 0)),
+        _query(),
+        sleeps=sleeps,
+    )
+
+    # Act
+    supervisor.run()
+
+    # Assert
+    assert sleeps == [10, 20]
+
+
+def test__run__when_failed_query_had_run_for_min_healthy_seconds__resets_backoff():
+    # Arrange
+    sleeps = []
+    # The clock is read when a query starts and when it fails
+    clock = mock.Mock(side_effect=[0, 1, 1, 601, 601])
+    supervisor = _supervisor(
+        _query(exception=Exception("failed")),
+        _query(exception=Exception("failed")),
+        _query(),
+        sleeps=sleeps,
+        clock=clock,
+    )
+
+    # Act
+    supervisor.run()
+
+    # Assert
+    assert sleeps == [10, 10]
+
+
+def test__run__when_interrupted__stops_active_queries():
+    # Arrange
+    query = _query(is_active=True)
+    supervisor = _supervisor(query, sleeps=[])
+    supervisor._spark.streams.awaitAnyTermination.side_effect = SystemExit(0)
+
+    # Act
+    with pytest.raises(SystemExit):
+        supervisor.run()
+
+    # Assert
+    query.stop.assert_called_once()
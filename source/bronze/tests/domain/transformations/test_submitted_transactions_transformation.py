@@ -0,0 +1,130 @@
+from datetime import datetime
+from decimal import Decimal
+
+import testcommon.dataframes.assert_schemas as assert_schemas
+from pyspark.sql import SparkSession
+from pyspark.sql.types import (
+    ArrayType,
+    BinaryType,
+    IntegerType,
+    LongType,
+    StringType,
+    StructField,
+    StructType,
+    TimestampType,
+)
+
+from opengeh_bronze.domain.schemas.bronze_measurements import bronze_measurements_schema
+from opengeh_bronze.domain.transformations.submitted_transactions_transformation import map_to_bronze_measurements
+
+decoded_schema = StructType(
+    [
+        StructField(
+            "decoded",
+            StructType(
+                [
+                    StructField("version", StringType(), True),
+                    StructField("orchestration_instance_id", StringType(), True),
+                    StructField("orchestration_type", StringType(), True),
+                    StructField("metering_point_id", StringType(), True),
+                    StructField("transaction_id", StringType(), True),
+                    StructField("transaction_creation_datetime", TimestampType(), True),
+                    StructField("start_datetime", TimestampType(), True),
+                    StructField("end_datetime", TimestampType(), True),
+                    StructField("metering_point_type", StringType(), True),
+                    StructField("product", StringType(), True),
+                    StructField("unit", StringType(), True),
+                    StructField("resolution", StringType(), True),
+                    StructField(
+                        "points",
+                        ArrayType(
+                            StructType(
+                                [
+                                    StructField("position", IntegerType(), True),
+                                    StructField(
+                                        "quantity",
+                                        StructType(
+                                            [
+                                                StructField("units", LongType(), True),
+                                                StructField("nanos", IntegerType(), True),
+                                            ]
+                                        ),
+                                        True,
+                                    ),
+                                    StructField("quality", StringType(), True),
+                                ]
+                            )
+                        ),
+                        True,
+                    ),
+                ]
+            ),
+            True,
+        ),
+        StructField("value", BinaryType(), True),
+    ]
+)
+
+
+def _decoded_row(points: list) -> tuple:
+    return (
+        (
+            "1",
+            "60a518a2-7c7e-4aec-8332",
+            "OT_SUBMITTED_MEASURE_DATA",
+            "503928175928475638",
+            "5a76d246-ceae-459f-9e9f",
+            datetime(2025, 1, 1, 12, 0, 0),
+            datetime(2024, 12, 31, 23, 0, 0),
+            datetime(2025, 1, 1, 23, 0, 0),
+            "MPT_CONSUMPTION",
+            "8716867000030",
+            "U_KWH",
+            "R_PT1H",
+            points,
+        ),
+        bytearray(b"payload"),
+    )
+
+
+def test__map_to_bronze_measurements__should_match_bronze_measurements_schema(spark: SparkSession):
+    # Arrange
+    decoded = spark.createDataFrame([_decoded_row([(1, (1, 0), "Q_MEASURED")])], schema=decoded_schema)
+
+    # Act
+    actual = map_to_bronze_measurements(decoded)
+
+    # Assert
+    assert_schemas.assert_schema(actual=actual.schema, expected=bronze_measurements_schema, ignore_nullability=True)
+
+
+def test__map_to_bronze_measurements__should_map_enums_and_decimal_values(spark: SparkSession):
+    # Arrange
+    points = [(1, (12345, 678900000), "Q_MEASURED"), (2, (-1, -500000000), "Q_UNSPECIFIED")]
+    decoded = spark.createDataFrame([_decoded_row(points)], schema=decoded_schema)
+
+    # Act
+    actual = map_to_bronze_measurements(decoded).collect()[0]
+
+    # Assert
+    assert actual.orchestration_type == "submitted_measure_data"
+    assert actual.metering_point_type == "consumption"
+    assert actual.unit == "kWh"
+    assert actual.resolution == "PT1H"
+    assert actual._rescued_data is None
+    assert actual.points[0].quantity == Decimal("12345.679")
+    assert actual.points[0].quality == "measured"
+    assert actual.points[1].quantity == Decimal("-1.500")
+    assert actual.points[1].quality is None
+
+
+def test__map_to_bronze_measurements__when_payload_cannot_be_decoded__should_rescue_value(spark: SparkSession):
+    # Arrange
+    decoded = spark.createDataFrame([(None, bytearray(b"payload"))], schema=decoded_schema)
+
+    # Act
+    actual = map_to_bronze_measurements(decoded).collect()[0]
+
+    # Assert
+    assert actual.metering_point_id is None
+    assert actual._rescued_data == "cGF5bG9hZA=="
@@ -1,4 +1,6 @@
-from measurements.contracts.decimal_value import DecimalValue
+from decimal import Decimal
+
+from opengeh_bronze.infrastructure.contracts.decimal_value import DecimalValue
 
 
 def test__from_decimal() -> None:
@@ -21,7 +23,7 @@ def test__to_decimal() -> None:
     result = value.to_decimal()
 
     # Assert
-    assert result == 12345.6789
+    assert result == Decimal("12345.6789")
 
 
 def test__negative_value() -> None:
@@ -34,3 +36,14 @@ def test__negative_value() -> None:
     # Assert
     assert result.units == -12345
     assert result.nanos == -678900000
+
+
+def test__to_decimal__is_exact_for_large_values() -> None:
+    # Arrange
+    value = DecimalValue(999999999999999, 999000000)
+
+    # Act
+    result = value.to_decimal()
+
+    # Assert
+    assert result == Decimal("999999999999999.999")
@@ -0,0 +1,20 @@
+import os
+
+import opengeh_bronze.infrastructure.contracts.persist_submitted_transaction as contract
+
+
+def test__get_descriptor_path__descriptor_set_exists() -> None:
+    # Act
+    path = contract.get_descriptor_path()
+
+    # Assert
+    assert os.path.isfile(path), f"The descriptor set {path} is missing, compile it with protoc"
+
+
+def test__get_descriptor_path__descriptor_set_contains_message() -> None:
+    # Act
+    with open(contract.get_descriptor_path(), "rb") as descriptor_set:
+        content = descriptor_set.read()
+
+    # Assert
+    assert contract.MESSAGE_NAME.encode() in content
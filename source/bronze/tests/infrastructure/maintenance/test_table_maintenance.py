@@ -0,0 +1,42 @@
+from pyspark.sql import SparkSession
+
+from opengeh_bronze.domain.constants.database_names import DatabaseNames
+from opengeh_bronze.infrastructure.maintenance.table_maintenance import TableMaintenanceSettings, maintain_table
+
+
+def _create_table_with_files(spark: SparkSession, table_name: str, num_files: int) -> None:
+    spark.sql(f"DROP TABLE IF EXISTS {table_name}")
+    spark.sql(f"CREATE TABLE {table_name} (metering_point_id STRING, quantity INT) USING DELTA")
+    for quantity in range(num_files):
+        spark.createDataFrame([("1", quantity)], "metering_point_id STRING, quantity INT").coalesce(1).write.format(
+            "delta"
+        ).mode("append").saveAsTable(table_name)
+
+
+def test__maintain_table__when_num_files_reaches_threshold__compacts_files(spark: SparkSession) -> None:
+    # Arrange
+    table_name = f"{DatabaseNames.bronze_database}.maintenance_compacted"
+    _create_table_with_files(spark, table_name, num_files=3)
+    settings = TableMaintenanceSettings(table_name=table_name, min_num_files_to_optimize=3)
+
+    # Act
+    before, after = maintain_table(spark, settings)
+
+    # Assert
+    assert before.num_files == 3
+    assert after.num_files == 1
+    assert spark.table(table_name).count() == 3
+
+
+def test__maintain_table__when_num_files_is_below_threshold__does_not_compact_files(spark: SparkSession) -> None:
+    # Arrange
+    table_name = f"{DatabaseNames.bronze_database}.maintenance_not_compacted"
+    _create_table_with_files(spark, table_name, num_files=2)
+    settings = TableMaintenanceSettings(table_name=table_name, min_num_files_to_optimize=3)
+
+    # Act
+    before, after = maintain_table(spark, settings)
+
+    # Assert
+    assert before.num_files == 2
+    assert after.num_files == 2
@@ -0,0 +1,92 @@
+import functools
+import sys
+
+import telemetry_logging.logging_configuration as config
+from opentelemetry.trace import SpanKind
+from pyspark.sql import SparkSession
+from pyspark.sql.streaming import StreamingQuery
+from pyspark.sql.streaming.state import GroupStateTimeout
+from telemetry_logging.span_recording import span_record_exception
+
+import opengeh_capacity_settlement.infrastructure.capacity_settlement_internal as csi
+import opengeh_capacity_settlement.infrastructure.measurements_gold as mg
+from opengeh_capacity_settlement.application.job_args.environment_variables import (
+    get_catalog_name,
+    get_checkpoint_location,
+    get_time_zone,
+)
+from opengeh_capacity_settlement.domain.calculation import ColumNames
+from opengeh_capacity_settlement.domain.largest_hourly_quantities import (
+    largest_hourly_quantities_state,
+    to_hourly_quantity_changes,
+    update_largest_hourly_quantities,
+)
+from opengeh_capacity_settlement.infrastructure.capacity_settlement_internal.schemas.largest_hourly_quantities_v1 import (
+    largest_hourly_quantities_v1,
+)
+from opengeh_capacity_settlement.infrastructure.spark_initializor import initialize_spark
+
+
+def execute_largest_hourly_quantities_stream(
+    *,
+    cloud_role_name: str = "dbr-capacity-settlement",
+    applicationinsights_connection_string: str | None = None,
+) -> None:
+    """Run the largest hourly quantities stream until it terminates."""
+    config.configure_logging(
+        cloud_role_name=cloud_role_name,
+        tracer_name="capacity-settlement-stream",
+        applicationinsights_connection_string=applicationinsights_connection_string,
+        extras={"Subsystem": "measurements"},
+    )
+
+    with config.get_tracer().start_as_current_span(__name__, kind=SpanKind.SERVER) as span:
+        try:
+            spark = initialize_spark()
+            query = start_largest_hourly_quantities_stream(
+                spark,
+                catalog_name=get_catalog_name(),
+                checkpoint_location=get_checkpoint_location(),
+                time_zone=get_time_zone(),
+            )
+            query.awaitTermination()
+
+        except Exception as e:
+            span_record_exception(e, span)
+            sys.exit(4)
+
+
+def start_largest_hourly_quantities_stream(
+    spark: SparkSession,
+    catalog_name: str,
+    checkpoint_location: str,
+    time_zone: str,
+) -> StreamingQuery:
+    """Start the stream that maintains the largest hourly quantities of the consumption metering points.
+
+    The hourly sums of the latest months are kept in the state of the stream, so each micro-batch only reads the
+    changed gold measurements. The monthly calculation then reads the ten largest hours of each month per metering point
+    instead of a year of measurements.
+    """
+    measurements_gold_repository = mg.Repository(spark, catalog_name)
+    capacity_settlement_internal_repository = csi.Repository(spark, catalog_name)
+    capacity_settlement_internal_repository.create_largest_hourly_quantities_if_not_exists()
+
+    largest_hourly_quantities = (
+        to_hourly_quantity_changes(measurements_gold_repository.read_consumption_changes_stream())
+        .groupBy(ColumNames.metering_point_id)
+        .applyInPandasWithState(
+            functools.partial(update_largest_hourly_quantities, time_zone=time_zone),
+            outputStructType=largest_hourly_quantities_v1,
+            stateStructType=largest_hourly_quantities_state,
+            outputMode="update",
+            timeoutConf=GroupStateTimeout.ProcessingTimeTimeout,
+        )
+    )
+
+    return (
+        largest_hourly_quantities.writeStream.outputMode("update")
+        .option("checkpointLocation", checkpoint_location)
+        .foreachBatch(capacity_settlement_internal_repository.merge_largest_hourly_quantities)
+        .start()
+    )
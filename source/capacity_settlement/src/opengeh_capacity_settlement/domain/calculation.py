@@ -123,6 +123,8 @@ def _average_ten_largest_quantities_in_selection_periods(
         ColumNames.child_metering_point_id,
     ]
 
+    # Spark plans the filter on the row number as a partial `WindowGroupLimit` below the shuffle, so only the ten
+    # largest quantities of each group and partition are shuffled and sorted.
     window_spec = Window.partitionBy(grouping).orderBy(F.col(ColumNames.quantity).desc())
 
     time_series_points = time_series_points.withColumn("row_number", F.row_number().over(window_spec)).filter(
@@ -0,0 +1,174 @@
+from collections.abc import Iterator
+from datetime import timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pyspark.sql.types as t
+from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql.streaming.state import GroupState
+
+from opengeh_capacity_settlement.domain.calculation import ColumNames
+
+# The ten largest hourly quantities of a selection period are always among the ten largest of each of its months,
+# because the selection periods consist of whole months.
+LARGEST_HOURS_PER_MONTH = 10
+
+# The selection period is the twelve months up to the end of the calculation month. One more month is kept, so the
+# previous month can still be calculated while the points of the current month arrive.
+MONTHS_IN_STATE = 13
+
+# A metering point without changes for longer than the kept months has no hours left that can be corrected, so its
+# state is removed.
+STATE_TIMEOUT = timedelta(days=31 * MONTHS_IN_STATE)
+
+# The change types of the change data feed that remove a point, so its quantity is subtracted from its hour
+REMOVING_CHANGE_TYPES = ["update_preimage", "delete"]
+
+_SECONDS_PER_HOUR = 3600
+
+# The quantities have three decimals, so they are summed as whole thousandths
+_QUANTITY_DECIMALS = 3
+
+# Ephemeral columns of the hourly quantity changes
+_HOUR = "hour"
+_POINT_COUNT = "point_count"
+
+nullable = True
+
+# The sum and the number of points with a quantity of every hour of the kept months, and the largest hours of each
+# month, in the state of a metering point. Hours are seconds since the epoch, so they do not depend on the time zone
+# of the Python workers, and the sums are in thousandths.
+largest_hourly_quantities_state = t.StructType(
+    [
+        t.StructField("hours", t.ArrayType(t.LongType(), containsNull=False), not nullable),
+        t.StructField("quantities", t.ArrayType(t.LongType(), containsNull=False), not nullable),
+        t.StructField("point_counts", t.ArrayType(t.IntegerType(), containsNull=False), not nullable),
+        t.StructField("largest_hours", t.ArrayType(t.LongType(), containsNull=False), not nullable),
+    ]
+)
+
+
+def to_hourly_quantity_changes(time_series_point_changes: DataFrame) -> DataFrame:
+    """Map the changes of the time series points to the changes of the sums of their hours.
+
+    The added and removed points of the change data feed become positive and negative quantities in thousandths, so
+    the sum of an hour can be updated without the other points of the hour. The preimage of an updated point is
+    removed and its postimage added.
+    """
+    sign = F.when(F.col("_change_type").isin(REMOVING_CHANGE_TYPES), F.lit(-1)).otherwise(F.lit(1))
+    observation_seconds = F.unix_seconds(F.col(ColumNames.observation_time))
+    quantity = F.col(ColumNames.quantity)
+    return time_series_point_changes.select(
+        F.col(ColumNames.metering_point_id),
+        (observation_seconds - observation_seconds % _SECONDS_PER_HOUR).alias(_HOUR),
+        (sign * F.coalesce((quantity * 10**_QUANTITY_DECIMALS).cast(t.LongType()), F.lit(0))).alias(
+            ColumNames.quantity
+        ),
+        (sign * quantity.isNotNull().cast(t.IntegerType())).alias(_POINT_COUNT),
+    )
+
+
+def update_largest_hourly_quantities(
+    key: tuple[str],
+    hourly_quantity_changes: Iterator[pd.DataFrame],
+    state: GroupState,
+    time_zone: str,
+) -> Iterator[pd.DataFrame]:
+    """Update the largest hourly quantities of a metering point with a micro-batch of its hourly quantity changes.
+
+    Used with `applyInPandasWithState` grouped by metering point id on the output of `to_hourly_quantity_changes`.
+    The state keeps the sum of every hour of the latest `MONTHS_IN_STATE` months, so a correction of some points of
+    an hour only adds the difference to the sum, and the next largest hours are known when the largest are lowered.
+    Hours without points with a quantity are left out, like in the sums of the gold measurements.
+
+    Yields:
+        The hours among the `LARGEST_HOURS_PER_MONTH` largest of their month whose quantity has changed. Hours that
+        are no longer among the largest are yielded with a null quantity.
+    """
+    if state.hasTimedOut:
+        state.remove()
+        return
+
+    (metering_point_id,) = key
+
+    hours, largest_hours_in_state = _read_state(state)
+    previous_largest_hours = hours[ColumNames.quantity].reindex(largest_hours_in_state).to_dict()
+
+    for batch in hourly_quantity_changes:
+        hours = pd.concat([hours, batch.set_index(_HOUR)[[ColumNames.quantity, _POINT_COUNT]]])
+    hours = hours.groupby(level=0).sum()
+    hours = _keep_latest_months(hours[hours[_POINT_COUNT] > 0], time_zone)
+
+    largest_hours = _largest_hours(hours[ColumNames.quantity], time_zone)
+    _write_state(state, hours, largest_hours)
+
+    changed_hours = [
+        (hour, quantity) for hour, quantity in largest_hours.items() if previous_largest_hours.get(hour) != quantity
+    ]
+    removed_hours = [(hour, None) for hour in previous_largest_hours if hour not in largest_hours]
+    changes = changed_hours + removed_hours
+    yield pd.DataFrame(
+        {
+            ColumNames.metering_point_id: [metering_point_id] * len(changes),
+            ColumNames.observation_time: pd.to_datetime([hour for hour, _ in changes], unit="s"),
+            ColumNames.quantity: [
+                None if quantity is None else Decimal(quantity).scaleb(-_QUANTITY_DECIMALS) for _, quantity in changes
+            ],
+        }
+    )
+
+
+def _read_state(state: GroupState) -> tuple[pd.DataFrame, pd.Index]:
+    hours, quantities, point_counts, largest_hours = state.get if state.exists else ([], [], [], [])
+    return (
+        pd.DataFrame(
+            {
+                ColumNames.quantity: np.array(quantities, dtype="int64"),
+                _POINT_COUNT: np.array(point_counts, dtype="int32"),
+            },
+            index=pd.Index(np.array(hours, dtype="int64")),
+        ),
+        pd.Index(np.array(largest_hours, dtype="int64")),
+    )
+
+
+def _write_state(state: GroupState, hours: pd.DataFrame, largest_hours: dict[int, int]) -> None:
+    state.update(
+        (
+            hours.index.tolist(),
+            hours[ColumNames.quantity].tolist(),
+            hours[_POINT_COUNT].tolist(),
+            list(largest_hours),
+        )
+    )
+    state.setTimeoutDuration(int(STATE_TIMEOUT.total_seconds() * 1000))
+
+
+def _month_numbers(hours: pd.Index, time_zone: str) -> pd.Index:
+    months = pd.to_datetime(hours, unit="s", utc=True).tz_convert(time_zone)
+    return pd.Index(months.year * 12 + months.month)
+
+
+def _keep_latest_months(hours: pd.DataFrame, time_zone: str) -> pd.DataFrame:
+    if hours.empty:
+        return hours
+    month_numbers = _month_numbers(hours.index, time_zone)
+    return hours[month_numbers > month_numbers.max() - MONTHS_IN_STATE]
+
+
+def _largest_hours(quantities: pd.Series, time_zone: str) -> dict[int, int]:
+    if quantities.empty:
+        return {}
+
+    largest = (
+        pd.DataFrame(
+            {"month": _month_numbers(quantities.index, time_zone).to_numpy(), "quantity": quantities.to_numpy()},
+            index=quantities.index,
+        )
+        .sort_values("quantity", ascending=False, kind="stable")
+        .groupby("month")
+        .head(LARGEST_HOURS_PER_MONTH)
+    )
+    return dict(zip(largest.index.tolist(), largest["quantity"].tolist()))
@@ -3,6 +3,9 @@
 import os
 
 from opengeh_capacity_settlement.application.execute_with_deps import execute_with_deps
+from opengeh_capacity_settlement.application.largest_hourly_quantities_stream import (
+    execute_largest_hourly_quantities_stream,
+)
 
 
 def execute() -> None:
@@ -11,3 +14,11 @@ def execute() -> None:
     execute_with_deps(
         applicationinsights_connection_string=applicationinsights_connection_string,
     )
+
+
+def stream_largest_hourly_quantities() -> None:
+    applicationinsights_connection_string = os.getenv("APPLICATIONINSIGHTS_CONNECTION_STRING")
+
+    execute_largest_hourly_quantities_stream(
+        applicationinsights_connection_string=applicationinsights_connection_string,
+    )
@@ -0,0 +1,3 @@
+class CapacitySettlementInternalDatabase:
+    DATABASE_NAME = "measurements_calculated_internal"
+    LARGEST_HOURLY_QUANTITIES_NAME = "capacity_settlement_largest_hourly_quantities"
@@ -0,0 +1,57 @@
+from delta.tables import DeltaTable
+from pyspark.sql import DataFrame, SparkSession
+
+from opengeh_capacity_settlement.infrastructure.capacity_settlement_internal.database_definitions import (
+    CapacitySettlementInternalDatabase,
+)
+from opengeh_capacity_settlement.infrastructure.capacity_settlement_internal.schemas.largest_hourly_quantities_v1 import (
+    largest_hourly_quantities_v1,
+)
+
+
+class Repository:
+    def __init__(
+        self,
+        spark: SparkSession,
+        catalog_name: str,
+    ) -> None:
+        self._spark = spark
+        self._largest_hourly_quantities_name = (
+            f"{catalog_name}.{CapacitySettlementInternalDatabase.DATABASE_NAME}."
+            f"{CapacitySettlementInternalDatabase.LARGEST_HOURLY_QUANTITIES_NAME}"
+        )
+
+    def read_largest_hourly_quantities(self) -> DataFrame:
+        return self._spark.read.table(self._largest_hourly_quantities_name)
+
+    def create_largest_hourly_quantities_if_not_exists(self) -> None:
+        DeltaTable.createIfNotExists(self._spark).tableName(self._largest_hourly_quantities_name).addColumns(
+            largest_hourly_quantities_v1
+        ).execute()
+
+    def merge_largest_hourly_quantities(self, changes: DataFrame, batch_id: int) -> None:
+        """Merge the changed hours of a micro-batch into the largest hourly quantities.
+
+        Hours with a null quantity are no longer among the largest hours and are deleted. The merge only depends
+        on the content of the micro-batch, so a retried micro-batch gives the same result.
+        """
+        target = DeltaTable.forName(self._spark, self._largest_hourly_quantities_name)
+        (
+            target.alias("target")
+            .merge(
+                changes.alias("source"),
+                "target.metering_point_id = source.metering_point_id "
+                "AND target.observation_time = source.observation_time",
+            )
+            .whenMatchedDelete(condition="source.quantity IS NULL")
+            .whenMatchedUpdate(set={"quantity": "source.quantity"})
+            .whenNotMatchedInsert(
+                condition="source.quantity IS NOT NULL",
+                values={
+                    "metering_point_id": "source.metering_point_id",
+                    "observation_time": "source.observation_time",
+                    "quantity": "source.quantity",
+                },
+            )
+            .execute()
+        )
@@ -0,0 +1,21 @@
+import pyspark.sql.types as t
+
+nullable = True
+
+
+# The largest hourly quantities of each month of the consumption metering points.
+# Maintained by the largest hourly quantities stream.
+largest_hourly_quantities_v1 = t.StructType(
+    [
+        #
+        # GSRN number
+        t.StructField("metering_point_id", t.StringType(), not nullable),
+        #
+        # The start of the hour
+        # UTC time
+        t.StructField("observation_time", t.TimestampType(), not nullable),
+        #
+        # The sum of the quantities of the hour
+        t.StructField("quantity", t.DecimalType(18, 3), nullable),
+    ]
+)
@@ -0,0 +1,3 @@
+class MeasurementsGoldDatabase:
+    DATABASE_NAME = "measurements_gold"
+    MEASUREMENTS_NAME = "measurements"
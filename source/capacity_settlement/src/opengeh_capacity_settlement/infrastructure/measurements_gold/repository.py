@@ -0,0 +1,36 @@
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+
+from opengeh_capacity_settlement.infrastructure.measurements_gold.database_definitions import (
+    MeasurementsGoldDatabase,
+)
+
+
+class Repository:
+    def __init__(
+        self,
+        spark: SparkSession,
+        catalog_name: str,
+    ) -> None:
+        self._spark = spark
+        self._catalog_name = catalog_name
+
+    def read_consumption_changes_stream(self) -> DataFrame:
+        """Stream the changes of the consumption time series points of the gold measurements.
+
+        The gold measurements are merged, so the changes are read from the change data feed of the table. Both the
+        preimage and the postimage of an updated point are included, and the `_change_type` column tells them apart.
+        """
+        database_name = f"{self._catalog_name}.{MeasurementsGoldDatabase.DATABASE_NAME}"
+        return (
+            self._spark.readStream.format("delta")
+            .option("readChangeFeed", "true")
+            .table(f"{database_name}.{MeasurementsGoldDatabase.MEASUREMENTS_NAME}")
+            .where(F.col("metering_point_type") == "consumption")
+            .select(
+                F.col("metering_point_id"),
+                F.col("observation_time"),
+                F.col("quantity"),
+                F.col("_change_type"),
+            )
+        )
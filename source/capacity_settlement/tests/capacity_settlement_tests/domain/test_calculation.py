@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from pyspark.sql import DataFrame, SparkSession
+
+from opengeh_capacity_settlement.domain.calculation import (
+    ColumNames,
+    _average_ten_largest_quantities_in_selection_periods,
+    execute_core_logic,
+)
+from opengeh_capacity_settlement.domain.largest_hourly_quantities import (
+    to_hourly_quantity_changes,
+    update_largest_hourly_quantities,
+)
+
+METERING_POINT_ID = "170000000000000201"
+CHILD_METERING_POINT_ID = "150000000000000201"
+SELECTION_PERIOD_START = datetime(2024, 1, 1)
+SELECTION_PERIOD_END = datetime(2025, 1, 1)
+
+
+def _time_series_points(spark: SparkSession, quantities: list[int]) -> DataFrame:
+    return spark.createDataFrame(
+        [
+            (METERING_POINT_ID, SELECTION_PERIOD_START + timedelta(hours=hour), Decimal(quantity))
+            for hour, quantity in enumerate(quantities)
+        ],
+        schema=f"{ColumNames.metering_point_id} string, {ColumNames.observation_time} timestamp, "
+        f"{ColumNames.quantity} decimal(18, 3)",
+    )
+
+
+def _metering_point_periods(spark: SparkSession) -> DataFrame:
+    return spark.createDataFrame(
+        [(METERING_POINT_ID, CHILD_METERING_POINT_ID, SELECTION_PERIOD_START, SELECTION_PERIOD_END)],
+        schema=f"{ColumNames.metering_point_id} string, {ColumNames.child_metering_point_id} string, "
+        f"{ColumNames.selection_period_start} timestamp, {ColumNames.selection_period_end} timestamp",
+    )
+
+
+def test__average_ten_largest_quantities__returns_average_of_ten_largest_quantities(spark: SparkSession) -> None:
+    # Arrange
+    time_series_points = _time_series_points(spark, list(range(1, 21)))
+
+    # Act
+    actual = _average_ten_largest_quantities_in_selection_periods(
+        time_series_points, _metering_point_periods(spark)
+    ).collect()
+
+    # Assert
+    assert len(actual) == 1
+    assert actual[0][ColumNames.quantity] == Decimal("15.5")
+
+
+def test__average_ten_largest_quantities__limits_each_group_before_the_shuffle(spark: SparkSession) -> None:
+    # Arrange
+    time_series_points = _time_series_points(spark, list(range(1, 21)))
+
+    # Act
+    actual = _average_ten_largest_quantities_in_selection_periods(time_series_points, _metering_point_periods(spark))
+
+    # Assert
+    plan = actual._jdf.queryExecution().executedPlan().toString()
+    window_group_limits = [line for line in plan.splitlines() if "WindowGroupLimit" in line]
+    assert any(line.rstrip().endswith("Partial") for line in window_group_limits)
+
+
+class _State:
+    def __init__(self) -> None:
+        self.exists = False
+        self.get: tuple[Any, ...] = ()
+        self.hasTimedOut = False
+
+    def update(self, value: tuple[Any, ...]) -> None:
+        self.exists = True
+        self.get = value
+
+    def setTimeoutDuration(self, durationMs: int) -> None:
+        pass
+
+
+def test__execute_core_logic__largest_hourly_quantities__returns_same_measurements_as_all_points(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    time_zone = "Europe/Copenhagen"
+    first_quarter = datetime(2024, 12, 1, 23)
+    submissions = [
+        [(first_quarter + timedelta(minutes=15 * quarter), Decimal(quarter % 97)) for quarter in range(96 * 31)],
+        # Corrections of single quarters, both of hours among the largest and of hours that are not
+        [
+            (first_quarter + timedelta(minutes=15 * quarter), Decimal(200 - quarter % 50))
+            for quarter in range(0, 400, 7)
+        ],
+        [(first_quarter + timedelta(minutes=15 * quarter), Decimal(0)) for quarter in range(90, 2900, 97)],
+    ]
+    gold_points: dict[datetime, Decimal] = {}
+    largest_hours: dict[datetime, Decimal] = {}
+    state = _State()
+    schema = (
+        f"{ColumNames.metering_point_id} string, {ColumNames.observation_time} timestamp, "
+        f"{ColumNames.quantity} decimal(18, 3)"
+    )
+    for submission in submissions:
+        change_data_feed = []
+        for observation_time, quantity in submission:
+            if observation_time in gold_points:
+                change_data_feed.append((observation_time, gold_points[observation_time], "update_preimage"))
+                change_data_feed.append((observation_time, quantity, "update_postimage"))
+            else:
+                change_data_feed.append((observation_time, quantity, "insert"))
+            gold_points[observation_time] = quantity
+        batch = to_hourly_quantity_changes(
+            spark.createDataFrame(
+                [(METERING_POINT_ID, *change) for change in change_data_feed], schema=f"{schema}, _change_type string"
+            )
+        ).toPandas()
+        (changes,) = update_largest_hourly_quantities((METERING_POINT_ID,), iter([batch]), state, time_zone)
+        for hour, quantity in zip(
+            changes[ColumNames.observation_time].dt.to_pydatetime(), changes[ColumNames.quantity]
+        ):
+            if quantity is None:
+                largest_hours.pop(hour)
+            else:
+                largest_hours[hour] = quantity
+
+    metering_point_periods = spark.createDataFrame(
+        [(METERING_POINT_ID, datetime(2024, 1, 1), None, CHILD_METERING_POINT_ID, datetime(2024, 1, 1), None)],
+        schema="metering_point_id string, period_from_date timestamp, period_to_date timestamp, "
+        "child_metering_point_id string, child_period_from_date timestamp, child_period_to_date timestamp",
+    )
+
+    def calculate(time_series_points: list[tuple[datetime, Decimal]]) -> list:
+        output = execute_core_logic(
+            spark,
+            spark.createDataFrame([(METERING_POINT_ID, *point) for point in time_series_points], schema=schema),
+            metering_point_periods,
+            calculation_month=12,
+            calculation_year=2024,
+            time_zone=time_zone,
+        )
+        return sorted(output.measurements.collect())
+
+    # Act
+    from_largest_hours = calculate(list(largest_hours.items()))
+    from_all_points = calculate(list(gold_points.items()))
+
+    # Assert
+    assert from_largest_hours == from_all_points
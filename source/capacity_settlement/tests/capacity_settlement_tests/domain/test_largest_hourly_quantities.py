@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pandas as pd
+
+from opengeh_capacity_settlement.domain import largest_hourly_quantities
+from opengeh_capacity_settlement.domain.largest_hourly_quantities import update_largest_hourly_quantities
+
+METERING_POINT_ID = "170000000000000201"
+TIME_ZONE = "Europe/Copenhagen"
+
+
+class _State:
+    """In-memory stand-in for the `GroupState` of `applyInPandasWithState` and the gold points of the metering point.
+
+    The gold points are used to give the hourly quantity changes of the change data feed of the points.
+    """
+
+    def __init__(self) -> None:
+        self.exists = False
+        self.get: tuple[Any, ...] = ()
+        self.hasTimedOut = False
+        self.timeout_duration_ms: int | None = None
+        self.gold_points: dict[datetime, Decimal] = {}
+
+    def update(self, value: tuple[Any, ...]) -> None:
+        self.exists = True
+        self.get = value
+
+    def remove(self) -> None:
+        self.exists = False
+        self.get = ()
+
+    def setTimeoutDuration(self, durationMs: int) -> None:
+        self.timeout_duration_ms = durationMs
+
+
+def _hourly_quantity_changes(state: _State, *points: tuple[datetime, str]) -> pd.DataFrame:
+    changes = []
+    for observation_time, quantity in points:
+        hour = int(observation_time.replace(minute=0, tzinfo=timezone.utc).timestamp())
+        if observation_time in state.gold_points:
+            changes.append((hour, -int(state.gold_points[observation_time] * 1000), -1))
+        state.gold_points[observation_time] = Decimal(quantity)
+        changes.append((hour, int(Decimal(quantity) * 1000), 1))
+
+    return pd.DataFrame(
+        {
+            "metering_point_id": [METERING_POINT_ID] * len(changes),
+            "hour": pd.array([hour for hour, _, _ in changes], dtype="int64"),
+            "quantity": pd.array([quantity for _, quantity, _ in changes], dtype="int64"),
+            "point_count": pd.array([point_count for _, _, point_count in changes], dtype="int32"),
+        }
+    )
+
+
+def _update(state: _State, *points: tuple[datetime, str]) -> dict[datetime, Decimal | None]:
+    batch = _hourly_quantity_changes(state, *points)
+    (changes,) = update_largest_hourly_quantities((METERING_POINT_ID,), iter([batch]), state, TIME_ZONE)
+    return dict(zip(changes["observation_time"].dt.to_pydatetime(), changes["quantity"]))
+
+
+def test__update_largest_hourly_quantities__sums_quarters_across_micro_batches() -> None:
+    # Arrange
+    state = _State()
+    hour = datetime(2024, 1, 10, 12)
+
+    # Act
+    first = _update(state, (hour, "1.000"), (hour + timedelta(minutes=15), "2.000"))
+    second = _update(state, (hour + timedelta(minutes=30), "3.000"))
+
+    # Assert
+    assert first == {hour: Decimal("3.000")}
+    assert second == {hour: Decimal("6.000")}
+
+
+def test__update_largest_hourly_quantities__replaces_point_with_same_observation_time() -> None:
+    # Arrange
+    state = _State()
+    hour = datetime(2024, 1, 10, 12)
+    _update(state, (hour, "5.000"))
+
+    # Act
+    actual = _update(state, (hour, "2.000"))
+
+    # Assert
+    assert actual == {hour: Decimal("2.000")}
+
+
+def test__update_largest_hourly_quantities__removes_hours_that_are_not_among_the_largest_of_the_month(
+    monkeypatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(largest_hourly_quantities, "LARGEST_HOURS_PER_MONTH", 2)
+    state = _State()
+    hours = [datetime(2024, 1, 10, hour) for hour in range(3)]
+    _update(state, (hours[0], "1.000"), (hours[1], "2.000"))
+
+    # Act
+    actual = _update(state, (hours[2], "3.000"))
+
+    # Assert
+    assert actual == {hours[2]: Decimal("3.000"), hours[0]: None}
+
+
+def test__update_largest_hourly_quantities__keeps_largest_hours_of_each_month() -> None:
+    # Arrange
+    state = _State()
+    january = datetime(2024, 1, 10, 12)
+    february = datetime(2024, 2, 10, 12)
+
+    # Act
+    actual = _update(state, (january, "1.000"), (february, "2.000"))
+
+    # Assert
+    assert actual == {january: Decimal("1.000"), february: Decimal("2.000")}
+
+
+def test__update_largest_hourly_quantities__removes_months_before_the_latest_selection_period() -> None:
+    # Arrange
+    state = _State()
+    old = datetime(2023, 1, 10, 12)
+    new = datetime(2024, 2, 10, 12)
+    _update(state, (old, "1.000"))
+
+    # Act
+    actual = _update(state, (new, "1.000"))
+
+    # Assert
+    assert actual == {new: Decimal("1.000"), old: None}
+
+
+def test__update_largest_hourly_quantities__sums_all_quarters_of_an_hour_that_returns_among_the_largest(
+    monkeypatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(largest_hourly_quantities, "LARGEST_HOURS_PER_MONTH", 1)
+    state = _State()
+    small_hour = datetime(2024, 1, 10, 12)
+    large_hour = datetime(2024, 1, 10, 13)
+    _update(
+        state,
+        (small_hour, "1.000"),
+        (small_hour + timedelta(minutes=15), "1.000"),
+        (small_hour + timedelta(minutes=30), "1.000"),
+        (small_hour + timedelta(minutes=45), "1.000"),
+        (large_hour, "5.000"),
+    )
+
+    # Act
+    actual = _update(state, (small_hour + timedelta(minutes=45), "4.000"))
+
+    # Assert
+    assert actual == {small_hour: Decimal("7.000"), large_hour: None}
+
+
+def test__update_largest_hourly_quantities__returns_next_largest_hours_when_largest_hours_are_lowered() -> None:
+    # Arrange
+    state = _State()
+    hours = [datetime(2024, 1, 1) + timedelta(hours=hour) for hour in range(40)]
+    _update(state, *[(hour, f"{100 + index}.000") for index, hour in enumerate(hours)])
+
+    # Act
+    actual = _update(state, *[(hour, "0.000") for hour in hours[20:]])
+
+    # Assert
+    assert actual == {
+        **{hour: Decimal(f"{100 + index}.000") for index, hour in enumerate(hours) if 10 <= index < 20},
+        **{hour: None for hour in hours[30:]},
+    }
+
+
+def test__update_largest_hourly_quantities__sets_timeout_of_the_kept_months() -> None:
+    # Arrange
+    state = _State()
+
+    # Act
+    _update(state, (datetime(2024, 1, 10, 12), "1.000"))
+
+    # Assert
+    assert state.timeout_duration_ms == largest_hourly_quantities.STATE_TIMEOUT.total_seconds() * 1000
+
+
+def test__update_largest_hourly_quantities__when_timed_out__removes_state() -> None:
+    # Arrange
+    state = _State()
+    _update(state, (datetime(2024, 1, 10, 12), "1.000"))
+    state.hasTimedOut = True
+
+    # Act
+    actual = list(update_largest_hourly_quantities((METERING_POINT_ID,), iter([]), state, TIME_ZONE))
+
+    # Assert
+    assert actual == []
+    assert not state.exists
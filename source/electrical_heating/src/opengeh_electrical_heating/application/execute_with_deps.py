@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 
 import telemetry_logging.logging_configuration as config
 from opentelemetry.trace import SpanKind
-from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import DataFrame, Row, SparkSession
+from pyspark.sql import functions as F
 from telemetry_logging import use_span
 from telemetry_logging.span_recording import span_record_exception
 
@@ -29,6 +30,7 @@ from opengeh_electrical_heating.domain.calculation import (
 from opengeh_electrical_heating.domain.calculation_results import (
     CalculationOutput,
 )
+from opengeh_electrical_heating.domain.types.metering_point_type import MeteringPointType
 from opengeh_electrical_heating.infrastructure.electrical_heating_internal.schemas import (
     calculations as schemas,
 )
@@ -87,17 +89,28 @@ def _execute_with_deps(spark: SparkSession, args: ElectricalHeatingArgs) -> None
     execution_start_datetime = datetime.now(timezone.utc)
 
     # Create repositories to obtain data frames
-    electricity_market_repository = em.Repository(spark, args.electricity_market_data_path)
+    electricity_market_repository = em.Repository(
+        spark, args.electricity_market_data_path, args.electricity_market_snapshot_path
+    )
     measurements_gold_repository = mg.Repository(spark, args.catalog_name)
     electrical_heating_internal_repository = ehi.Repository(spark, args.catalog_name)
 
     # Read data frames
-    time_series_points = measurements_gold_repository.read_time_series_points()
-
     consumption_metering_point_periods = electricity_market_repository.read_consumption_metering_point_periods()
 
     child_metering_point_periods = electricity_market_repository.read_child_metering_points()
 
+    time_series_points = read_time_series_points_in_scope(
+        measurements_gold_repository,
+        consumption_metering_point_periods,
+        child_metering_point_periods,
+    )
+
+    # Changed metering point periods can affect any result, so they require a full calculation
+    changed_time_series_points = None
+    if args.incremental_from is not None and not electricity_market_repository.is_modified_since(args.incremental_from):
+        changed_time_series_points = measurements_gold_repository.read_time_series_points_changes(args.incremental_from)
+
     calculation_output = execute_calculation(
         spark,
         time_series_points,
@@ -105,11 +118,81 @@ def _execute_with_deps(spark: SparkSession, args: ElectricalHeatingArgs) -> None
         child_metering_point_periods,
         args,
         execution_start_datetime,
+        changed_time_series_points,
     )
 
     electrical_heating_internal_repository.save(calculation_output.calculations)
 
 
+def read_time_series_points_in_scope(
+    measurements_gold_repository: mg.Repository,
+    consumption_metering_point_periods: DataFrame,
+    child_metering_point_periods: DataFrame,
+) -> DataFrame:
+    """Read only the time series points that the calculation can use.
+
+    These are the points of the relevant metering point types of the electrical heating and net consumption metering
+    points and their parents, observed within the overlaps of the consumption metering point periods with the periods
+    of their electrical heating metering points, which are the only periods that are calculated.
+    """
+    observation_window = _get_observation_window(consumption_metering_point_periods, child_metering_point_periods)
+
+    return measurements_gold_repository.read_time_series_points(
+        metering_point_types=[
+            MeteringPointType.CONSUMPTION_METERING_POINT_TYPE,
+            MeteringPointType.NET_CONSUMPTION,
+            MeteringPointType.ELECTRICAL_HEATING,
+        ],
+        observation_time_from=observation_window["observation_time_from"],
+        observation_time_to=observation_window["observation_time_to"],
+        metering_point_ids=_get_metering_point_ids_in_scope(child_metering_point_periods),
+    )
+
+
+def _get_observation_window(
+    consumption_metering_point_periods: DataFrame, child_metering_point_periods: DataFrame
+) -> Row:
+    electrical_heating_periods = (
+        consumption_metering_point_periods.alias("parent")
+        .join(
+            child_metering_point_periods.where(
+                F.col("metering_point_type") == MeteringPointType.ELECTRICAL_HEATING.value
+            ).alias("electrical_heating"),
+            F.col("electrical_heating.parent_metering_point_id") == F.col("parent.metering_point_id"),
+            "inner",
+        )
+        .select(
+            F.greatest(F.col("parent.period_from_date"), F.col("electrical_heating.coupled_date")).alias(
+                "overlap_start"
+            ),
+            # `least` skips nulls, so the overlap is only open-ended when both periods are
+            F.least(F.col("parent.period_to_date"), F.col("electrical_heating.uncoupled_date")).alias("overlap_end"),
+        )
+        .where(F.col("overlap_end").isNull() | (F.col("overlap_start") < F.col("overlap_end")))
+    )
+    return electrical_heating_periods.select(
+        F.min(F.col("overlap_start")).alias("observation_time_from"),
+        # Open-ended overlaps have no upper bound
+        F.when(F.count_if(F.col("overlap_end").isNull()) == 0, F.max(F.col("overlap_end"))).alias(
+            "observation_time_to"
+        ),
+    ).first()
+
+
+def _get_metering_point_ids_in_scope(child_metering_point_periods: DataFrame) -> DataFrame:
+    children = child_metering_point_periods.where(
+        F.col("metering_point_type").isin(
+            MeteringPointType.ELECTRICAL_HEATING.value,
+            MeteringPointType.NET_CONSUMPTION.value,
+        )
+    )
+    # Only consumption metering points with an electrical heating metering point are calculated
+    parents = children.where(F.col("metering_point_type") == MeteringPointType.ELECTRICAL_HEATING.value).select(
+        F.col("parent_metering_point_id").alias("metering_point_id")
+    )
+    return children.select(F.col("metering_point_id")).union(parents)
+
+
 def execute_calculation(
     spark: SparkSession,
     time_series_points: DataFrame,
@@ -117,12 +200,15 @@ def execute_calculation(
     child_metering_point_periods: DataFrame,
     args: ElectricalHeatingArgs,
     execution_start_datetime: datetime,
+    changed_time_series_points: DataFrame | None = None,
 ) -> CalculationOutput:
     measurements = execute_core_logic(
         time_series_points,
         consumption_metering_point_periods,
         child_metering_point_periods,
         args.time_zone,
+        changed_time_series_points,
+        args.broadcast_threshold,
     )
 
     calculations = create_calculation(
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic_settings import BaseSettings
@@ -10,3 +11,6 @@ class ElectricalHeatingArgs(BaseSettings):
     time_zone: str = "Europe/Copenhagen"
     catalog_name: str
     electricity_market_data_path: str
+    electricity_market_snapshot_path: str | None = None
+    incremental_from: datetime | None = None
+    broadcast_threshold: int | None = None
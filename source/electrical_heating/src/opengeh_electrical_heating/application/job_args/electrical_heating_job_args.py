@@ -2,7 +2,7 @@ import argparse
 import sys
 import uuid
 from argparse import Namespace
-from datetime import datetime
+from datetime import datetime, timezone
 
 import configargparse
 from telemetry_logging import Logger, logging_configuration
@@ -11,8 +11,10 @@ from opengeh_electrical_heating.application.job_args.electrical_heating_args imp
     ElectricalHeatingArgs,
 )
 from opengeh_electrical_heating.application.job_args.environment_variables import (
+    get_broadcast_threshold,
     get_catalog_name,
     get_electricity_market_data_path,
+    get_electricity_market_snapshot_path,
     get_time_zone,
 )
 
@@ -33,6 +35,11 @@ def parse_job_arguments(
             orchestration_instance_id=uuid.UUID(job_args.orchestration_instance_id),
             time_zone=get_time_zone(),
             electricity_market_data_path=get_electricity_market_data_path(),
+            electricity_market_snapshot_path=get_electricity_market_snapshot_path(),
+            incremental_from=(
+                job_args.incremental_from.replace(tzinfo=timezone.utc) if job_args.incremental_from else None
+            ),
+            broadcast_threshold=get_broadcast_threshold(),
         )
 
     return electrical_heating_args
@@ -46,6 +53,8 @@ def _parse_args_or_throw(command_line_args: list[str]) -> argparse.Namespace:
 
     # Run parameters
     p.add_argument("--orchestration-instance-id", type=str, required=True)
+    # Only recalculate the periods affected by changes since this time (UTC)
+    p.add_argument("--incremental-from", type=valid_date, required=False)
 
     args, unknown_args = p.parse_known_args(args=command_line_args)
     if len(unknown_args):
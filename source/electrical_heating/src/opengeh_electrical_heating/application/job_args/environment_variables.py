@@ -8,6 +8,8 @@ class EnvironmentVariable(Enum):
     CATALOG_NAME = "CATALOG_NAME"
     TIME_ZONE = "TIME_ZONE"
     ELECTRICITY_MARKET_DATA_PATH = "ELECTRICITY_MARKET_DATA_PATH"
+    ELECTRICITY_MARKET_SNAPSHOT_PATH = "ELECTRICITY_MARKET_SNAPSHOT_PATH"
+    BROADCAST_THRESHOLD = "BROADCAST_THRESHOLD"
 
 
 def get_catalog_name() -> str:
@@ -22,6 +24,15 @@ def get_electricity_market_data_path() -> str:
     return get_env_variable_or_throw(EnvironmentVariable.ELECTRICITY_MARKET_DATA_PATH)
 
 
+def get_electricity_market_snapshot_path() -> str | None:
+    return os.getenv(EnvironmentVariable.ELECTRICITY_MARKET_SNAPSHOT_PATH.name)
+
+
+def get_broadcast_threshold() -> int | None:
+    broadcast_threshold = os.getenv(EnvironmentVariable.BROADCAST_THRESHOLD.name)
+    return int(broadcast_threshold) if broadcast_threshold is not None else None
+
+
 def get_env_variable_or_throw(variable: EnvironmentVariable) -> Any:
     env_variable = os.getenv(variable.name)
     if env_variable is None:
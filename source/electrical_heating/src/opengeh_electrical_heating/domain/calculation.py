@@ -1,3 +1,4 @@
+from opentelemetry import trace
 from pyspark.sql import DataFrame, SparkSession, Window
 from pyspark.sql import functions as F
 from pyspark.sql import types as T
@@ -17,6 +18,10 @@ from opengeh_electrical_heating.application.job_args.electrical_heating_args imp
 from opengeh_electrical_heating.domain.constants import (
     ELECTRICAL_HEATING_LIMIT_YEARLY,
 )
+from opengeh_electrical_heating.domain.join_strategy import (
+    apply_join_strategy,
+    choose_join_strategy,
+)
 from opengeh_electrical_heating.domain.types import NetSettlementGroup
 from opengeh_electrical_heating.domain.types.metering_point_type import MeteringPointType
 
@@ -49,7 +54,17 @@ def execute_core_logic(
     consumption_metering_point_periods: DataFrame,
     child_metering_points: DataFrame,
     time_zone: str,
+    changed_time_series_points: DataFrame | None = None,
+    broadcast_threshold: int | None = None,
 ) -> DataFrame:
+    """Calculate the electrical heating time series.
+
+    When `changed_time_series_points` is given, only the electrical heating metering points and years that are
+    affected by those points are calculated. The result of all other periods is unchanged and is left out.
+
+    The metering point periods are broadcast when they take up at most `broadcast_threshold` bytes, which defaults
+    to Spark's `spark.sql.autoBroadcastJoinThreshold`. The chosen join strategy is added to the current span.
+    """
     energy = time_series_points.where(
         (F.col("metering_point_type") == MeteringPointType.CONSUMPTION_METERING_POINT_TYPE.value)
         | (F.col("metering_point_type") == MeteringPointType.NET_CONSUMPTION.value)
@@ -69,6 +84,9 @@ def execute_core_logic(
     metering_point_periods = _find_parent_child_overlap_period(metering_point_periods)
     metering_point_periods = _split_period_by_year(metering_point_periods)
     metering_point_periods = _calculate_period_limit(metering_point_periods)
+    if changed_time_series_points is not None:
+        changed_time_series_points = convert_from_utc(changed_time_series_points, time_zone)
+        metering_point_periods = _filter_periods_affected_by_changes(metering_point_periods, changed_time_series_points)
 
     # prepare consumption and electrical heating time series data
     energy_daily = _calculate_daily_quantity(energy)
@@ -78,6 +96,9 @@ def execute_core_logic(
     metering_point_periods = _find_source_metering_point_for_energy(metering_point_periods)
 
     # here consumption time series and metering point periods data is joined
+    join_strategy = choose_join_strategy(metering_point_periods, broadcast_threshold)
+    trace.get_current_span().set_attribute("electrical_heating.join_strategy", join_strategy.value)
+    energy_daily, metering_point_periods = apply_join_strategy(energy_daily, metering_point_periods, join_strategy)
     metering_point_periods_with_energy = _join_source_metering_point_periods_with_energy(
         energy_daily,
         metering_point_periods,
@@ -92,6 +113,49 @@ def execute_core_logic(
     return electrical_heating.orderBy(F.col("metering_point_id"), F.col("date"))
 
 
+def _filter_periods_affected_by_changes(
+    metering_point_periods: DataFrame,
+    changed_time_series_points: DataFrame,
+) -> DataFrame:
+    """Keep the periods of the electrical heating metering points and years that have changed time series points.
+
+    The quantity of a day depends on all earlier days in the same period year, so a changed point of the parent,
+    the net consumption or the electrical heating metering point affects the whole period year.
+    """
+    period_metering_points = metering_point_periods.select(
+        F.col("electrical_heating_metering_point_id"),
+        F.col("period_year"),
+        F.explode(
+            F.array(
+                F.col("parent_metering_point_id"),
+                F.col("net_consumption_metering_point_id"),
+                F.col("electrical_heating_metering_point_id"),
+            )
+        ).alias("metering_point_id"),
+    )
+    changed_years = changed_time_series_points.select(
+        F.col("metering_point_id"),
+        F.year(F.col("observation_time")).alias("year"),
+    ).distinct()
+
+    affected_periods = (
+        period_metering_points.join(
+            changed_years,
+            (period_metering_points["metering_point_id"] == changed_years["metering_point_id"])
+            & (F.year(period_metering_points["period_year"]) == changed_years["year"]),
+            "inner",
+        )
+        .select(F.col("electrical_heating_metering_point_id"), F.col("period_year"))
+        .distinct()
+    )
+
+    return metering_point_periods.join(
+        affected_periods,
+        on=["electrical_heating_metering_point_id", "period_year"],
+        how="left_semi",
+    )
+
+
 def _filter_unchanged_electrical_heating(
     newly_calculated_electrical_heating: DataFrame,
     electrical_heating_from_before: DataFrame,
@@ -135,10 +199,11 @@ def _impose_period_quantity_limit(time_series_points: DataFrame) -> DataFrame:
         F.col("metering_point_id"),
         F.col("date"),
         F.col("period_energy_limit"),
-    ).drop_duplicates()
+    )
 
 
 def _aggregate_quantity_over_period(time_series_points: DataFrame) -> DataFrame:
+    # The daily quantities are unique per metering point, period and date, so the window is the only shuffle
     period_window = (
         Window.partitionBy(
             F.col("metering_point_id"),
@@ -154,7 +219,7 @@ def _aggregate_quantity_over_period(time_series_points: DataFrame) -> DataFrame:
         F.col("date"),
         F.col("quantity"),
         F.col("period_energy_limit"),
-    ).drop_duplicates()
+    )
 
 
 def _filter_parent_child_overlap_period_and_year(
@@ -192,23 +257,10 @@ def _join_source_metering_point_periods_with_energy(
 
 
 def _calculate_daily_quantity(time_series: DataFrame) -> DataFrame:
-    daily_window = Window.partitionBy(
+    return time_series.groupBy(
         F.col("metering_point_id"),
-        F.col("date"),
-    )
-
-    return (
-        time_series.select(
-            "*",
-            F.date_trunc("day", F.col("observation_time")).alias("date"),
-        )
-        .select(
-            F.sum(F.col("quantity")).over(daily_window).alias("quantity"),
-            F.col("date"),
-            F.col("metering_point_id"),
-        )
-        .drop_duplicates()
-    )
+        F.date_trunc("day", F.col("observation_time")).alias("date"),
+    ).agg(F.sum(F.col("quantity")).alias("quantity"))
 
 
 def _find_source_metering_point_for_energy(metering_point_periods: DataFrame) -> DataFrame:
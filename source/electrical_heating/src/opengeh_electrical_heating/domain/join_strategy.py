@@ -0,0 +1,101 @@
+import re
+from enum import Enum
+
+from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql import types as T
+
+_AUTO_BROADCAST_JOIN_THRESHOLD = "spark.sql.autoBroadcastJoinThreshold"
+_BYTE_UNITS = {"b": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+# The default sizes of the column types in Spark's size estimates, and the size of the row header
+_ROW_OVERHEAD = 8
+_DEFAULT_SIZES: dict[type[T.DataType], int] = {
+    T.BooleanType: 1,
+    T.ByteType: 1,
+    T.ShortType: 2,
+    T.IntegerType: 4,
+    T.DateType: 4,
+    T.FloatType: 4,
+    T.LongType: 8,
+    T.DoubleType: 8,
+    T.TimestampType: 8,
+    T.TimestampNTZType: 8,
+    T.StringType: 20,
+    T.BinaryType: 100,
+}
+
+
+class JoinStrategy(Enum):
+    BROADCAST = "broadcast"
+    """The periods are sent to every executor, so the time series points are not shuffled."""
+
+    SHUFFLE_HASH = "shuffle_hash"
+    """Both sides are hash partitioned by metering point id, and the periods are hashed instead of sorted."""
+
+
+def choose_join_strategy(metering_point_periods: DataFrame, broadcast_threshold: int | None) -> JoinStrategy:
+    """Choose how to join the metering point periods with the time series points.
+
+    The size of the periods is their number of rows times the estimated size of a row. The rows are counted up to
+    the number that fits within the threshold, because the size estimated by the optimizer is the product of the
+    sizes of the joined electricity market data.
+
+    Args:
+        metering_point_periods: The metering point periods.
+        broadcast_threshold: The largest size in bytes of the periods that are broadcast. Spark's
+            `spark.sql.autoBroadcastJoinThreshold` is used when it is not given, and a negative threshold disables
+            broadcasting.
+    """
+    if broadcast_threshold is None:
+        broadcast_threshold = _parse_bytes(
+            metering_point_periods.sparkSession.conf.get(_AUTO_BROADCAST_JOIN_THRESHOLD, "10m")
+        )
+    if broadcast_threshold < 0:
+        return JoinStrategy.SHUFFLE_HASH
+
+    max_rows = broadcast_threshold // _estimate_row_size(metering_point_periods.schema)
+    if metering_point_periods.limit(max_rows + 1).count() <= max_rows:
+        return JoinStrategy.BROADCAST
+
+    return JoinStrategy.SHUFFLE_HASH
+
+
+def apply_join_strategy(
+    time_series_points: DataFrame,
+    metering_point_periods: DataFrame,
+    join_strategy: JoinStrategy,
+) -> tuple[DataFrame, DataFrame]:
+    """Prepare both sides of the join of the time series points with the metering point periods.
+
+    Returns:
+        The time series points and the metering point periods to join.
+    """
+    if join_strategy == JoinStrategy.BROADCAST:
+        return time_series_points, F.broadcast(metering_point_periods)
+
+    return (
+        time_series_points.repartition(F.col("metering_point_id")),
+        metering_point_periods.repartition(F.col("energy_source_metering_point_id")).hint(join_strategy.value),
+    )
+
+
+def _estimate_row_size(schema: T.StructType) -> int:
+    """Estimate the size in bytes of a row like Spark does, from the default sizes of the column types."""
+    return _ROW_OVERHEAD + sum(_estimate_size(field.dataType) for field in schema.fields)
+
+
+def _estimate_size(data_type: T.DataType) -> int:
+    if isinstance(data_type, T.DecimalType):
+        return 8 if data_type.precision <= 18 else 16
+    if isinstance(data_type, T.StructType):
+        return sum(_estimate_size(field.dataType) for field in data_type.fields)
+    return _DEFAULT_SIZES.get(type(data_type), 8)
+
+
+def _parse_bytes(value: str) -> int:
+    """Parse a size in Spark's byte string format, e.g. `10485760b`, `10m` or `10MB`."""
+    match = re.fullmatch(r"(-?\d+)\s*([kmgt]?)b?", value.strip().lower())
+    if match is None:
+        raise ValueError(f"Invalid size in bytes: {value}")
+    return int(match.group(1)) * _BYTE_UNITS[match.group(2) or "b"]
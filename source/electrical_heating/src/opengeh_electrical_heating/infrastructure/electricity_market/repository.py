@@ -1,4 +1,9 @@
-from pyspark.sql import DataFrame, SparkSession
+import hashlib
+import posixpath
+from datetime import date, datetime
+
+from delta.tables import DeltaTable
+from pyspark.sql import Column, DataFrame, SparkSession
 from pyspark.sql import functions as F
 from pyspark.sql import types as T
 
@@ -9,23 +14,114 @@ from opengeh_electrical_heating.infrastructure.electricity_market.schemas.consum
     consumption_metering_point_periods_v1,
 )
 
+CONSUMPTION_METERING_POINT_PERIODS_FILE_NAME = "consumption_metering_point_periods_v1.csv"
+CHILD_METERING_POINTS_FILE_NAME = "child_metering_points_v1.csv"
+
 
 class Repository:
     def __init__(
         self,
         spark: SparkSession,
         electricity_market_data_path: str,
+        snapshot_path: str | None = None,
     ) -> None:
+        """Create a repository for the electricity market files.
+
+        Args:
+            spark: The Spark session.
+            electricity_market_data_path: The folder with the electricity market CSV files.
+            snapshot_path: Optional folder for typed Delta snapshots of the CSV files. When given, each version of
+                a file is only parsed once and later reads use the snapshot.
+        """
         self._spark = spark
         self._electricity_market_data_path = electricity_market_data_path
+        self._snapshot_path = snapshot_path
 
     def read_consumption_metering_point_periods(self) -> DataFrame:
-        file_path = f"{self._electricity_market_data_path}/consumption_metering_point_periods_v1.csv"
-        return _read_csv(spark=self._spark, path=file_path, schema=consumption_metering_point_periods_v1)
+        return self._read(CONSUMPTION_METERING_POINT_PERIODS_FILE_NAME, consumption_metering_point_periods_v1)
 
     def read_child_metering_points(self) -> DataFrame:
-        file_path = f"{self._electricity_market_data_path}/child_metering_points_v1.csv"
-        return _read_csv(spark=self._spark, path=file_path, schema=child_metering_points_v1)
+        return self._read(CHILD_METERING_POINTS_FILE_NAME, child_metering_points_v1)
+
+    def is_modified_since(self, since: datetime) -> bool:
+        """Return whether any of the electricity market files have been modified since the given time.
+
+        Only the file metadata is read, not the content of the files.
+        """
+        modified_files = (
+            self._spark.read.format("binaryFile")
+            .load(
+                [
+                    self._get_file_path(CONSUMPTION_METERING_POINT_PERIODS_FILE_NAME),
+                    self._get_file_path(CHILD_METERING_POINTS_FILE_NAME),
+                ]
+            )
+            .select(F.col("modificationTime"))
+            .where(F.col("modificationTime") >= F.lit(since))
+        )
+        return not modified_files.isEmpty()
+
+    def _read(self, file_name: str, schema: T.StructType) -> DataFrame:
+        file_path = self._get_file_path(file_name)
+        if self._snapshot_path is None:
+            return _read_csv(spark=self._spark, path=file_path, schema=schema)
+
+        return _read_csv_snapshot(
+            spark=self._spark,
+            path=file_path,
+            schema=schema,
+            snapshot_path=posixpath.join(self._snapshot_path, posixpath.splitext(file_name)[0]),
+        )
+
+    def _get_file_path(self, file_name: str) -> str:
+        return f"{self._electricity_market_data_path}/{file_name}"
+
+
+def _read_csv_snapshot(
+    spark: SparkSession,
+    path: str,
+    schema: T.StructType,
+    snapshot_path: str,
+) -> DataFrame:
+    """Read a typed Delta snapshot of a CSV file, replacing it if the file has changed since the last snapshot.
+
+    The snapshot records the path and modification time of the file it was created from in the commit metadata,
+    so unchanged files are never parsed again. A new version of the file overwrites the snapshot, and the files
+    of the superseded snapshot are vacuumed once they are past the retention period.
+
+    Args:
+        spark (SparkSession): The Spark session.
+        path (str): The path to the CSV file.
+        schema (StructType): The schema of the CSV file.
+        snapshot_path (str): The location of the Delta snapshot of the CSV file.
+
+    Returns:
+        DataFrame: The Spark DataFrame read from the snapshot.
+    """
+    modification_time = (
+        spark.read.format("binaryFile").load(path).select(F.unix_millis(F.col("modificationTime"))).first()[0]
+    )
+    snapshot_key = hashlib.sha256(f"{path}@{modification_time}".encode()).hexdigest()
+
+    if _get_snapshot_key(spark, snapshot_path) != snapshot_key:
+        (
+            _read_csv(spark=spark, path=path, schema=schema)
+            .write.format("delta")
+            .mode("overwrite")
+            .option("overwriteSchema", "true")
+            .option("userMetadata", snapshot_key)
+            .save(snapshot_path)
+        )
+        DeltaTable.forPath(spark, snapshot_path).vacuum()
+
+    return spark.read.format("delta").load(snapshot_path)
+
+
+def _get_snapshot_key(spark: SparkSession, snapshot_path: str) -> str | None:
+    if not DeltaTable.isDeltaTable(spark, snapshot_path):
+        return None
+
+    return DeltaTable.forPath(spark, snapshot_path).history(1).select("userMetadata").first()[0]
 
 
 # TODO JMG: Use read_csv from opengeh_python_packages
@@ -38,6 +134,9 @@ def _read_csv(
 ) -> DataFrame:
     """Read a CSV file into a Spark DataFrame.
 
+    The ignored columns and the non-nullable columns are checked in a single aggregation, so no rows are
+    serialized to Python. The returned columns have the nullability of the schema.
+
     Args:
         spark (SparkSession): The Spark session.
         path (str): The path to the CSV file.
@@ -49,24 +148,60 @@ def _read_csv(
 
     Returns:
         DataFrame: The Spark DataFrame.
+
+    Raises:
+        ValueError: If a non-nullable column has empty values or values that cannot be converted to its type.
     """
     raw_df = spark.read.csv(path, header=True, sep=sep)
 
-    # Check each column to see if all values are "[IGNORED]"
-    ignore_check = raw_df.agg(*[F.every(F.col(c) == F.lit(ignored_value)).alias(c) for c in raw_df.columns]).collect()
-
-    # Get the columns that should be ignored
-    ignored_cols = [c for c, v in ignore_check[0].asDict().items() if v and c in schema.fieldNames()]
-
-    raw_df = raw_df.drop(*ignored_cols)
-
-    transforms = []
+    transforms = {}
     for field in schema.fields:
         if field.name in raw_df.columns:
             if isinstance(field.dataType, T.ArrayType):
-                transforms.append(F.from_json(F.col(field.name), field.dataType).alias(field.name))
+                transforms[field.name] = F.from_json(F.col(field.name), field.dataType)
             else:
-                transforms.append(F.col(field.name).cast(field.dataType).alias(field.name))
+                transforms[field.name] = F.col(field.name).cast(field.dataType)
+
+    non_nullable_fields = [field.name for field in schema.fields if not field.nullable and field.name in transforms]
+
+    # Check each column to see if all values are "[IGNORED]" and count the null values of non-nullable columns
+    checks = raw_df.agg(
+        *[F.every(F.col(c) == F.lit(ignored_value)).alias(f"ignored_{c}") for c in transforms],
+        *[F.count_if(transforms[c].isNull()).alias(f"nulls_{c}") for c in non_nullable_fields],
+    ).first()
+
+    # Get the columns that should be ignored
+    ignored_cols = [c for c in transforms if checks[f"ignored_{c}"]]
+
+    invalid_cols = [c for c in non_nullable_fields if c not in ignored_cols and checks[f"nulls_{c}"] > 0]
+    if invalid_cols:
+        raise ValueError(f"Non-nullable columns with null or invalid values in {path}: {', '.join(invalid_cols)}")
+
+    for c in non_nullable_fields:
+        transforms[c] = _assume_not_null(transforms[c], schema[c].dataType)
+
+    return raw_df.select(*[transform.alias(c) for c, transform in transforms.items() if c not in ignored_cols])
+
+
+def _assume_not_null(column: Column, data_type: T.DataType) -> Column:
+    """Mark a column that has been checked to have no null values as non-nullable.
+
+    Spark only infers that an expression is non-nullable from its operands, so the column is coalesced with a
+    literal of its type. The literal is never used, as the nulls have already been rejected.
+    """
+    if isinstance(data_type, T.ArrayType | T.MapType):
+        default = F.array().cast(data_type) if isinstance(data_type, T.ArrayType) else F.create_map().cast(data_type)
+    elif isinstance(data_type, T.StringType):
+        default = F.lit("")
+    elif isinstance(data_type, T.BooleanType):
+        default = F.lit(False)
+    elif isinstance(data_type, T.TimestampType):
+        default = F.lit(datetime(1970, 1, 1))
+    elif isinstance(data_type, T.DateType):
+        default = F.lit(date(1970, 1, 1))
+    elif isinstance(data_type, T.NumericType):
+        default = F.lit(0).cast(data_type)
+    else:
+        return column
 
-    df = raw_df.select(*transforms)
-    return spark.createDataFrame(df.rdd, schema=schema, verifySchema=True)
+    return F.coalesce(column, default)
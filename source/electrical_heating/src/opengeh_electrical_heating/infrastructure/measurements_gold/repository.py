@@ -1,5 +1,9 @@
+from datetime import datetime
+
 from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
 
+from opengeh_electrical_heating.domain.types.metering_point_type import MeteringPointType
 from opengeh_electrical_heating.infrastructure.measurements_gold.database_definitions import (
     MeasurementsGoldDatabase,
 )
@@ -14,14 +18,75 @@ class Repository:
         self._spark = spark
         self._catalog_name = catalog_name
 
-    def read_time_series_points(self) -> DataFrame:
-        return self._read_view_or_table(
+    def read_time_series_points(
+        self,
+        metering_point_types: list[MeteringPointType] | None = None,
+        observation_time_from: datetime | None = None,
+        observation_time_to: datetime | None = None,
+        metering_point_ids: DataFrame | None = None,
+    ) -> DataFrame:
+        """Read the time series points, optionally restricted to the points in scope of a calculation.
+
+        The filters are applied directly on the table, so Delta can skip the files that have no matching
+        metering point types and observation times before anything is shuffled.
+
+        Args:
+            metering_point_types: Only read points of these metering point types.
+            observation_time_from: Only read points observed at or after this time (UTC).
+            observation_time_to: Only read points observed before this time (UTC).
+            metering_point_ids: Only read points of the metering points in the `metering_point_id` column
+                of this data frame.
+        """
+        time_series_points = self._read_view_or_table(
             MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME,
         )
 
+        if metering_point_types:
+            time_series_points = time_series_points.where(
+                F.col("metering_point_type").isin(
+                    [metering_point_type.value for metering_point_type in metering_point_types]
+                )
+            )
+        if observation_time_from is not None:
+            time_series_points = time_series_points.where(F.col("observation_time") >= F.lit(observation_time_from))
+        if observation_time_to is not None:
+            time_series_points = time_series_points.where(F.col("observation_time") < F.lit(observation_time_to))
+        if metering_point_ids is not None:
+            time_series_points = time_series_points.join(
+                metering_point_ids.select("metering_point_id").distinct(),
+                on="metering_point_id",
+                how="left_semi",
+            )
+
+        return time_series_points
+
+    def read_time_series_points_changes(self, changed_since: datetime) -> DataFrame:
+        """Read the keys of the time series points that have been inserted, updated or deleted since the given time.
+
+        The changes are read from the Delta change data feed, so only the files written after `changed_since`
+        are scanned. Requires `delta.enableChangeDataFeed` on the table, and the session from `initialize_spark`
+        so that a time after the latest commit gives no changes rather than an error.
+
+        Args:
+            changed_since: Only read changes committed at or after this time (UTC).
+
+        Returns:
+            DataFrame: The distinct `metering_point_id` and `observation_time` of the changed points.
+        """
+        return (
+            self._spark.read.format("delta")
+            .option("readChangeFeed", "true")
+            .option("startingTimestamp", changed_since.isoformat())
+            .table(self._get_full_name(MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME))
+            .select(F.col("metering_point_id"), F.col("observation_time"))
+            .distinct()
+        )
+
     def _read_view_or_table(
         self,
         table_name: str,
     ) -> DataFrame:
-        name = f"{self._catalog_name}.{MeasurementsGoldDatabase.DATABASE_NAME}.{table_name}"
-        return self._spark.read.format("delta").table(name)
+        return self._spark.read.format("delta").table(self._get_full_name(table_name))
+
+    def _get_full_name(self, table_name: str) -> str:
+        return f"{self._catalog_name}.{MeasurementsGoldDatabase.DATABASE_NAME}.{table_name}"
@@ -8,5 +8,7 @@ def initialize_spark() -> SparkSession:
         SparkConf(loadDefaults=True)
         .set("spark.sql.session.timeZone", "UTC")
         .set("spark.databricks.io.cache.enabled", "True")
+        # Reading the change data feed from after the latest commit means that nothing has changed
+        .set("spark.databricks.delta.changeDataFeed.timestampOutOfRange.enabled", "True")
     )
     return SparkSession.builder.config(conf=spark_conf).getOrCreate()
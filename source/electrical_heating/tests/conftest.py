@@ -49,6 +49,8 @@ def spark() -> Generator[SparkSession, None, None]:
             "spark.sql.catalog.spark_catalog",
             "org.apache.spark.sql.delta.catalog.DeltaCatalog",
         )
+        # Same as the job, see `initialize_spark`
+        .config("spark.databricks.delta.changeDataFeed.timestampOutOfRange.enabled", "true")
         # Enable Hive support for persistence across test sessions
         .config("spark.sql.catalogImplementation", "hive")
         .enableHiveSupport()
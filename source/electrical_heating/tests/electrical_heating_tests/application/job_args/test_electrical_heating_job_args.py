@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 import pytest
@@ -14,6 +15,7 @@ from opengeh_electrical_heating.application.job_args.environment_variables impor
 DEFAULT_ORCHESTRATION_INSTANCE_ID = uuid.UUID("12345678-9fc8-409a-a169-fbd49479d711")
 DEFAULT_TIME_ZONE = "some_time_zone"
 DEFAULT_CATALOG_NAME = "some_catalog"
+DEFAULT_INCREMENTAL_FROM = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
 
 def _get_contract_parameters(filename: str) -> list[str]:
@@ -65,3 +67,4 @@ def test_when_parameters__parses_parameters_from_contract(
     assert actual_args.orchestration_instance_id == DEFAULT_ORCHESTRATION_INSTANCE_ID
     assert actual_args.time_zone == DEFAULT_TIME_ZONE
     assert actual_args.catalog_name == DEFAULT_CATALOG_NAME
+    assert actual_args.incremental_from == DEFAULT_INCREMENTAL_FROM
@@ -0,0 +1,84 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+from pyspark.sql import SparkSession
+
+from opengeh_electrical_heating.application.execute_with_deps import read_time_series_points_in_scope
+from opengeh_electrical_heating.domain.types.metering_point_type import MeteringPointType
+from opengeh_electrical_heating.infrastructure.electricity_market.schemas.child_metering_points_v1 import (
+    child_metering_points_v1,
+)
+from opengeh_electrical_heating.infrastructure.electricity_market.schemas.consumption_metering_point_periods_v1 import (
+    consumption_metering_point_periods_v1,
+)
+
+
+def test__read_time_series_points_in_scope__reads_points_of_calculated_metering_points_in_periods(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    repository = Mock()
+    consumption_metering_point_periods = spark.createDataFrame(
+        [
+            ("170000000000000201", True, 2, 1, datetime(2023, 12, 31, 23), datetime(2024, 6, 30, 22)),
+            ("170000000000000301", True, 2, 1, datetime(2024, 2, 29, 23), datetime(2024, 12, 31, 23)),
+        ],
+        schema=consumption_metering_point_periods_v1,
+    )
+    child_metering_points = spark.createDataFrame(
+        [
+            (
+                "170000000000000202",
+                "electrical_heating",
+                "calculated",
+                "170000000000000201",
+                datetime(2024, 1, 1),
+                None,
+            ),
+            ("170000000000000203", "net_consumption", "calculated", "170000000000000201", datetime(2024, 1, 1), None),
+            ("170000000000000204", "supply_to_grid", "physical", "170000000000000201", datetime(2024, 1, 1), None),
+        ],
+        schema=child_metering_points_v1,
+    )
+
+    # Act
+    read_time_series_points_in_scope(repository, consumption_metering_point_periods, child_metering_points)
+
+    # Assert
+    kwargs = repository.read_time_series_points.call_args.kwargs
+    assert kwargs["metering_point_types"] == [
+        MeteringPointType.CONSUMPTION_METERING_POINT_TYPE,
+        MeteringPointType.NET_CONSUMPTION,
+        MeteringPointType.ELECTRICAL_HEATING,
+    ]
+    # Only the overlap of the period of 170000000000000201 with its electrical heating metering point is calculated
+    assert kwargs["observation_time_from"] == datetime(2024, 1, 1)
+    assert kwargs["observation_time_to"] == datetime(2024, 6, 30, 22)
+    assert sorted(row.metering_point_id for row in kwargs["metering_point_ids"].collect()) == [
+        "170000000000000201",
+        "170000000000000202",
+        "170000000000000203",
+    ]
+
+
+def test__read_time_series_points_in_scope__when_both_periods_are_open_ended__has_no_upper_bound(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    repository = Mock()
+    consumption_metering_point_periods = spark.createDataFrame(
+        [("170000000000000201", True, 2, 1, datetime(2023, 12, 31, 23), None)],
+        schema=consumption_metering_point_periods_v1,
+    )
+    child_metering_points = spark.createDataFrame(
+        [("170000000000000202", "electrical_heating", "calculated", "170000000000000201", datetime(2024, 1, 1), None)],
+        schema=child_metering_points_v1,
+    )
+
+    # Act
+    read_time_series_points_in_scope(repository, consumption_metering_point_periods, child_metering_points)
+
+    # Assert
+    kwargs = repository.read_time_series_points.call_args.kwargs
+    assert kwargs["observation_time_from"] == datetime(2024, 1, 1)
+    assert kwargs["observation_time_to"] is None
@@ -0,0 +1,141 @@
+import re
+from datetime import datetime
+from decimal import Decimal
+
+from pyspark.sql import DataFrame, SparkSession
+
+from opengeh_electrical_heating.domain.calculation import (
+    _aggregate_quantity_over_period,
+    _calculate_daily_quantity,
+    _impose_period_quantity_limit,
+    _join_source_metering_point_periods_with_energy,
+)
+from opengeh_electrical_heating.domain.join_strategy import (
+    JoinStrategy,
+    apply_join_strategy,
+    choose_join_strategy,
+)
+
+
+def _count_shuffles(df: DataFrame) -> int:
+    # Broadcast exchanges are named `BroadcastExchange`, so only shuffle exchanges are counted
+    plan = df._jdf.queryExecution().executedPlan().toString()
+    return len(re.findall(r"\bExchange\b", plan))
+
+
+def test__calculate_daily_quantity__shuffles_once(spark: SparkSession) -> None:
+    # Arrange
+    time_series = spark.createDataFrame(
+        [
+            ("170000000000000201", datetime(2024, 1, 1, 0), Decimal("1.000")),
+            ("170000000000000201", datetime(2024, 1, 1, 1), Decimal("2.000")),
+            ("170000000000000201", datetime(2024, 1, 2, 0), Decimal("4.000")),
+        ],
+        ["metering_point_id", "observation_time", "quantity"],
+    )
+
+    # Act
+    actual = _calculate_daily_quantity(time_series)
+
+    # Assert
+    assert _count_shuffles(actual) == 1
+    assert sorted((row.date, row.quantity) for row in actual.collect()) == [
+        (datetime(2024, 1, 1), Decimal("3.000")),
+        (datetime(2024, 1, 2), Decimal("4.000")),
+    ]
+
+
+def test__impose_period_quantity_limit__after_aggregate_quantity_over_period__shuffles_once(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    period_start = datetime(2024, 1, 1)
+    period_end = datetime(2025, 1, 1)
+    daily_quantities = spark.createDataFrame(
+        [
+            ("170000000000000202", period_start, period_end, datetime(2024, 1, 1), Decimal("3.000"), Decimal("4.000")),
+            ("170000000000000202", period_start, period_end, datetime(2024, 1, 2), Decimal("3.000"), Decimal("4.000")),
+            ("170000000000000202", period_start, period_end, datetime(2024, 1, 3), Decimal("3.000"), Decimal("4.000")),
+        ],
+        ["metering_point_id", "parent_period_start", "parent_period_end", "date", "quantity", "period_energy_limit"],
+    )
+
+    # Act
+    actual = _impose_period_quantity_limit(_aggregate_quantity_over_period(daily_quantities))
+
+    # Assert
+    assert _count_shuffles(actual) == 1
+    assert [row.quantity for row in actual.orderBy("date").collect()] == [
+        Decimal("3.000"),
+        Decimal("1.000"),
+        Decimal("0.000"),
+    ]
+
+
+def _join_with_strategy(spark: SparkSession, broadcast_threshold: int | None) -> tuple[JoinStrategy, DataFrame]:
+    daily_quantities = spark.createDataFrame(
+        [("170000000000000201", datetime(2024, 1, 1), Decimal("3.000"))],
+        ["metering_point_id", "date", "quantity"],
+    )
+    period_start = datetime(2024, 1, 1)
+    period_end = datetime(2025, 1, 1)
+    metering_point_periods = spark.createDataFrame(
+        [("170000000000000201", "170000000000000202", period_start, period_end, 4000.0, period_start, period_end)],
+        [
+            "energy_source_metering_point_id",
+            "electrical_heating_metering_point_id",
+            "parent_period_start",
+            "parent_period_end",
+            "period_energy_limit",
+            "overlap_period_start",
+            "overlap_period_end",
+        ],
+    )
+    join_strategy = choose_join_strategy(metering_point_periods, broadcast_threshold)
+    daily_quantities, metering_point_periods = apply_join_strategy(
+        daily_quantities, metering_point_periods, join_strategy
+    )
+    return join_strategy, _join_source_metering_point_periods_with_energy(daily_quantities, metering_point_periods)
+
+
+def test__join_source_metering_point_periods_with_energy__when_periods_fit_threshold__broadcasts_periods(
+    spark: SparkSession,
+) -> None:
+    # Act
+    join_strategy, actual = _join_with_strategy(spark, broadcast_threshold=10 * 1024 * 1024)
+
+    # Assert
+    assert join_strategy == JoinStrategy.BROADCAST
+    assert "BroadcastHashJoin" in actual._jdf.queryExecution().executedPlan().toString()
+    assert [row.metering_point_id for row in actual.collect()] == ["170000000000000202"]
+
+
+def test__join_source_metering_point_periods_with_energy__when_periods_exceed_threshold__hash_partitions_by_id(
+    spark: SparkSession,
+) -> None:
+    # Act
+    join_strategy, actual = _join_with_strategy(spark, broadcast_threshold=0)
+
+    # Assert
+    plan = actual._jdf.queryExecution().executedPlan().toString()
+    assert join_strategy == JoinStrategy.SHUFFLE_HASH
+    assert "ShuffledHashJoin" in plan
+    assert "SortMergeJoin" not in plan
+    assert [row.metering_point_id for row in actual.collect()] == ["170000000000000202"]
+
+
+def test__join_source_metering_point_periods_with_energy__when_spark_disables_broadcast__hash_partitions_by_id(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    auto_broadcast_join_threshold = spark.conf.get("spark.sql.autoBroadcastJoinThreshold")
+    spark.conf.set("spark.sql.autoBroadcastJoinThreshold", "-1")
+
+    # Act
+    try:
+        join_strategy, _ = _join_with_strategy(spark, broadcast_threshold=None)
+    finally:
+        spark.conf.set("spark.sql.autoBroadcastJoinThreshold", auto_broadcast_join_threshold)
+
+    # Assert
+    assert join_strategy == JoinStrategy.SHUFFLE_HASH
@@ -0,0 +1,94 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from delta.tables import DeltaTable
+from pyspark.sql import SparkSession
+
+from opengeh_electrical_heating.infrastructure.electricity_market.repository import (
+    CHILD_METERING_POINTS_FILE_NAME,
+    Repository,
+)
+
+CHILD_METERING_POINTS_HEADER = (
+    "metering_point_id;metering_point_type;metering_point_sub_type;parent_metering_point_id;coupled_date;uncoupled_date"
+)
+
+
+def _write_child_metering_points(folder: Path, *rows: str) -> Path:
+    file_path = folder / CHILD_METERING_POINTS_FILE_NAME
+    file_path.write_text("\n".join([CHILD_METERING_POINTS_HEADER, *rows]) + "\n")
+    return file_path
+
+
+def test__read_child_metering_points__returns_typed_rows_without_ignored_columns(
+    spark: SparkSession, tmp_path: Path
+) -> None:
+    # Arrange
+    _write_child_metering_points(
+        tmp_path,
+        "170000000000000202;electrical_heating;[IGNORED];170000000000000201;2024-01-01T00:00:00Z;",
+        "170000000000000203;net_consumption;[IGNORED];170000000000000201;2024-01-01T00:00:00Z;",
+    )
+    repository = Repository(spark, str(tmp_path))
+
+    # Act
+    actual = repository.read_child_metering_points()
+
+    # Assert
+    assert "metering_point_sub_type" not in actual.columns
+    assert dict(actual.dtypes)["coupled_date"] == "timestamp"
+    assert actual.where(actual.coupled_date == datetime(2024, 1, 1)).count() == 2
+    assert not actual.schema["coupled_date"].nullable
+    assert actual.schema["uncoupled_date"].nullable
+
+
+def test__read_child_metering_points__when_non_nullable_value_is_missing__raises_value_error(
+    spark: SparkSession, tmp_path: Path
+) -> None:
+    # Arrange
+    _write_child_metering_points(
+        tmp_path,
+        "170000000000000202;electrical_heating;calculated;170000000000000201;;",
+    )
+    repository = Repository(spark, str(tmp_path))
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="coupled_date"):
+        repository.read_child_metering_points()
+
+
+def test__read_child_metering_points__with_snapshot_path__replaces_snapshot_when_file_changes(
+    spark: SparkSession, tmp_path: Path
+) -> None:
+    # Arrange
+    data_path = tmp_path / "data"
+    snapshot_path = tmp_path / "snapshots"
+    data_path.mkdir()
+    file_path = _write_child_metering_points(
+        data_path,
+        "170000000000000202;electrical_heating;calculated;170000000000000201;2024-01-01T00:00:00Z;",
+    )
+    repository = Repository(spark, str(data_path), str(snapshot_path))
+    snapshot = snapshot_path / Path(CHILD_METERING_POINTS_FILE_NAME).stem
+
+    # Act
+    first = repository.read_child_metering_points()
+    second = repository.read_child_metering_points()
+    _write_child_metering_points(
+        data_path,
+        "170000000000000202;electrical_heating;calculated;170000000000000201;2024-01-01T00:00:00Z;",
+        "170000000000000203;net_consumption;calculated;170000000000000201;2024-01-01T00:00:00Z;",
+    )
+    modification_time = file_path.stat().st_mtime + 60
+    os.utime(file_path, (modification_time, modification_time))
+    third = repository.read_child_metering_points()
+
+    # Assert
+    assert first.count() == 1
+    assert second.count() == 1
+    assert third.count() == 2
+    assert not third.schema["coupled_date"].nullable
+    writes = DeltaTable.forPath(spark, str(snapshot)).history().where("operation = 'WRITE'")
+    assert writes.count() == 2
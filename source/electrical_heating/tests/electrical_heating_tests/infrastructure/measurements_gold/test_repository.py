@@ -0,0 +1,137 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from delta.tables import DeltaTable
+from pyspark.sql import SparkSession
+from testcommon.delta_lake import create_database, create_table
+
+from opengeh_electrical_heating.domain.types.metering_point_type import MeteringPointType
+from opengeh_electrical_heating.infrastructure.measurements_gold.database_definitions import (
+    MeasurementsGoldDatabase,
+)
+from opengeh_electrical_heating.infrastructure.measurements_gold.repository import Repository
+from opengeh_electrical_heating.infrastructure.measurements_gold.schemas.time_series_points_v1 import (
+    time_series_points_v1,
+)
+
+
+@pytest.fixture(scope="module")
+def time_series_points_table(spark: SparkSession) -> None:
+    create_database(spark, MeasurementsGoldDatabase.DATABASE_NAME)
+    create_table(
+        spark,
+        database_name=MeasurementsGoldDatabase.DATABASE_NAME,
+        table_name=MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME,
+        schema=time_series_points_v1,
+        table_location=f"{MeasurementsGoldDatabase.DATABASE_NAME}/{MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME}",
+    )
+    spark.sql(
+        f"ALTER TABLE {MeasurementsGoldDatabase.DATABASE_NAME}.{MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME} "
+        "SET TBLPROPERTIES (delta.enableChangeDataFeed = true)"
+    )
+    rows = [
+        ("170000000000000201", "consumption", datetime(2024, 1, 1, 23), Decimal("1.000")),
+        ("170000000000000201", "consumption", datetime(2024, 1, 3, 15), Decimal("2.000")),
+        ("170000000000000202", "electrical_heating", datetime(2024, 1, 3, 15), Decimal("3.000")),
+        ("170000000000000203", "supply_to_grid", datetime(2024, 1, 3, 15), Decimal("4.000")),
+        ("170000000000000204", "consumption", datetime(2024, 1, 6, 10), Decimal("5.000")),
+    ]
+    spark.createDataFrame(rows, schema=time_series_points_v1).write.format("delta").mode("overwrite").saveAsTable(
+        f"{MeasurementsGoldDatabase.DATABASE_NAME}.{MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME}"
+    )
+
+
+def test__read_time_series_points__without_filters__returns_all_points(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+
+    # Act
+    actual = repository.read_time_series_points()
+
+    # Assert
+    assert actual.count() == 5
+
+
+def test__read_time_series_points__with_metering_point_types__returns_points_of_those_types(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+
+    # Act
+    actual = repository.read_time_series_points(
+        metering_point_types=[MeteringPointType.CONSUMPTION_METERING_POINT_TYPE, MeteringPointType.ELECTRICAL_HEATING]
+    )
+
+    # Assert
+    assert {row.metering_point_type for row in actual.collect()} == {"consumption", "electrical_heating"}
+    assert actual.count() == 4
+
+
+def test__read_time_series_points__with_observation_time_window__returns_points_in_window(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+
+    # Act
+    actual = repository.read_time_series_points(
+        observation_time_from=datetime(2024, 1, 3, 15), observation_time_to=datetime(2024, 1, 6, 10)
+    )
+
+    # Assert
+    assert {row.observation_time for row in actual.collect()} == {datetime(2024, 1, 3, 15)}
+
+
+def test__read_time_series_points__with_metering_point_ids__returns_points_of_those_metering_points(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+    metering_point_ids = spark.createDataFrame(
+        [("170000000000000201",), ("170000000000000201",), ("170000000000000204",)], ["metering_point_id"]
+    )
+
+    # Act
+    actual = repository.read_time_series_points(metering_point_ids=metering_point_ids)
+
+    # Assert
+    assert sorted(row.quantity for row in actual.collect()) == [Decimal("1.000"), Decimal("2.000"), Decimal("5.000")]
+    assert actual.columns == [field.name for field in time_series_points_v1.fields]
+
+
+def test__read_time_series_points_changes__returns_keys_of_points_changed_since(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+    latest_commit = (
+        DeltaTable.forName(
+            spark, f"{MeasurementsGoldDatabase.DATABASE_NAME}.{MeasurementsGoldDatabase.TIME_SERIES_POINTS_NAME}"
+        )
+        .history(1)
+        .first()
+    )
+
+    # Act
+    actual = repository.read_time_series_points_changes(latest_commit.timestamp)
+
+    # Assert
+    assert actual.columns == ["metering_point_id", "observation_time"]
+    assert actual.count() == 5
+
+
+def test__read_time_series_points_changes__when_nothing_changed_since__returns_no_points(
+    spark: SparkSession, time_series_points_table: None
+) -> None:
+    # Arrange
+    repository = Repository(spark, "spark_catalog")
+
+    # Act
+    actual = repository.read_time_series_points_changes(datetime(2100, 1, 1))
+
+    # Assert
+    assert actual.isEmpty()
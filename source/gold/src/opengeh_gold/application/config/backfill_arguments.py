@@ -0,0 +1,42 @@
+import argparse
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from opengeh_gold.application.streams.measurements_silver_to_gold.measurements_stream_processor import (
+    BACKFILL_RANGE_COLUMNS,
+)
+
+
+@dataclass(frozen=True)
+class BackfillArguments:
+    range_column: str
+    range_start: datetime
+    range_end: datetime
+    slice_length: timedelta
+
+
+def parse_backfill_arguments(command_line_args: list[str]) -> BackfillArguments:
+    parser = argparse.ArgumentParser(description="Backfill gold measurements from a range of silver measurements")
+    parser.add_argument("--range-column", choices=BACKFILL_RANGE_COLUMNS, required=True)
+    parser.add_argument("--range-start", type=_utc_datetime, required=True)
+    parser.add_argument("--range-end", type=_utc_datetime, required=True)
+    parser.add_argument("--slice-days", type=int, default=1)
+    args = parser.parse_args(command_line_args)
+
+    if args.range_start >= args.range_end:
+        parser.error("--range-start must be before --range-end")
+    if args.slice_days <= 0:
+        parser.error("--slice-days must be positive")
+
+    return BackfillArguments(
+        range_column=args.range_column,
+        range_start=args.range_start,
+        range_end=args.range_end,
+        slice_length=timedelta(days=args.slice_days),
+    )
+
+
+def _utc_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 datetime. Datetimes without a time zone are in UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
@@ -0,0 +1,59 @@
+import logging
+import sys
+
+import telemetry_logging.logging_configuration as config
+from opentelemetry.trace import SpanKind
+from telemetry_logging.span_recording import span_record_exception
+
+from opengeh_gold.application.config.spark import initialize_spark
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import GoldMeasurementsColumnNames
+from opengeh_gold.infrastructure.config.database_names import DatabaseNames
+from opengeh_gold.infrastructure.config.table_names import TableNames
+from opengeh_gold.infrastructure.maintenance.table_maintenance import TableMaintenanceSettings, maintain_table
+from opengeh_gold.infrastructure.shared_helpers import get_full_table_name
+
+# The gold tables are queried by the calculations, which filter and join them by metering point and time, so the
+# statistics of those columns are kept up to date. The rollups are only written when a value changes, so they get fewer
+# small files than the measurements.
+TABLES_TO_MAINTAIN = [
+    TableMaintenanceSettings(
+        table_name=get_full_table_name(DatabaseNames.gold, TableNames.gold_measurements),
+        min_num_files_to_optimize=50,
+        statistics_columns=(
+            GoldMeasurementsColumnNames.metering_point_id,
+            GoldMeasurementsColumnNames.observation_time,
+        ),
+    ),
+    TableMaintenanceSettings(
+        table_name=get_full_table_name(DatabaseNames.gold, TableNames.gold_measurements_hourly),
+        min_num_files_to_optimize=20,
+        statistics_columns=(
+            GoldMeasurementsColumnNames.metering_point_id,
+            GoldMeasurementsColumnNames.observation_time,
+        ),
+    ),
+    TableMaintenanceSettings(
+        table_name=get_full_table_name(DatabaseNames.gold, TableNames.gold_measurements_daily),
+        min_num_files_to_optimize=20,
+        statistics_columns=(GoldMeasurementsColumnNames.metering_point_id, GoldMeasurementsColumnNames.local_date),
+    ),
+]
+
+
+def maintain(applicationinsights_connection_string: str | None = None) -> None:
+    config.configure_logging(
+        cloud_role_name="dbr-measurements-gold",
+        tracer_name="maintenance-gold-job",
+        applicationinsights_connection_string=applicationinsights_connection_string,
+        extras={"Subsystem": "measurements"},
+    )
+    logging.basicConfig(level=logging.INFO)
+
+    with config.get_tracer().start_as_current_span(__name__, kind=SpanKind.SERVER) as span:
+        try:
+            spark = initialize_spark()
+            for settings in TABLES_TO_MAINTAIN:
+                maintain_table(spark, settings)
+        except Exception as e:
+            span_record_exception(e, span)
+            sys.exit(4)
@@ -33,3 +33,37 @@ class GoldPort(ABC):
             df (DataFrame): The DataFrame to append to the Delta table.
             table_name (str): The name of the Delta table to append to.
         """
+
+    @abstractmethod
+    def merge(self, df: DataFrame, table_name: str) -> None:
+        """Merge a static DataFrame of measurements into a Delta table.
+
+        Rows are matched on metering point id and observation time. The row with the newest transaction creation
+        datetime wins, and `modified` is only updated when the quantity or quality changes.
+
+        Args:
+            df (DataFrame): The DataFrame to merge into the Delta table. Must contain at most one row per
+                metering point id and observation time.
+            table_name (str): The name of the Delta table to merge into.
+        """
+
+    @abstractmethod
+    def read(self, table_name: str) -> DataFrame:
+        """Read a Gold Delta table as a static DataFrame.
+
+        Args:
+            table_name (str): The name of the Gold table to read.
+        """
+
+    @abstractmethod
+    def upsert(self, df: DataFrame, table_name: str, key_columns: list[str]) -> None:
+        """Insert or replace the rows of a static DataFrame in a Delta table.
+
+        Rows are matched on the key columns. Matched rows are only updated when a value other than `modified`
+        has changed.
+
+        Args:
+            df (DataFrame): The DataFrame to upsert. Must contain at most one row per key.
+            table_name (str): The name of the Delta table to upsert into.
+            key_columns (list[str]): The columns that identify a row.
+        """
@@ -16,3 +16,14 @@ class SilverPort(ABC):
         Returns:
             DataFrame: A Spark DataFrame representing the streaming data from the specified Delta table.
         """
+
+    @abstractmethod
+    def read(self, table_name: str) -> DataFrame:
+        """Read a Delta table in the Silver layer as a static DataFrame.
+
+        Args:
+            table_name (str): The name of the silver table to read from.
+
+        Returns:
+            DataFrame: A Spark DataFrame with the current data of the specified Delta table.
+        """
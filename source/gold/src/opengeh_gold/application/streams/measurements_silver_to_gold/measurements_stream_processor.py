@@ -1,16 +1,45 @@
-﻿from pyspark.sql.dataframe import DataFrame
+﻿from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from pyspark.sql import functions as F
+from pyspark.sql.dataframe import DataFrame
 
 from opengeh_gold.application.ports.gold_port import GoldPort
 from opengeh_gold.application.ports.silver_port import SilverPort
-from opengeh_gold.domain.streams.silver_to_gold.transformations import transform_silver_to_gold
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import GoldMeasurementsColumnNames
+from opengeh_gold.domain.constants.column_names.silver_measurements_column_names import SilverMeasurementsColumnNames
+from opengeh_gold.domain.streams.silver_to_gold.rollups import (
+    calculate_daily_rollup,
+    calculate_hourly_rollup,
+    get_changed_range,
+)
+from opengeh_gold.domain.streams.silver_to_gold.transformations import (
+    keep_latest_transaction,
+    transform_silver_to_gold,
+)
+
+BACKFILL_RANGE_COLUMNS = [
+    SilverMeasurementsColumnNames.transaction_creation_datetime,
+    SilverMeasurementsColumnNames.start_datetime,
+]
 
 
 class StreamProcessorMeasurements:
-    def __init__(self, silver_port: SilverPort, silver_target_table: str, gold_port: GoldPort, gold_target_table: str):
+    def __init__(
+        self,
+        silver_port: SilverPort,
+        silver_target_table: str,
+        gold_port: GoldPort,
+        gold_target_table: str,
+        gold_hourly_target_table: str | None = None,
+        gold_daily_target_table: str | None = None,
+    ):
         self.silver_port = silver_port
         self.silver_target_table = silver_target_table
         self.gold_port = gold_port
         self.gold_target_table = gold_target_table
+        self.gold_hourly_target_table = gold_hourly_target_table
+        self.gold_daily_target_table = gold_daily_target_table
         self.query_name = "measurements_silver_to_gold"
 
     def stream_measurements_silver_to_gold(self) -> None:
@@ -19,6 +48,79 @@ class StreamProcessorMeasurements:
             df_silver_stream, self.query_name, self.gold_target_table, self.pipeline_measurements_silver_to_gold
         )
 
+    def backfill_measurements_silver_to_gold(
+        self,
+        range_column: str,
+        range_start: datetime,
+        range_end: datetime,
+        slice_length: timedelta = timedelta(days=1),
+    ) -> None:
+        """Write the silver measurements in a range to gold as batch jobs, one slice of the range at a time.
+
+        The silver measurements are read as a static DataFrame, so the checkpoint of the stream is neither used nor
+        changed. Each slice is written like a micro-batch of the stream. The slices are written one after another,
+        because concurrent merges into the same gold table would conflict, while each slice is processed in parallel
+        by the cluster. The newest transaction wins in the merge, so the order of the slices does not matter.
+
+        Args:
+            range_column (str): The silver column to select the measurements by, one of `BACKFILL_RANGE_COLUMNS`.
+            range_start (datetime): The inclusive start of the range.
+            range_end (datetime): The exclusive end of the range.
+            slice_length (timedelta, optional): The length of each slice. Defaults to one day.
+
+        Raises:
+            ValueError: If the range column is not supported, or the slice length is not positive.
+        """
+        if range_column not in BACKFILL_RANGE_COLUMNS:
+            raise ValueError(f"Backfill range column must be one of {', '.join(BACKFILL_RANGE_COLUMNS)}")
+        if slice_length <= timedelta(0):
+            raise ValueError("Backfill slice length must be positive")
+
+        df_silver = self.silver_port.read(self.silver_target_table)
+        for slice_number, (slice_start, slice_end) in enumerate(_get_slices(range_start, range_end, slice_length)):
+            df_silver_slice = df_silver.where(
+                (F.col(range_column) >= F.lit(slice_start)) & (F.col(range_column) < F.lit(slice_end))
+            )
+            self.pipeline_measurements_silver_to_gold(df_silver_slice, slice_number)
+
     def pipeline_measurements_silver_to_gold(self, df_silver: DataFrame, batch_id: int) -> None:
-        df_gold = transform_silver_to_gold(df_silver)
-        self.gold_port.append(df_gold, self.gold_target_table)
+        # The gold measurements of the batch are used by the merge and both rollups, so they are only computed once
+        df_gold = keep_latest_transaction(transform_silver_to_gold(df_silver)).persist()
+        try:
+            self.gold_port.merge(df_gold, self.gold_target_table)
+            self._update_rollups(df_gold)
+        finally:
+            df_gold.unpersist()
+
+    def _update_rollups(self, df_gold: DataFrame) -> None:
+        # Only the hours and dates of the merged measurements are recalculated, from the merged gold measurements
+        # of the changed metering points and period
+        if not self.gold_hourly_target_table and not self.gold_daily_target_table:
+            return
+        changed_range = get_changed_range(df_gold)
+        if changed_range is None:
+            return
+
+        df_gold_measurements = self.gold_port.read(self.gold_target_table)
+        if self.gold_hourly_target_table:
+            self.gold_port.upsert(
+                calculate_hourly_rollup(df_gold_measurements, df_gold, changed_range),
+                self.gold_hourly_target_table,
+                [GoldMeasurementsColumnNames.metering_point_id, GoldMeasurementsColumnNames.observation_time],
+            )
+        if self.gold_daily_target_table:
+            self.gold_port.upsert(
+                calculate_daily_rollup(df_gold_measurements, df_gold, changed_range),
+                self.gold_daily_target_table,
+                [GoldMeasurementsColumnNames.metering_point_id, GoldMeasurementsColumnNames.local_date],
+            )
+
+
+def _get_slices(
+    range_start: datetime, range_end: datetime, slice_length: timedelta
+) -> Iterator[tuple[datetime, datetime]]:
+    slice_start = range_start
+    while slice_start < range_end:
+        slice_end = min(slice_start + slice_length, range_end)
+        yield slice_start, slice_end
+        slice_start = slice_end
@@ -8,3 +8,4 @@ class GoldMeasurementsColumnNames:
     transaction_creation_datetime = "transaction_creation_datetime"
     created = "created"
     modified = "modified"
+    local_date = "local_date"
@@ -0,0 +1,2 @@
+# The time zone of the local dates of the measurements
+LOCAL_TIME_ZONE = "Europe/Copenhagen"
@@ -1,4 +1,5 @@
 from pyspark.sql.types import (
+    DateType,
     DecimalType,
     StringType,
     StructField,
@@ -25,5 +26,6 @@ gold_measurements_schema = StructType(
         ),
         StructField(GoldMeasurementsColumnNames.created, TimestampType(), True),
         StructField(GoldMeasurementsColumnNames.modified, TimestampType(), True),
+        StructField(GoldMeasurementsColumnNames.local_date, DateType(), True),
     ]
 )
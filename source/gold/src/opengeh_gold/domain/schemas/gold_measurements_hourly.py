@@ -0,0 +1,21 @@
+from pyspark.sql.types import (
+    DecimalType,
+    StringType,
+    StructField,
+    StructType,
+    TimestampType,
+)
+
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import (
+    GoldMeasurementsColumnNames,
+)
+
+gold_measurements_hourly_schema = StructType(
+    [
+        StructField(GoldMeasurementsColumnNames.metering_point_id, StringType(), True),
+        StructField(GoldMeasurementsColumnNames.metering_point_type, StringType(), True),
+        StructField(GoldMeasurementsColumnNames.observation_time, TimestampType(), True),
+        StructField(GoldMeasurementsColumnNames.quantity, DecimalType(18, 3), True),
+        StructField(GoldMeasurementsColumnNames.modified, TimestampType(), True),
+    ]
+)
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import pyspark.sql.functions as F
+from pyspark.sql import Column, DataFrame
+from pyspark.sql.types import DecimalType
+
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import (
+    GoldMeasurementsColumnNames,
+)
+
+# More metering point ids than this are not listed in the filter of the gold measurements, which then only filters
+# by the period of the changed measurements
+MAX_METERING_POINT_IDS_IN_FILTER = 10_000
+
+
+@dataclass(frozen=True)
+class ChangedRange:
+    """The metering points and the period of the measurements that have been merged into the gold measurements.
+
+    Used to filter the gold measurements by their clustering columns before they are joined with the changed
+    measurements, so only the files of the changed metering points and period are read.
+    """
+
+    metering_point_ids: list[str] | None
+    first_observation_time: datetime
+    last_observation_time: datetime
+    first_local_date: date
+    last_local_date: date
+
+
+def get_changed_range(changed_measurements: DataFrame) -> ChangedRange | None:
+    """Get the range of the changed measurements, or None if there are no changed measurements.
+
+    The metering point ids are None if there are more than `MAX_METERING_POINT_IDS_IN_FILTER` of them.
+    """
+    bounds = changed_measurements.agg(
+        F.min(GoldMeasurementsColumnNames.observation_time).alias("first_observation_time"),
+        F.max(GoldMeasurementsColumnNames.observation_time).alias("last_observation_time"),
+        F.min(GoldMeasurementsColumnNames.local_date).alias("first_local_date"),
+        F.max(GoldMeasurementsColumnNames.local_date).alias("last_local_date"),
+        F.approx_count_distinct(GoldMeasurementsColumnNames.metering_point_id).alias("metering_points"),
+    ).first()
+    if bounds is None or bounds.first_observation_time is None:
+        return None
+
+    metering_point_ids = None
+    if bounds.metering_points <= MAX_METERING_POINT_IDS_IN_FILTER:
+        metering_point_ids = [
+            row[GoldMeasurementsColumnNames.metering_point_id]
+            for row in changed_measurements.select(GoldMeasurementsColumnNames.metering_point_id).distinct().collect()
+        ]
+    return ChangedRange(
+        metering_point_ids=metering_point_ids,
+        first_observation_time=bounds.first_observation_time,
+        last_observation_time=bounds.last_observation_time,
+        first_local_date=bounds.first_local_date,
+        last_local_date=bounds.last_local_date,
+    )
+
+
+def calculate_hourly_rollup(
+    gold_measurements: DataFrame, changed_measurements: DataFrame, changed_range: ChangedRange | None = None
+) -> DataFrame:
+    """Sum the gold measurements of the hours that have changed measurements.
+
+    The sums are calculated from all measurements of the changed hours, so the result replaces the earlier sums
+    of those hours.
+
+    Args:
+        gold_measurements (DataFrame): The gold measurements after the changed measurements have been merged.
+        changed_measurements (DataFrame): The measurements that have been merged into the gold measurements.
+        changed_range (ChangedRange | None, optional): The range of the changed measurements. When given, the gold
+            measurements are filtered to the changed metering points and hours before they are joined.
+    """
+    if changed_range is not None:
+        first_hour = changed_range.first_observation_time.replace(minute=0, second=0, microsecond=0)
+        last_hour = changed_range.last_observation_time.replace(minute=0, second=0, microsecond=0)
+        gold_measurements = _filter_changed_range(
+            gold_measurements, changed_range, first_hour, last_hour + timedelta(hours=1)
+        )
+
+    return _rollup(
+        gold_measurements,
+        changed_measurements,
+        F.date_trunc("hour", F.col(GoldMeasurementsColumnNames.observation_time)),
+        GoldMeasurementsColumnNames.observation_time,
+    )
+
+
+def calculate_daily_rollup(
+    gold_measurements: DataFrame, changed_measurements: DataFrame, changed_range: ChangedRange | None = None
+) -> DataFrame:
+    """Sum the gold measurements of the local dates that have changed measurements.
+
+    The sums are calculated from all measurements of the changed dates, so the result replaces the earlier sums
+    of those dates.
+
+    Args:
+        gold_measurements (DataFrame): The gold measurements after the changed measurements have been merged.
+        changed_measurements (DataFrame): The measurements that have been merged into the gold measurements.
+        changed_range (ChangedRange | None, optional): The range of the changed measurements. When given, the gold
+            measurements are filtered to the changed metering points and dates before they are joined.
+    """
+    if changed_range is not None:
+        # A local date is within a day of the UTC date, so the observation times of the changed dates are within
+        # these bounds, which the gold measurements are clustered by
+        gold_measurements = _filter_changed_range(
+            gold_measurements,
+            changed_range,
+            datetime.combine(changed_range.first_local_date, datetime.min.time()) - timedelta(days=1),
+            datetime.combine(changed_range.last_local_date, datetime.min.time()) + timedelta(days=2),
+        ).where(
+            F.col(GoldMeasurementsColumnNames.local_date).between(
+                F.lit(changed_range.first_local_date), F.lit(changed_range.last_local_date)
+            )
+        )
+
+    return _rollup(
+        gold_measurements,
+        changed_measurements,
+        F.col(GoldMeasurementsColumnNames.local_date),
+        GoldMeasurementsColumnNames.local_date,
+    )
+
+
+def _filter_changed_range(
+    gold_measurements: DataFrame, changed_range: ChangedRange, start: datetime, end: datetime
+) -> DataFrame:
+    observation_time = F.col(GoldMeasurementsColumnNames.observation_time)
+    gold_measurements = gold_measurements.where((observation_time >= F.lit(start)) & (observation_time < F.lit(end)))
+    if changed_range.metering_point_ids is not None:
+        gold_measurements = gold_measurements.where(
+            F.col(GoldMeasurementsColumnNames.metering_point_id).isin(changed_range.metering_point_ids)
+        )
+    return gold_measurements
+
+
+def _rollup(
+    gold_measurements: DataFrame, changed_measurements: DataFrame, bucket: Column, bucket_name: str
+) -> DataFrame:
+    changed_buckets = changed_measurements.select(
+        F.col(GoldMeasurementsColumnNames.metering_point_id),
+        bucket.alias(bucket_name),
+    ).distinct()
+
+    return (
+        gold_measurements.select(
+            F.col(GoldMeasurementsColumnNames.metering_point_id),
+            F.col(GoldMeasurementsColumnNames.metering_point_type),
+            bucket.alias(bucket_name),
+            F.col(GoldMeasurementsColumnNames.quantity),
+        )
+        .join(changed_buckets, on=[GoldMeasurementsColumnNames.metering_point_id, bucket_name], how="left_semi")
+        .groupBy(GoldMeasurementsColumnNames.metering_point_id, bucket_name)
+        .agg(
+            F.max(GoldMeasurementsColumnNames.metering_point_type).alias(
+                GoldMeasurementsColumnNames.metering_point_type
+            ),
+            F.sum(GoldMeasurementsColumnNames.quantity)
+            .cast(DecimalType(18, 3))
+            .alias(GoldMeasurementsColumnNames.quantity),
+        )
+        .select(
+            F.col(GoldMeasurementsColumnNames.metering_point_id),
+            F.col(GoldMeasurementsColumnNames.metering_point_type),
+            F.col(bucket_name),
+            F.col(GoldMeasurementsColumnNames.quantity),
+            F.current_timestamp().alias(GoldMeasurementsColumnNames.modified),
+        )
+    )
@@ -1,8 +1,8 @@
 ﻿from datetime import timedelta
 
 import pyspark.sql.functions as F
-from pyspark.sql import Column, DataFrame
-from pyspark.sql.types import TimestampType
+from pyspark.sql import Column, DataFrame, Window
+from pyspark.sql.types import ArrayType, TimestampType
 
 from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import (
     GoldMeasurementsColumnNames,
@@ -11,31 +11,24 @@ from opengeh_gold.domain.constants.column_names.silver_measurements_column_names
     SilverMeasurementsColumnNames,
 )
 from opengeh_gold.domain.constants.enums.resolutions import ResolutionEnum
+from opengeh_gold.domain.constants.time_zones import LOCAL_TIME_ZONE
+
+OBSERVATION_TIMES = "observation_times"
 
 
 def transform_silver_to_gold(df: DataFrame) -> DataFrame:
-    exploded_df = explode_silver_points(df)
+    # The observation times of all points are computed once per silver row, before the points are exploded.
+    exploded_df = explode_silver_points(df.withColumn(OBSERVATION_TIMES, get_observation_times()))
+
+    # Unknown resolutions have no observation times, so the start datetime is used
+    observation_time = F.coalesce(
+        F.get(F.col(OBSERVATION_TIMES), F.col(f"col.{SilverMeasurementsColumnNames.Points.position}") - 1),
+        F.col(SilverMeasurementsColumnNames.start_datetime),
+    )
 
     return exploded_df.select(
         F.col(SilverMeasurementsColumnNames.metering_point_id).alias(GoldMeasurementsColumnNames.metering_point_id),
-        (
-            # When monthly resolution
-            F.when(
-                F.col(SilverMeasurementsColumnNames.resolution) == ResolutionEnum.P1M.value,
-                _get_monthly_observation_time().cast(TimestampType()),
-            )
-            # When 15 minutes resolution
-            .when(
-                F.col(SilverMeasurementsColumnNames.resolution) == ResolutionEnum.PT15M.value,
-                _get_15_minutes_observation_time().cast(TimestampType()),
-            )
-            # When hourly resolution
-            .when(
-                F.col(SilverMeasurementsColumnNames.resolution) == ResolutionEnum.PT1H.value,
-                _get_hourly_observation_time().cast(TimestampType()),
-            )
-            .otherwise(F.col(SilverMeasurementsColumnNames.start_datetime))
-        ).alias(GoldMeasurementsColumnNames.observation_time),
+        observation_time.alias(GoldMeasurementsColumnNames.observation_time),
         F.col(f"col.{SilverMeasurementsColumnNames.Points.quantity}").alias(GoldMeasurementsColumnNames.quantity),
         F.col(f"col.{SilverMeasurementsColumnNames.Points.quality}").alias(GoldMeasurementsColumnNames.quality),
         F.col(SilverMeasurementsColumnNames.metering_point_type).alias(GoldMeasurementsColumnNames.metering_point_type),
@@ -45,44 +38,73 @@ def transform_silver_to_gold(df: DataFrame) -> DataFrame:
         ),
         F.current_timestamp().alias(GoldMeasurementsColumnNames.created),
         F.current_timestamp().alias(GoldMeasurementsColumnNames.modified),
+        get_local_date(observation_time).alias(GoldMeasurementsColumnNames.local_date),
     )
 
 
-def explode_silver_points(df: DataFrame) -> DataFrame:
-    return df.select("*", F.explode(F.col(SilverMeasurementsColumnNames.points))).drop(
-        SilverMeasurementsColumnNames.points
-    )
+def get_local_date(observation_time: Column) -> Column:
+    """Get the date of a UTC observation time in the local time zone.
+
+    The date is stored in gold, so downstream calculations can group and filter by day without converting every
+    observation time to local time.
+    """
+    return F.to_date(F.from_utc_timestamp(observation_time, LOCAL_TIME_ZONE))
+
 
+def get_observation_times() -> Column:
+    """Get the observation times of position 1 to the last position of the points in a silver row.
 
-def _get_monthly_observation_time() -> Column:
-    # When start_datetime = first day of month, add month based on its position value
+    The observation time of a point is the element at index `position - 1`. The result is null for unknown
+    resolutions.
+    """
+    last_position = F.greatest(
+        F.array_max(F.col(f"{SilverMeasurementsColumnNames.points}.{SilverMeasurementsColumnNames.Points.position}")),
+        F.lit(1),
+    )
+    resolution = F.col(SilverMeasurementsColumnNames.resolution)
     return (
-        F.when(
-            F.dayofmonth(F.col(SilverMeasurementsColumnNames.start_datetime)) == F.lit(1),
-            F.expr("add_months(start_datetime, (col.position - 1))"),
+        F.when(resolution == ResolutionEnum.P1M.value, _get_monthly_observation_times(last_position))
+        .when(
+            resolution == ResolutionEnum.PT15M.value,
+            _get_fixed_interval_observation_times(last_position, timedelta(minutes=15)),
         )
-        # Otherwise when not first of month
-        .otherwise(
-            # When first position => do nothing
-            F.when(
-                F.col(f"col.{SilverMeasurementsColumnNames.Points.position}") == F.lit(1),
-                F.col(SilverMeasurementsColumnNames.start_datetime),
-            ).otherwise(
-                # Otherwise add months based on its position value
-                F.expr("add_months(date_trunc('mon', start_datetime), (col.position - 1))")
-            )
+        .when(
+            resolution == ResolutionEnum.PT1H.value,
+            _get_fixed_interval_observation_times(last_position, timedelta(hours=1)),
         )
     )
 
 
-def _get_15_minutes_observation_time() -> Column:
-    return F.unix_timestamp(F.col(SilverMeasurementsColumnNames.start_datetime)) + (
-        (F.col(f"col.{SilverMeasurementsColumnNames.Points.position}") - F.lit(1))
-        * F.lit(timedelta(minutes=15).seconds)
+def keep_latest_transaction(df: DataFrame) -> DataFrame:
+    """Keep only the row with the newest transaction creation datetime per metering point and observation time."""
+    window = Window.partitionBy(
+        GoldMeasurementsColumnNames.metering_point_id, GoldMeasurementsColumnNames.observation_time
+    ).orderBy(F.col(GoldMeasurementsColumnNames.transaction_creation_datetime).desc())
+    return df.withColumn("row_number", F.row_number().over(window)).filter(F.col("row_number") == 1).drop("row_number")
+
+
+def explode_silver_points(df: DataFrame) -> DataFrame:
+    return df.select("*", F.explode(F.col(SilverMeasurementsColumnNames.points))).drop(
+        SilverMeasurementsColumnNames.points
     )
 
 
-def _get_hourly_observation_time() -> Column:
-    return F.unix_timestamp(F.col(SilverMeasurementsColumnNames.start_datetime)) + (
-        (F.col(f"col.{SilverMeasurementsColumnNames.Points.position}") - F.lit(1)) * F.lit(timedelta(hours=1).seconds)
+def _get_monthly_observation_times(last_position: Column) -> Column:
+    # Positions are whole months from the first day of the start month. When the start datetime is not the first
+    # day of a month, the first position is the start datetime itself.
+    start_datetime = F.col(SilverMeasurementsColumnNames.start_datetime)
+    start_month = F.trunc(start_datetime, "month")
+    months = F.sequence(start_month, F.add_months(start_month, last_position - 1), F.expr("INTERVAL 1 MONTH")).cast(
+        ArrayType(TimestampType())
     )
+    return F.when(
+        F.dayofmonth(start_datetime) != F.lit(1),
+        F.concat(F.array(start_datetime), F.slice(months, 2, last_position)),
+    ).otherwise(months)
+
+
+def _get_fixed_interval_observation_times(last_position: Column, interval: timedelta) -> Column:
+    start_datetime = F.col(SilverMeasurementsColumnNames.start_datetime)
+    step = F.make_dt_interval(secs=F.lit(interval.seconds))
+    end_datetime = start_datetime + F.make_dt_interval(secs=(last_position - 1) * F.lit(interval.seconds))
+    return F.sequence(start_datetime, end_datetime, step)
@@ -1,25 +1,70 @@
+import os
+import sys
+
+import telemetry_logging.logging_configuration as config
+
+import opengeh_gold.application.maintenance.maintain_tables as maintain_tables
 import opengeh_gold.migrations.migrations_runner as migrations_runner
+from opengeh_gold.application.config.backfill_arguments import parse_backfill_arguments
 from opengeh_gold.application.config.spark import initialize_spark
 from opengeh_gold.application.streams.measurements_silver_to_gold.measurements_stream_processor import (
     StreamProcessorMeasurements,
 )
 from opengeh_gold.infrastructure.adapters.delta_gold_adapter import DeltaGoldAdapter
 from opengeh_gold.infrastructure.adapters.delta_silver_adapter import DeltaSilverAdapter
+from opengeh_gold.infrastructure.config.streaming_settings import get_streaming_settings
 from opengeh_gold.infrastructure.config.table_names import TableNames
+from opengeh_gold.infrastructure.shared_helpers import EnvironmentVariable
 
 
 def migrate_gold() -> None:
     migrations_runner.migrate()
 
 
+def maintain() -> None:
+    maintain_tables.maintain(os.getenv(EnvironmentVariable.APPLICATIONINSIGHTS_CONNECTION_STRING.name))
+
+
 def stream_silver_to_gold_measurements() -> None:
+    # The streaming metrics are exported with the meter provider configured here
+    config.configure_logging(
+        cloud_role_name="dbr-measurements-gold",
+        tracer_name="silver-to-gold-measurements-job",
+        applicationinsights_connection_string=os.getenv(EnvironmentVariable.APPLICATIONINSIGHTS_CONNECTION_STRING.name),
+        extras={"Subsystem": "measurements"},
+    )
     spark = initialize_spark()
-    silver_adapter = DeltaSilverAdapter(spark)
-    gold_adapter = DeltaGoldAdapter()
+    streaming_settings = get_streaming_settings()
+    silver_adapter = DeltaSilverAdapter(spark, streaming_settings)
+    gold_adapter = DeltaGoldAdapter(streaming_settings)
 
     silver_source_table = TableNames.silver_measurements
     gold_target_table = TableNames.gold_measurements
     measurements_stream_processor = StreamProcessorMeasurements(
-        silver_adapter, silver_source_table, gold_adapter, gold_target_table
+        silver_adapter,
+        silver_source_table,
+        gold_adapter,
+        gold_target_table,
+        gold_hourly_target_table=TableNames.gold_measurements_hourly,
+        gold_daily_target_table=TableNames.gold_measurements_daily,
     )
     measurements_stream_processor.stream_measurements_silver_to_gold()
+
+
+def backfill_silver_to_gold_measurements() -> None:
+    backfill_arguments = parse_backfill_arguments(sys.argv[1:])
+    spark = initialize_spark()
+    measurements_stream_processor = StreamProcessorMeasurements(
+        DeltaSilverAdapter(spark),
+        TableNames.silver_measurements,
+        DeltaGoldAdapter(),
+        TableNames.gold_measurements,
+        gold_hourly_target_table=TableNames.gold_measurements_hourly,
+        gold_daily_target_table=TableNames.gold_measurements_daily,
+    )
+    measurements_stream_processor.backfill_measurements_silver_to_gold(
+        backfill_arguments.range_column,
+        backfill_arguments.range_start,
+        backfill_arguments.range_end,
+        backfill_arguments.slice_length,
+    )
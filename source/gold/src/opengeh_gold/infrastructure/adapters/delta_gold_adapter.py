@@ -1,19 +1,27 @@
-﻿from typing import Callable
+﻿from dataclasses import replace
+from typing import Callable
 
-from pyspark.sql import DataFrame
+from delta.tables import DeltaTable
+from pyspark.sql import DataFrame, SparkSession
 
 from opengeh_gold.application.ports.gold_port import GoldPort
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import GoldMeasurementsColumnNames
 from opengeh_gold.infrastructure.config.database_names import DatabaseNames
 from opengeh_gold.infrastructure.config.storage_container_names import StorageContainerNames
+from opengeh_gold.infrastructure.config.streaming_settings import StreamingSettings, TriggerType, get_streaming_settings
 from opengeh_gold.infrastructure.shared_helpers import (
     EnvironmentVariable,
     get_checkpoint_path,
     get_env_variable_or_throw,
     get_full_table_name,
 )
+from opengeh_gold.infrastructure.streaming_metrics_listener import StreamingMetricsListener
 
 
 class DeltaGoldAdapter(GoldPort):
+    def __init__(self, streaming_settings: StreamingSettings | None = None):
+        self.streaming_settings = streaming_settings or get_streaming_settings()
+
     def start_write_stream(
         self,
         df_source_stream: DataFrame,
@@ -24,17 +32,73 @@ class DeltaGoldAdapter(GoldPort):
     ) -> None:
         datalake_storage_account = get_env_variable_or_throw(EnvironmentVariable.DATALAKE_STORAGE_ACCOUNT)
         checkpoint_location = get_checkpoint_path(datalake_storage_account, StorageContainerNames.gold, table_name)
+        streaming_settings = self.streaming_settings
+        if terminate_on_empty:
+            streaming_settings = replace(streaming_settings, trigger_type=TriggerType.AVAILABLE_NOW)
+
+        streaming_settings.apply_scheduler_pool(df_source_stream.sparkSession)
         df_write_stream = (
             df_source_stream.writeStream.format("delta")
             .queryName(query_name)
             .option("checkpointLocation", checkpoint_location)
             .foreachBatch(batch_operation)
         )
-
-        if terminate_on_empty:
-            df_write_stream.trigger(availableNow=True).start().awaitTermination()
-        else:
-            df_write_stream.start().awaitTermination()
+        listener = StreamingMetricsListener(query_name, streaming_settings)
+        df_source_stream.sparkSession.streams.addListener(listener)
+        try:
+            streaming_settings.apply_trigger(df_write_stream).start().awaitTermination()
+        finally:
+            df_source_stream.sparkSession.streams.removeListener(listener)
 
     def append(self, df: DataFrame, table_name: str) -> None:
         df.write.format("delta").mode("append").saveAsTable(get_full_table_name(DatabaseNames.gold, table_name))
+
+    def merge(self, df: DataFrame, table_name: str) -> None:
+        key_columns = [GoldMeasurementsColumnNames.metering_point_id, GoldMeasurementsColumnNames.observation_time]
+        value_columns = [GoldMeasurementsColumnNames.quantity, GoldMeasurementsColumnNames.quality]
+        updated_columns = [
+            GoldMeasurementsColumnNames.quantity,
+            GoldMeasurementsColumnNames.quality,
+            GoldMeasurementsColumnNames.metering_point_type,
+            GoldMeasurementsColumnNames.transaction_id,
+            GoldMeasurementsColumnNames.transaction_creation_datetime,
+        ]
+        value_unchanged = " AND ".join(f"target.{column} <=> source.{column}" for column in value_columns)
+
+        target = DeltaTable.forName(df.sparkSession, get_full_table_name(DatabaseNames.gold, table_name))
+        (
+            target.alias("target")
+            .merge(df.alias("source"), " AND ".join(f"target.{column} = source.{column}" for column in key_columns))
+            .whenMatchedUpdate(
+                condition=f"source.{GoldMeasurementsColumnNames.transaction_creation_datetime} > "
+                f"target.{GoldMeasurementsColumnNames.transaction_creation_datetime}",
+                set={
+                    **{column: f"source.{column}" for column in updated_columns},
+                    GoldMeasurementsColumnNames.modified: f"CASE WHEN {value_unchanged} "
+                    f"THEN target.{GoldMeasurementsColumnNames.modified} "
+                    f"ELSE source.{GoldMeasurementsColumnNames.modified} END",
+                },
+            )
+            .whenNotMatchedInsertAll()
+            .execute()
+        )
+
+    def read(self, table_name: str) -> DataFrame:
+        return SparkSession.builder.getOrCreate().read.table(get_full_table_name(DatabaseNames.gold, table_name))
+
+    def upsert(self, df: DataFrame, table_name: str, key_columns: list[str]) -> None:
+        value_columns = [
+            column
+            for column in df.columns
+            if column not in key_columns and column != GoldMeasurementsColumnNames.modified
+        ]
+        value_changed = " OR ".join(f"NOT (target.{column} <=> source.{column})" for column in value_columns)
+
+        target = DeltaTable.forName(df.sparkSession, get_full_table_name(DatabaseNames.gold, table_name))
+        (
+            target.alias("target")
+            .merge(df.alias("source"), " AND ".join(f"target.{column} = source.{column}" for column in key_columns))
+            .whenMatchedUpdateAll(condition=value_changed or None)
+            .whenNotMatchedInsertAll()
+            .execute()
+        )
@@ -4,16 +4,22 @@ from pyspark.sql import DataFrame, SparkSession
 
 from opengeh_gold.application.ports.silver_port import SilverPort
 from opengeh_gold.infrastructure.config.database_names import DatabaseNames
+from opengeh_gold.infrastructure.config.streaming_settings import StreamingSettings, get_streaming_settings
 from opengeh_gold.infrastructure.shared_helpers import get_full_table_name
 
 
 class DeltaSilverAdapter(SilverPort):
-    def __init__(self, spark: SparkSession):
+    def __init__(self, spark: SparkSession, streaming_settings: StreamingSettings | None = None):
         self.spark = spark
+        self.streaming_settings = streaming_settings or get_streaming_settings()
 
     def read_stream(self, table_name: str, read_options: Optional[dict] = None) -> DataFrame:
         return (
             self.spark.readStream.format("delta")
+            .options(**self.streaming_settings.read_options())
             .options(**read_options or {})
             .table(get_full_table_name(DatabaseNames.silver, table_name))
         )
+
+    def read(self, table_name: str) -> DataFrame:
+        return self.spark.read.table(get_full_table_name(DatabaseNames.silver, table_name))
@@ -1,4 +1,6 @@
 class TableNames:
     gold_measurements = "measurements"
+    gold_measurements_hourly = "measurements_hourly"
+    gold_measurements_daily = "measurements_daily"
     silver_measurements = "measurements"
     executed_migrations = "executed_migrations"
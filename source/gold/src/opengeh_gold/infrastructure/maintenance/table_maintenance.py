@@ -0,0 +1,60 @@
+import logging
+from dataclasses import dataclass
+
+from pyspark.sql import SparkSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TableMaintenanceSettings:
+    """Maintenance thresholds of a Delta table.
+
+    OPTIMIZE compacts the small files written by the micro-batches of the streams, and incrementally clusters tables
+    that use liquid clustering. It only runs when the table has at least `min_num_files_to_optimize` files. VACUUM
+    always runs and removes the files that are older than the `delta.deletedFileRetentionDuration` of the table.
+    ANALYZE computes the statistics of `statistics_columns`, which the optimizer uses to estimate the filters and joins
+    of the calculations on them. Computing them scans the columns of the whole table, so it only runs after OPTIMIZE,
+    when enough data has been written since the last maintenance to change them.
+    """
+
+    table_name: str
+    min_num_files_to_optimize: int
+    statistics_columns: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TableDetail:
+    num_files: int
+    size_in_bytes: int
+
+
+def get_table_detail(spark: SparkSession, table_name: str) -> TableDetail:
+    detail = spark.sql(f"DESCRIBE DETAIL {table_name}").first()
+    return TableDetail(num_files=detail["numFiles"], size_in_bytes=detail["sizeInBytes"])
+
+
+def maintain_table(spark: SparkSession, settings: TableMaintenanceSettings) -> tuple[TableDetail, TableDetail]:
+    """Run OPTIMIZE, VACUUM and ANALYZE on a Delta table and log the change in its number of files and size.
+
+    Returns:
+        The details of the table before and after the maintenance.
+    """
+    before = get_table_detail(spark, settings.table_name)
+
+    optimize = before.num_files >= settings.min_num_files_to_optimize
+    if optimize:
+        spark.sql(f"OPTIMIZE {settings.table_name}")
+    spark.sql(f"VACUUM {settings.table_name}")
+    if optimize and settings.statistics_columns:
+        spark.sql(
+            f"ANALYZE TABLE {settings.table_name} COMPUTE STATISTICS FOR COLUMNS {', '.join(settings.statistics_columns)}"
+        )
+
+    after = get_table_detail(spark, settings.table_name)
+    logger.info(
+        f"Maintained {settings.table_name}: "
+        f"files {before.num_files} -> {after.num_files} ({after.num_files - before.num_files:+d}), "
+        f"bytes {before.size_in_bytes} -> {after.size_in_bytes} ({after.size_in_bytes - before.size_in_bytes:+d})"
+    )
+    return before, after
@@ -25,6 +25,13 @@ def get_full_table_name(database: str, table: str) -> str:
 
 class EnvironmentVariable(Enum):
     DATALAKE_STORAGE_ACCOUNT = "DATALAKE_STORAGE_ACCOUNT"
+    APPLICATIONINSIGHTS_CONNECTION_STRING = "APPLICATIONINSIGHTS_CONNECTION_STRING"
+    STREAMING_TRIGGER = "STREAMING_TRIGGER"
+    STREAMING_TRIGGER_INTERVAL = "STREAMING_TRIGGER_INTERVAL"
+    STREAMING_MAX_FILES_PER_TRIGGER = "STREAMING_MAX_FILES_PER_TRIGGER"
+    STREAMING_MAX_BYTES_PER_TRIGGER = "STREAMING_MAX_BYTES_PER_TRIGGER"
+    STREAMING_SCHEDULER_POOL = "STREAMING_SCHEDULER_POOL"
+    STREAMING_LATENCY_SLO_SECONDS = "STREAMING_LATENCY_SLO_SECONDS"
 
 
 def get_env_variable_or_throw(variable: EnvironmentVariable) -> Any:
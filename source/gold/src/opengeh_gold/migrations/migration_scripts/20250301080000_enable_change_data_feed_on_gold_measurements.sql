@@ -0,0 +1,4 @@
+ALTER TABLE {gold_database}.{gold_measurements}
+SET TBLPROPERTIES (
+    delta.enableChangeDataFeed = true
+)
@@ -0,0 +1,15 @@
+CREATE TABLE {gold_database}.{gold_measurements_daily}
+(
+    metering_point_id STRING,
+    metering_point_type STRING,
+    local_date DATE,
+    quantity DECIMAL(18, 3),
+    modified TIMESTAMP
+)
+USING DELTA
+TBLPROPERTIES (
+    delta.autoOptimize.optimizeWrite = true,
+    delta.autoOptimize.autoCompact = false,
+    delta.deletedFileRetentionDuration = 'interval 30 days'
+)
+CLUSTER BY (metering_point_id, local_date)
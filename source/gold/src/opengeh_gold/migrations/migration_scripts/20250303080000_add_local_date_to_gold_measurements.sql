@@ -0,0 +1,4 @@
+ALTER TABLE {gold_database}.{gold_measurements}
+ADD COLUMNS (
+    local_date DATE
+)
@@ -0,0 +1,3 @@
+UPDATE {gold_database}.{gold_measurements}
+SET local_date = to_date(from_utc_timestamp(observation_time, 'Europe/Copenhagen'))
+WHERE local_date IS NULL
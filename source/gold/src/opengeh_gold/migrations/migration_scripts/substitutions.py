@@ -6,4 +6,6 @@ def substitutions() -> dict[str, str]:
     return {
         "{gold_database}": DatabaseNames.gold,
         "{gold_measurements}": TableNames.gold_measurements,
+        "{gold_measurements_hourly}": TableNames.gold_measurements_hourly,
+        "{gold_measurements_daily}": TableNames.gold_measurements_daily,
     }
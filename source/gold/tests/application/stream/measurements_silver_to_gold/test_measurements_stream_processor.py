@@ -1,5 +1,7 @@
-from unittest.mock import Mock
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
 
+import pytest
 from pyspark.sql import SparkSession
 
 from opengeh_gold.application.ports.gold_port import GoldPort
@@ -33,7 +35,7 @@ def test__stream_processor_measurements__calls_expected(spark: SparkSession):
     )
 
 
-def test__pipeline_measurements_silver_to_gold__calls_append_to_gold_measurements(spark: SparkSession):
+def test__pipeline_measurements_silver_to_gold__calls_merge_to_gold_measurements(spark: SparkSession):
     # Arrange
     silver_port_mock = Mock(spec=SilverPort)
     gold_port_mock = Mock(spec=GoldPort)
@@ -49,4 +51,93 @@ def test__pipeline_measurements_silver_to_gold__calls_append_to_gold_measurement
     stream_processor.pipeline_measurements_silver_to_gold(df_silver_mock, batch_id)
 
     # Assert
-    gold_port_mock.append.assert_called_once()
+    gold_port_mock.merge.assert_called_once()
+    gold_port_mock.append.assert_not_called()
+
+
+@patch("opengeh_gold.application.streams.measurements_silver_to_gold.measurements_stream_processor.get_changed_range")
+def test__pipeline_measurements_silver_to_gold__with_rollup_tables__calls_upsert_to_rollups(
+    mock_get_changed_range, spark: SparkSession
+):
+    # Arrange
+    silver_port_mock = Mock(spec=SilverPort)
+    gold_port_mock = Mock(spec=GoldPort)
+    stream_processor = StreamProcessorMeasurements(
+        silver_port_mock,
+        TableNames.silver_measurements,
+        gold_port_mock,
+        TableNames.gold_measurements,
+        gold_hourly_target_table=TableNames.gold_measurements_hourly,
+        gold_daily_target_table=TableNames.gold_measurements_daily,
+    )
+    df_silver_mock = Mock()
+    batch_id = 0
+
+    # Act
+    stream_processor.pipeline_measurements_silver_to_gold(df_silver_mock, batch_id)
+
+    # Assert
+    gold_port_mock.merge.assert_called_once()
+    gold_port_mock.read.assert_called_once_with(TableNames.gold_measurements)
+    assert [call.args[1] for call in gold_port_mock.upsert.call_args_list] == [
+        TableNames.gold_measurements_hourly,
+        TableNames.gold_measurements_daily,
+    ]
+
+
+@patch(
+    "opengeh_gold.application.streams.measurements_silver_to_gold.measurements_stream_processor.get_changed_range",
+    return_value=None,
+)
+def test__pipeline_measurements_silver_to_gold__when_no_measurements_changed__does_not_update_rollups(
+    mock_get_changed_range, spark: SparkSession
+):
+    # Arrange
+    gold_port_mock = Mock(spec=GoldPort)
+    stream_processor = StreamProcessorMeasurements(
+        Mock(spec=SilverPort),
+        TableNames.silver_measurements,
+        gold_port_mock,
+        TableNames.gold_measurements,
+        gold_hourly_target_table=TableNames.gold_measurements_hourly,
+        gold_daily_target_table=TableNames.gold_measurements_daily,
+    )
+
+    # Act
+    stream_processor.pipeline_measurements_silver_to_gold(Mock(), 0)
+
+    # Assert
+    gold_port_mock.read.assert_not_called()
+    gold_port_mock.upsert.assert_not_called()
+
+
+def test__backfill_measurements_silver_to_gold__merges_each_slice_without_starting_stream(spark: SparkSession):
+    # Arrange
+    silver_port_mock = Mock(spec=SilverPort)
+    gold_port_mock = Mock(spec=GoldPort)
+    stream_processor = StreamProcessorMeasurements(
+        silver_port_mock, TableNames.silver_measurements, gold_port_mock, TableNames.gold_measurements
+    )
+
+    # Act
+    stream_processor.backfill_measurements_silver_to_gold(
+        "start_datetime", datetime(2025, 1, 1), datetime(2025, 1, 3, 12), timedelta(days=1)
+    )
+
+    # Assert
+    silver_port_mock.read.assert_called_once_with(TableNames.silver_measurements)
+    silver_port_mock.read_stream.assert_not_called()
+    gold_port_mock.start_write_stream.assert_not_called()
+    assert silver_port_mock.read.return_value.where.call_count == 3
+    assert gold_port_mock.merge.call_count == 3
+
+
+def test__backfill_measurements_silver_to_gold__when_range_column_is_not_supported__raises(spark: SparkSession):
+    # Arrange
+    stream_processor = StreamProcessorMeasurements(
+        Mock(spec=SilverPort), TableNames.silver_measurements, Mock(spec=GoldPort), TableNames.gold_measurements
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        stream_processor.backfill_measurements_silver_to_gold("created", datetime(2025, 1, 1), datetime(2025, 1, 2))
@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from pyspark.sql import SparkSession
+from pyspark.sql.streaming import StreamingQueryListener
+
+from opengeh_gold.infrastructure.config.database_names import DatabaseNames
+from opengeh_gold.infrastructure.config.table_names import TableNames
+
+BENCHMARK_OUTPUT_PATH = os.getenv("BENCHMARK_OUTPUT_PATH", "benchmark-results")
+GOLD_TABLE_NAMES = [
+    TableNames.gold_measurements,
+    TableNames.gold_measurements_hourly,
+    TableNames.gold_measurements_daily,
+]
+
+
+class StreamingProgressCollector(StreamingQueryListener):
+    """Collects the progress of the micro-batches of the silver to gold stream.
+
+    Listener events are delivered asynchronously, so `wait_for_termination` must be called before the progress is
+    read.
+    """
+
+    def __init__(self, query_name: str) -> None:
+        self.query_name = query_name
+        self.batch_durations_ms: list[int] = []
+        self.input_rows = 0
+        self._terminated = threading.Event()
+        self._query_id = None
+
+    def onQueryStarted(self, event) -> None:
+        if event.name == self.query_name:
+            self._query_id = event.id
+
+    def onQueryProgress(self, event) -> None:
+        if event.progress.id != self._query_id:
+            return
+        self.batch_durations_ms.append(event.progress.durationMs.get("triggerExecution", 0))
+        self.input_rows += event.progress.numInputRows
+
+    def onQueryIdle(self, event) -> None:
+        pass
+
+    def onQueryTerminated(self, event) -> None:
+        if event.id == self._query_id:
+            self._terminated.set()
+
+    def wait_for_termination(self, timeout_seconds: float = 60) -> None:
+        if not self._terminated.wait(timeout_seconds):
+            raise TimeoutError(f"No termination event received for query {self.query_name}")
+
+
+@dataclass
+class GoldBenchmarkResult:
+    """The throughput of the silver to gold stream.
+
+    A silver transaction is exploded to a gold row per point, and every micro-batch also updates the hourly and
+    daily rollups, so the rows and files of all three tables are reported.
+    """
+
+    name: str
+    scale: dict
+    silver_transactions: int
+    gold_rows: dict
+    duration_seconds: float
+    batches: int
+    batch_latency_ms: dict
+    output_files: dict
+    spark_version: str
+    created: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @property
+    def points_per_second(self) -> float:
+        points = self.gold_rows.get(TableNames.gold_measurements, 0)
+        return round(points / self.duration_seconds, 1) if self.duration_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "points_per_second": self.points_per_second}
+
+    def write(self, output_path: str = BENCHMARK_OUTPUT_PATH) -> str:
+        os.makedirs(output_path, exist_ok=True)
+        file_path = os.path.join(output_path, f"{self.name}.json")
+        with open(file_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+        return file_path
+
+
+def percentiles(values: list[int]) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {f"p{p}": ordered[round(p / 100 * (len(ordered) - 1))] for p in (50, 90, 95, 99)}
+    result["max"] = ordered[-1]
+    return result
+
+
+def run_gold_stream_benchmark(
+    spark: SparkSession, name: str, query_name: str, run_stream, scale: dict
+) -> GoldBenchmarkResult:
+    """Run the stream until it terminates and measure its throughput, batch latency and the output of each table."""
+    rows_before = {table_name: _count_rows(spark, table_name) for table_name in GOLD_TABLE_NAMES}
+    collector = StreamingProgressCollector(query_name)
+    spark.streams.addListener(collector)
+    try:
+        started = time.perf_counter()
+        run_stream()
+        duration_seconds = time.perf_counter() - started
+        collector.wait_for_termination()
+    finally:
+        spark.streams.removeListener(collector)
+
+    return GoldBenchmarkResult(
+        name=name,
+        scale=scale,
+        silver_transactions=collector.input_rows,
+        gold_rows={
+            table_name: _count_rows(spark, table_name) - rows_before[table_name] for table_name in GOLD_TABLE_NAMES
+        },
+        duration_seconds=round(duration_seconds, 3),
+        batches=len(collector.batch_durations_ms),
+        batch_latency_ms=percentiles(collector.batch_durations_ms),
+        output_files={table_name: _count_files(spark, table_name) for table_name in GOLD_TABLE_NAMES},
+        spark_version=spark.version,
+    )
+
+
+def _count_rows(spark: SparkSession, table_name: str) -> int:
+    return spark.read.table(f"{DatabaseNames.gold}.{table_name}").count()
+
+
+def _count_files(spark: SparkSession, table_name: str) -> int:
+    return spark.sql(f"DESCRIBE DETAIL {DatabaseNames.gold}.{table_name}").collect()[0]["numFiles"]
@@ -0,0 +1,112 @@
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from functools import reduce
+
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import DecimalType, IntegerType, TimestampType
+
+from opengeh_gold.domain.constants.column_names.silver_measurements_column_names import (
+    SilverMeasurementsColumnNames,
+)
+
+# Danish midnight of 2024-01-01 in UTC
+START_DATETIME = datetime(2023, 12, 31, 23)
+
+POINTS_PER_DAY = {"PT15M": 96, "PT1H": 24}
+POINT_COUNT = "point_count"
+RESOLUTION_INDEX = "resolution_index"
+SUBMISSION = "submission"
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """The size of the generated silver measurements: one transaction per metering point, day and resolution.
+
+    Every resolution gets its own metering points, so no observation times overlap. P1M transactions cover the whole
+    period with one point per month. Every transaction is submitted again `resubmissions` times with a later
+    creation time and other quantities, so only the latest submission of each point ends up in gold.
+    """
+
+    metering_points: int
+    days: int
+    resolutions: tuple[str, ...]
+    resubmissions: int
+
+    @staticmethod
+    def from_env() -> "BenchmarkScale":
+        return BenchmarkScale(
+            metering_points=int(os.getenv("BENCHMARK_METERING_POINTS", "1000")),
+            days=int(os.getenv("BENCHMARK_DAYS", "7")),
+            resolutions=tuple(os.getenv("BENCHMARK_RESOLUTIONS", "PT15M,PT1H,P1M").split(",")),
+            resubmissions=int(os.getenv("BENCHMARK_RESUBMISSIONS", "0")),
+        )
+
+
+def generate_silver_measurements(spark: SparkSession, scale: BenchmarkScale) -> DataFrame:
+    periods = reduce(
+        DataFrame.unionByName,
+        [_periods(spark, resolution, index, scale.days) for index, resolution in enumerate(scale.resolutions)],
+    )
+    metering_point_number = F.col("id") + F.col(RESOLUTION_INDEX) * F.lit(scale.metering_points)
+
+    return (
+        spark.range(scale.metering_points)
+        .crossJoin(periods)
+        .crossJoin(spark.range(scale.resubmissions + 1).withColumnRenamed("id", SUBMISSION))
+        .withColumn(SilverMeasurementsColumnNames.metering_point_id, F.format_string("57%016d", metering_point_number))
+        .select(
+            F.lit("calculated").alias(SilverMeasurementsColumnNames.orchestration_type),
+            F.expr("uuid()").alias(SilverMeasurementsColumnNames.orchestration_instance_id),
+            F.col(SilverMeasurementsColumnNames.metering_point_id),
+            F.expr("uuid()").alias(SilverMeasurementsColumnNames.transaction_id),
+            (F.lit(START_DATETIME) + F.make_dt_interval(secs=F.col(SUBMISSION))).alias(
+                SilverMeasurementsColumnNames.transaction_creation_datetime
+            ),
+            F.lit("consumption").alias(SilverMeasurementsColumnNames.metering_point_type),
+            F.lit("energy_active").alias(SilverMeasurementsColumnNames.product),
+            F.lit("kWh").alias(SilverMeasurementsColumnNames.unit),
+            F.col(SilverMeasurementsColumnNames.resolution),
+            F.col(SilverMeasurementsColumnNames.start_datetime),
+            F.col(SilverMeasurementsColumnNames.end_datetime),
+            F.transform(F.sequence(F.lit(1), F.col(POINT_COUNT)), _point).alias(SilverMeasurementsColumnNames.points),
+            F.current_timestamp().alias(SilverMeasurementsColumnNames.created),
+        )
+    )
+
+
+def _periods(spark: SparkSession, resolution: str, resolution_index: int, days: int) -> DataFrame:
+    start_datetime = F.lit(START_DATETIME)
+    if resolution in POINTS_PER_DAY:
+        return spark.range(days).select(
+            F.lit(resolution).alias(SilverMeasurementsColumnNames.resolution),
+            F.lit(resolution_index).alias(RESOLUTION_INDEX),
+            (start_datetime + F.make_dt_interval(days=F.col("id").cast(IntegerType()))).alias(
+                SilverMeasurementsColumnNames.start_datetime
+            ),
+            (start_datetime + F.make_dt_interval(days=(F.col("id") + 1).cast(IntegerType()))).alias(
+                SilverMeasurementsColumnNames.end_datetime
+            ),
+            F.lit(POINTS_PER_DAY[resolution]).alias(POINT_COUNT),
+        )
+
+    months = max(1, days // 30)
+    return spark.range(1).select(
+        F.lit(resolution).alias(SilverMeasurementsColumnNames.resolution),
+        F.lit(resolution_index).alias(RESOLUTION_INDEX),
+        start_datetime.alias(SilverMeasurementsColumnNames.start_datetime),
+        F.add_months(start_datetime, months).cast(TimestampType()).alias(SilverMeasurementsColumnNames.end_datetime),
+        F.lit(months).alias(POINT_COUNT),
+    )
+
+
+def _point(position: Column) -> Column:
+    metering_point_id = F.col(SilverMeasurementsColumnNames.metering_point_id)
+    return F.struct(
+        position.cast(IntegerType()).alias(SilverMeasurementsColumnNames.Points.position),
+        (F.pmod(F.hash(metering_point_id, F.col(SUBMISSION)) + position, F.lit(1_000_000)) / 1000)
+        .cast(DecimalType(18, 3))
+        .alias(SilverMeasurementsColumnNames.Points.quantity),
+        F.lit("measured").alias(SilverMeasurementsColumnNames.Points.quality),
+    )
@@ -0,0 +1,72 @@
+import os
+from dataclasses import asdict
+from unittest import mock
+
+import pyspark.sql.functions as F
+import pytest
+from pyspark.sql import SparkSession
+
+from opengeh_gold.application.streams.measurements_silver_to_gold.measurements_stream_processor import (
+    StreamProcessorMeasurements,
+)
+from opengeh_gold.infrastructure.adapters.delta_gold_adapter import DeltaGoldAdapter
+from opengeh_gold.infrastructure.adapters.delta_silver_adapter import DeltaSilverAdapter
+from opengeh_gold.infrastructure.config.database_names import DatabaseNames
+from opengeh_gold.infrastructure.config.streaming_settings import StreamingSettings, TriggerType
+from opengeh_gold.infrastructure.config.table_names import TableNames
+from tests.benchmarks.benchmark_report import run_gold_stream_benchmark
+from tests.benchmarks.synthetic_data import BenchmarkScale, generate_silver_measurements
+
+# Run with `RUN_BENCHMARKS=1 pytest tests/benchmarks`. The scale is set with `BENCHMARK_METERING_POINTS`,
+# `BENCHMARK_DAYS`, `BENCHMARK_RESOLUTIONS` and `BENCHMARK_RESUBMISSIONS`, and the result is written as JSON to
+# `BENCHMARK_OUTPUT_PATH`.
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="Benchmarks only run when RUN_BENCHMARKS is set")
+@mock.patch.dict("os.environ", {"DATALAKE_STORAGE_ACCOUNT": "benchmark"})
+@mock.patch("opengeh_gold.infrastructure.adapters.delta_gold_adapter.get_checkpoint_path")
+def test__measurements_stream_benchmark__should_process_all_silver_rows(
+    mock_get_checkpoint_path,
+    spark: SparkSession,
+    migrations_executed,
+    create_silver_tables,
+    tmp_path,
+    record_property,
+) -> None:
+    # Arrange
+    scale = BenchmarkScale.from_env()
+    df_silver = generate_silver_measurements(spark, scale)
+    df_silver.write.format("delta").mode("append").saveAsTable(
+        f"{DatabaseNames.silver}.{TableNames.silver_measurements}"
+    )
+    silver_rows = spark.read.table(f"{DatabaseNames.silver}.{TableNames.silver_measurements}").count()
+    generated_points = (
+        spark.read.table(f"{DatabaseNames.silver}.{TableNames.silver_measurements}")
+        .filter(F.col("orchestration_type") == "calculated")
+        .select(F.sum(F.size("points")))
+        .collect()[0][0]
+    )
+    # Resubmissions replace the points of their transaction, so gold gets the points of one submission
+    expected_points = generated_points // (scale.resubmissions + 1)
+    mock_get_checkpoint_path.return_value = str(tmp_path / "checkpoint")
+    streaming_settings = StreamingSettings(trigger_type=TriggerType.AVAILABLE_NOW)
+    stream_processor = StreamProcessorMeasurements(
+        DeltaSilverAdapter(spark, streaming_settings),
+        TableNames.silver_measurements,
+        DeltaGoldAdapter(streaming_settings),
+        TableNames.gold_measurements,
+    )
+
+    # Act
+    result = run_gold_stream_benchmark(
+        spark,
+        name="silver_measurements_to_gold_measurements",
+        query_name=stream_processor.query_name,
+        run_stream=stream_processor.stream_measurements_silver_to_gold,
+        scale=asdict(scale),
+    )
+    record_property("benchmark_result", result.write())
+
+    # Assert
+    assert result.silver_transactions == silver_rows
+    assert result.gold_rows[TableNames.gold_measurements] >= expected_points
@@ -0,0 +1,140 @@
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pyspark.sql.functions as F
+import pytest
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql.types import DecimalType, TimestampType
+
+from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import GoldMeasurementsColumnNames
+from opengeh_gold.domain.constants.column_names.silver_measurements_column_names import (
+    SilverMeasurementsColumnNames,
+)
+from opengeh_gold.domain.constants.enums.resolutions import ResolutionEnum
+from opengeh_gold.domain.streams.silver_to_gold.transformations import (
+    OBSERVATION_TIMES,
+    explode_silver_points,
+    get_observation_times,
+)
+
+# Micro-benchmark of the observation time computation against the per point implementation it replaced.
+# Run with `RUN_BENCHMARKS=1 pytest tests/benchmarks -k observation_time`. The timings are recorded as test
+# properties, so they end up in the JUnit XML report when pytest is run with `--junitxml`.
+BENCHMARK_ROWS = int(os.getenv("BENCHMARK_ROWS", "20000"))
+BENCHMARK_RUNS = int(os.getenv("BENCHMARK_RUNS", "3"))
+
+POSITION = f"col.{SilverMeasurementsColumnNames.Points.position}"
+
+
+def _create_silver_rows(spark: SparkSession, rows: int) -> DataFrame:
+    resolutions = F.array(*[F.lit(resolution.value) for resolution in ResolutionEnum])
+    points_per_resolution = F.create_map(
+        F.lit(ResolutionEnum.PT15M.value), F.lit(96), F.lit(ResolutionEnum.PT1H.value), F.lit(24),
+        F.lit(ResolutionEnum.P1M.value), F.lit(12),
+    )  # fmt: skip
+    resolution = F.element_at(resolutions, (F.col("id") % 3 + 1).cast("int"))
+    return (
+        spark.range(rows)
+        .select(
+            F.col("id").cast("string").alias(SilverMeasurementsColumnNames.metering_point_id),
+            resolution.alias(SilverMeasurementsColumnNames.resolution),
+            (F.lit(datetime(2024, 1, 1, 23)) + F.make_dt_interval(days=(F.col("id") % 365).cast("int")))
+            .cast(TimestampType())
+            .alias(SilverMeasurementsColumnNames.start_datetime),
+        )
+        .withColumn(
+            SilverMeasurementsColumnNames.points,
+            F.transform(
+                F.sequence(F.lit(1), points_per_resolution[F.col(SilverMeasurementsColumnNames.resolution)]),
+                lambda position: F.struct(
+                    position.alias(SilverMeasurementsColumnNames.Points.position),
+                    F.lit(Decimal("1.000"))
+                    .cast(DecimalType(18, 3))
+                    .alias(SilverMeasurementsColumnNames.Points.quantity),
+                    F.lit("measured").alias(SilverMeasurementsColumnNames.Points.quality),
+                ),
+            ),
+        )
+        .cache()
+    )
+
+
+def _per_point_observation_time() -> Column:
+    """The observation time expression evaluated per exploded point before the timeline was introduced."""
+    start_datetime = F.col(SilverMeasurementsColumnNames.start_datetime)
+    resolution = F.col(SilverMeasurementsColumnNames.resolution)
+    monthly = F.when(
+        F.dayofmonth(start_datetime) == F.lit(1),
+        F.expr("add_months(start_datetime, (col.position - 1))"),
+    ).otherwise(
+        F.when(F.col(POSITION) == F.lit(1), start_datetime).otherwise(
+            F.expr("add_months(date_trunc('mon', start_datetime), (col.position - 1))")
+        )
+    )
+    return (
+        F.when(resolution == ResolutionEnum.P1M.value, monthly.cast(TimestampType()))
+        .when(
+            resolution == ResolutionEnum.PT15M.value,
+            (F.unix_timestamp(start_datetime) + (F.col(POSITION) - 1) * F.lit(timedelta(minutes=15).seconds)).cast(
+                TimestampType()
+            ),
+        )
+        .when(
+            resolution == ResolutionEnum.PT1H.value,
+            (F.unix_timestamp(start_datetime) + (F.col(POSITION) - 1) * F.lit(timedelta(hours=1).seconds)).cast(
+                TimestampType()
+            ),
+        )
+        .otherwise(start_datetime)
+    )
+
+
+def _per_point(df_silver: DataFrame) -> DataFrame:
+    return explode_silver_points(df_silver).select(
+        F.col(SilverMeasurementsColumnNames.metering_point_id),
+        F.col(POSITION),
+        _per_point_observation_time().alias(GoldMeasurementsColumnNames.observation_time),
+    )
+
+
+def _timeline(df_silver: DataFrame) -> DataFrame:
+    return explode_silver_points(df_silver.withColumn(OBSERVATION_TIMES, get_observation_times())).select(
+        F.col(SilverMeasurementsColumnNames.metering_point_id),
+        F.col(POSITION),
+        F.coalesce(
+            F.get(F.col(OBSERVATION_TIMES), F.col(POSITION) - 1), F.col(SilverMeasurementsColumnNames.start_datetime)
+        ).alias(GoldMeasurementsColumnNames.observation_time),
+    )
+
+
+def _best_duration_seconds(df: DataFrame) -> float:
+    durations = []
+    for _ in range(BENCHMARK_RUNS):
+        started = time.perf_counter()
+        df.write.format("noop").mode("overwrite").save()
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="Benchmarks only run when RUN_BENCHMARKS is set")
+def test__observation_time_benchmark__timeline_and_per_point__should_return_same_observation_times(
+    spark: SparkSession, record_property
+) -> None:
+    # Arrange
+    df_silver = _create_silver_rows(spark, BENCHMARK_ROWS)
+    df_silver.count()
+    df_per_point = _per_point(df_silver)
+    df_timeline = _timeline(df_silver)
+
+    # Act
+    per_point_seconds = _best_duration_seconds(df_per_point)
+    timeline_seconds = _best_duration_seconds(df_timeline)
+
+    # Assert
+    record_property("silver_rows", BENCHMARK_ROWS)
+    record_property("per_point_seconds", round(per_point_seconds, 3))
+    record_property("timeline_seconds", round(timeline_seconds, 3))
+    assert df_per_point.exceptAll(df_timeline).count() == 0
+    assert df_timeline.exceptAll(df_per_point).count() == 0
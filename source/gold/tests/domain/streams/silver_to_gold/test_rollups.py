@@ -0,0 +1,165 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from pyspark.sql import SparkSession
+
+from opengeh_gold.domain.streams.silver_to_gold.rollups import (
+    calculate_daily_rollup,
+    calculate_hourly_rollup,
+    get_changed_range,
+)
+from tests.helpers.gold_builder import GoldMeasurementsDataFrameBuilder
+
+
+def test__calculate_hourly_rollup__sums_all_points_of_changed_hours(spark: SparkSession) -> None:
+    # Arrange
+    df_gold = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12), quantity=Decimal("1.000"))
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 15), quantity=Decimal("2.000"))
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 13), quantity=Decimal("4.000"))
+        .add_row(metering_point_id="2", observation_time=datetime(2025, 1, 1, 12), quantity=Decimal("8.000"))
+        .build()
+    )
+    df_changed = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 15), quantity=Decimal("2.000"))
+        .build()
+    )
+
+    # Act
+    actual = calculate_hourly_rollup(df_gold, df_changed).collect()
+
+    # Assert
+    assert len(actual) == 1
+    assert actual[0].metering_point_id == "1"
+    assert actual[0].observation_time == datetime(2025, 1, 1, 12)
+    assert actual[0].quantity == Decimal("3.000")
+
+
+def test__calculate_daily_rollup__sums_all_points_of_changed_local_dates(spark: SparkSession) -> None:
+    # Arrange
+    df_gold = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", quantity=Decimal("1.000"), local_date=date(2025, 1, 1))
+        .add_row(metering_point_id="1", quantity=Decimal("2.000"), local_date=date(2025, 1, 1))
+        .add_row(metering_point_id="1", quantity=Decimal("4.000"), local_date=date(2025, 1, 2))
+        .add_row(metering_point_id="2", quantity=Decimal("8.000"), local_date=date(2025, 1, 1))
+        .build()
+    )
+    df_changed = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", quantity=Decimal("2.000"), local_date=date(2025, 1, 1))
+        .build()
+    )
+
+    # Act
+    actual = calculate_daily_rollup(df_gold, df_changed).collect()
+
+    # Assert
+    assert len(actual) == 1
+    assert actual[0].local_date == date(2025, 1, 1)
+    assert actual[0].quantity == Decimal("3.000")
+
+
+def test__get_changed_range__returns_metering_points_and_period_of_changed_measurements(spark: SparkSession) -> None:
+    # Arrange
+    df_changed = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 15), local_date=date(2025, 1, 1))
+        .add_row(metering_point_id="2", observation_time=datetime(2025, 1, 2, 23), local_date=date(2025, 1, 3))
+        .build()
+    )
+
+    # Act
+    actual = get_changed_range(df_changed)
+
+    # Assert
+    assert actual is not None
+    assert sorted(actual.metering_point_ids) == ["1", "2"]
+    assert actual.first_observation_time == datetime(2025, 1, 1, 12, 15)
+    assert actual.last_observation_time == datetime(2025, 1, 2, 23)
+    assert actual.first_local_date == date(2025, 1, 1)
+    assert actual.last_local_date == date(2025, 1, 3)
+
+
+def test__get_changed_range__when_no_changed_measurements__returns_none(spark: SparkSession) -> None:
+    # Arrange
+    df_changed = GoldMeasurementsDataFrameBuilder(spark).build()
+
+    # Act
+    actual = get_changed_range(df_changed)
+
+    # Assert
+    assert actual is None
+
+
+def test__calculate_hourly_rollup__with_changed_range__sums_all_points_of_changed_hours(spark: SparkSession) -> None:
+    # Arrange
+    df_gold = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12), quantity=Decimal("1.000"))
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 15), quantity=Decimal("2.000"))
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 45), quantity=Decimal("4.000"))
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 13), quantity=Decimal("8.000"))
+        .build()
+    )
+    df_changed = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(metering_point_id="1", observation_time=datetime(2025, 1, 1, 12, 15), quantity=Decimal("2.000"))
+        .build()
+    )
+
+    # Act
+    actual = calculate_hourly_rollup(df_gold, df_changed, get_changed_range(df_changed)).collect()
+
+    # Assert
+    assert len(actual) == 1
+    assert actual[0].observation_time == datetime(2025, 1, 1, 12)
+    assert actual[0].quantity == Decimal("7.000")
+
+
+def test__calculate_daily_rollup__with_changed_range__sums_all_points_of_changed_local_dates(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    df_gold = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            metering_point_id="1",
+            observation_time=datetime(2024, 12, 31, 23),
+            quantity=Decimal("1.000"),
+            local_date=date(2025, 1, 1),
+        )
+        .add_row(
+            metering_point_id="1",
+            observation_time=datetime(2025, 1, 1, 22),
+            quantity=Decimal("2.000"),
+            local_date=date(2025, 1, 1),
+        )
+        .add_row(
+            metering_point_id="1",
+            observation_time=datetime(2025, 1, 1, 23),
+            quantity=Decimal("4.000"),
+            local_date=date(2025, 1, 2),
+        )
+        .build()
+    )
+    df_changed = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            metering_point_id="1",
+            observation_time=datetime(2025, 1, 1, 22),
+            quantity=Decimal("2.000"),
+            local_date=date(2025, 1, 1),
+        )
+        .build()
+    )
+
+    # Act
+    actual = calculate_daily_rollup(df_gold, df_changed, get_changed_range(df_changed)).collect()
+
+    # Assert
+    assert len(actual) == 1
+    assert actual[0].local_date == date(2025, 1, 1)
+    assert actual[0].quantity == Decimal("3.000")
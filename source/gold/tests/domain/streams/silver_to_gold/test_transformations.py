@@ -7,7 +7,11 @@ from pyspark.sql import SparkSession
 
 from opengeh_gold.domain.constants.column_names.gold_measurements_column_names import GoldMeasurementsColumnNames
 from opengeh_gold.domain.schemas.gold_measurements import gold_measurements_schema
-from opengeh_gold.domain.streams.silver_to_gold.transformations import transform_silver_to_gold
+from opengeh_gold.domain.streams.silver_to_gold.transformations import (
+    keep_latest_transaction,
+    transform_silver_to_gold,
+)
+from tests.helpers.gold_builder import GoldMeasurementsDataFrameBuilder
 from tests.helpers.silver_builder import SilverMeasurementsDataFrameBuilder
 
 
@@ -136,3 +140,129 @@ def test__transform_silver_to_gold__fifty_minutes_resolution__returns_correct_ob
     assert df_gold.count() == 24
     for index, time in enumerate(df_gold.select(GoldMeasurementsColumnNames.observation_time).collect()):
         assert time[0] == start_date_time + datetime.timedelta(minutes=index * 15)
+
+
+def test__keep_latest_transaction__should_keep_newest_row_per_observation_time(spark: SparkSession) -> None:
+    # Arrange
+    observation_time = datetime.datetime(2025, 1, 1, 23)
+    df_gold = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            observation_time=observation_time,
+            transaction_id="old",
+            transaction_creation_datetime=datetime.datetime(2025, 1, 2),
+        )
+        .add_row(
+            observation_time=observation_time,
+            transaction_id="new",
+            transaction_creation_datetime=datetime.datetime(2025, 1, 3),
+        )
+        .add_row(
+            observation_time=datetime.datetime(2025, 1, 2, 0),
+            transaction_id="other",
+            transaction_creation_datetime=datetime.datetime(2025, 1, 2),
+        )
+        .build()
+    )
+
+    # Act
+    actual = keep_latest_transaction(df_gold)
+
+    # Assert
+    assert sorted(row.transaction_id for row in actual.collect()) == ["new", "other"]
+    assert_schemas.assert_schema(actual=actual.schema, expected=gold_measurements_schema, ignore_nullability=True)
+
+
+def _points(positions: list[int]) -> list[dict]:
+    return [
+        {"position": position, "quantity": Decimal(round(random.uniform(0, 1000), 3)), "quality": "measured"}
+        for position in positions
+    ]
+
+
+def test__transform_silver_to_gold__p1m_resolution_first_day_of_month__returns_first_day_of_each_month(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    df_silver = (
+        SilverMeasurementsDataFrameBuilder(spark)
+        .add_row(resolution="P1M", start_datetime=datetime.datetime(2021, 1, 1, 0, 0, 0), points=_points([1, 2, 3]))
+        .build()
+    )
+
+    # Act
+    df_gold = transform_silver_to_gold(df_silver)
+
+    # Assert
+    assert sorted(row[GoldMeasurementsColumnNames.observation_time] for row in df_gold.collect()) == [
+        datetime.datetime(2021, 1, 1),
+        datetime.datetime(2021, 2, 1),
+        datetime.datetime(2021, 3, 1),
+    ]
+
+
+def test__transform_silver_to_gold__p1m_resolution_not_first_day_of_month__returns_start_then_first_day_of_month(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    start_date_time = datetime.datetime(2021, 1, 15, 10, 0, 0)
+    df_silver = (
+        SilverMeasurementsDataFrameBuilder(spark)
+        .add_row(resolution="P1M", start_datetime=start_date_time, points=_points([1, 2, 3]))
+        .build()
+    )
+
+    # Act
+    df_gold = transform_silver_to_gold(df_silver)
+
+    # Assert
+    assert sorted(row[GoldMeasurementsColumnNames.observation_time] for row in df_gold.collect()) == [
+        start_date_time,
+        datetime.datetime(2021, 2, 1),
+        datetime.datetime(2021, 3, 1),
+    ]
+
+
+def test__transform_silver_to_gold__unordered_positions__returns_observation_time_of_position(
+    spark: SparkSession,
+) -> None:
+    # Arrange
+    start_date_time = datetime.datetime(2021, 1, 1, 0, 0, 0)
+    df_silver = (
+        SilverMeasurementsDataFrameBuilder(spark)
+        .add_row(resolution="PT1H", start_datetime=start_date_time, points=_points([3, 1]))
+        .build()
+    )
+
+    # Act
+    df_gold = transform_silver_to_gold(df_silver)
+
+    # Assert
+    assert [row[GoldMeasurementsColumnNames.observation_time] for row in df_gold.collect()] == [
+        start_date_time + datetime.timedelta(hours=2),
+        start_date_time,
+    ]
+
+
+def test__transform_silver_to_gold__returns_local_date_of_observation_time(spark: SparkSession) -> None:
+    # Arrange
+    df_silver = (
+        SilverMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            resolution="PT1H",
+            # 23:00 UTC is midnight in Copenhagen in winter
+            start_datetime=datetime.datetime(2024, 12, 31, 22, 0, 0),
+            points=[
+                {"position": 1, "quantity": Decimal("1.000"), "quality": "measured"},
+                {"position": 2, "quantity": Decimal("1.000"), "quality": "measured"},
+            ],
+        )
+        .build()
+    )
+
+    # Act
+    df_gold = transform_silver_to_gold(df_silver)
+
+    # Assert
+    actual = df_gold.orderBy(GoldMeasurementsColumnNames.observation_time).collect()
+    assert [row.local_date for row in actual] == [datetime.date(2024, 12, 31), datetime.date(2025, 1, 1)]
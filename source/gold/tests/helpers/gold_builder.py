@@ -21,6 +21,7 @@ class GoldMeasurementsDataFrameBuilder:
         transaction_creation_datetime=None,
         created=None,
         modified=None,
+        local_date=None,
     ):
         self.data.append(
             (
@@ -33,6 +34,7 @@ class GoldMeasurementsDataFrameBuilder:
                 transaction_creation_datetime or datetime.now(),
                 created or datetime.now(),
                 modified or datetime.now(),
+                local_date,
             )
         )
         return self
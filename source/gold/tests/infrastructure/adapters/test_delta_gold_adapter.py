@@ -1,10 +1,14 @@
 import random
+from datetime import datetime
+from decimal import Decimal
 from unittest import mock
 
 from pyspark.sql import SparkSession
 
+from opengeh_gold.domain.schemas.gold_measurements_hourly import gold_measurements_hourly_schema
 from opengeh_gold.infrastructure.adapters.delta_gold_adapter import DeltaGoldAdapter
 from opengeh_gold.infrastructure.config.database_names import DatabaseNames
+from opengeh_gold.infrastructure.config.streaming_settings import StreamingSettings
 from opengeh_gold.infrastructure.config.table_names import TableNames
 from tests.helpers.gold_builder import GoldMeasurementsDataFrameBuilder
 
@@ -15,7 +19,7 @@ def test__start_write_stream__should_write_to_gold_table(
     mock_get_checkpoint_path, mock_getenv, spark: SparkSession, migrations_executed
 ):
     # Arrange
-    gold_adapter = DeltaGoldAdapter()
+    gold_adapter = DeltaGoldAdapter(StreamingSettings())
     source_table = TableNames.gold_measurements
     target_table = f"{source_table}_test"
     metering_point_id = random.randint(0, 999999999999999999)
@@ -32,9 +36,9 @@ def test__start_write_stream__should_write_to_gold_table(
         df_stream_gold,
         "test_query",
         target_table,
-        lambda df, epoch_id: df.write.format("delta")
-        .mode("append")
-        .saveAsTable(f"{DatabaseNames.gold}.{target_table}"),
+        lambda df, epoch_id: (
+            df.write.format("delta").mode("append").saveAsTable(f"{DatabaseNames.gold}.{target_table}")
+        ),
         True,
     )
 
@@ -63,3 +67,152 @@ def test__append__should_append_to_gold_table(spark: SparkSession):
         .count()
         == 1
     )
+
+
+def test__merge__when_newer_transaction__should_update_row(spark: SparkSession):
+    # Arrange
+    gold_adapter = DeltaGoldAdapter()
+    metering_point_id = str(random.randint(0, 999999999999999999))
+    observation_time = datetime(2025, 1, 1, 23)
+    modified = datetime(2025, 1, 2)
+    GoldMeasurementsDataFrameBuilder(spark).add_row(
+        metering_point_id=metering_point_id,
+        observation_time=observation_time,
+        quantity=Decimal("1.000"),
+        quality="measured",
+        transaction_creation_datetime=datetime(2025, 1, 2),
+        modified=modified,
+    ).build().write.format("delta").mode("append").saveAsTable(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+    df_newer = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            metering_point_id=metering_point_id,
+            observation_time=observation_time,
+            quantity=Decimal("2.000"),
+            quality="measured",
+            transaction_creation_datetime=datetime(2025, 1, 3),
+            modified=datetime(2025, 1, 3),
+        )
+        .build()
+    )
+
+    # Act
+    gold_adapter.merge(df_newer, TableNames.gold_measurements)
+
+    # Assert
+    rows = (
+        spark.read.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+        .filter(f"metering_point_id == '{metering_point_id}'")
+        .collect()
+    )
+    assert len(rows) == 1
+    assert rows[0].quantity == Decimal("2.000")
+    assert rows[0].modified == datetime(2025, 1, 3)
+
+
+def test__merge__when_older_transaction__should_keep_existing_row(spark: SparkSession):
+    # Arrange
+    gold_adapter = DeltaGoldAdapter()
+    metering_point_id = str(random.randint(0, 999999999999999999))
+    observation_time = datetime(2025, 1, 1, 23)
+    GoldMeasurementsDataFrameBuilder(spark).add_row(
+        metering_point_id=metering_point_id,
+        observation_time=observation_time,
+        quantity=Decimal("1.000"),
+        transaction_creation_datetime=datetime(2025, 1, 3),
+    ).build().write.format("delta").mode("append").saveAsTable(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+    df_older = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            metering_point_id=metering_point_id,
+            observation_time=observation_time,
+            quantity=Decimal("2.000"),
+            transaction_creation_datetime=datetime(2025, 1, 2),
+        )
+        .build()
+    )
+
+    # Act
+    gold_adapter.merge(df_older, TableNames.gold_measurements)
+
+    # Assert
+    rows = (
+        spark.read.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+        .filter(f"metering_point_id == '{metering_point_id}'")
+        .collect()
+    )
+    assert len(rows) == 1
+    assert rows[0].quantity == Decimal("1.000")
+
+
+def test__merge__when_value_unchanged__should_keep_modified(spark: SparkSession):
+    # Arrange
+    gold_adapter = DeltaGoldAdapter()
+    metering_point_id = str(random.randint(0, 999999999999999999))
+    observation_time = datetime(2025, 1, 1, 23)
+    modified = datetime(2025, 1, 2)
+    GoldMeasurementsDataFrameBuilder(spark).add_row(
+        metering_point_id=metering_point_id,
+        observation_time=observation_time,
+        quantity=Decimal("1.000"),
+        quality="measured",
+        transaction_id="first",
+        transaction_creation_datetime=datetime(2025, 1, 2),
+        modified=modified,
+    ).build().write.format("delta").mode("append").saveAsTable(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+    df_newer = (
+        GoldMeasurementsDataFrameBuilder(spark)
+        .add_row(
+            metering_point_id=metering_point_id,
+            observation_time=observation_time,
+            quantity=Decimal("1.000"),
+            quality="measured",
+            transaction_id="second",
+            transaction_creation_datetime=datetime(2025, 1, 3),
+            modified=datetime(2025, 1, 3),
+        )
+        .build()
+    )
+
+    # Act
+    gold_adapter.merge(df_newer, TableNames.gold_measurements)
+
+    # Assert
+    rows = (
+        spark.read.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
+        .filter(f"metering_point_id == '{metering_point_id}'")
+        .collect()
+    )
+    assert len(rows) == 1
+    assert rows[0].transaction_id == "second"
+    assert rows[0].modified == modified
+
+
+def test__upsert__should_insert_new_and_replace_changed_rows(spark: SparkSession, migrations_executed):
+    # Arrange
+    gold_adapter = DeltaGoldAdapter()
+    metering_point_id = str(random.randint(0, 999999999999999999))
+    key_columns = ["metering_point_id", "observation_time"]
+    spark.createDataFrame(
+        [(metering_point_id, "consumption", datetime(2025, 1, 1, 12), Decimal("1.000"), datetime(2025, 1, 2))],
+        schema=gold_measurements_hourly_schema,
+    ).write.format("delta").mode("append").saveAsTable(f"{DatabaseNames.gold}.{TableNames.gold_measurements_hourly}")
+    df_rollup = spark.createDataFrame(
+        [
+            (metering_point_id, "consumption", datetime(2025, 1, 1, 12), Decimal("3.000"), datetime(2025, 1, 3)),
+            (metering_point_id, "consumption", datetime(2025, 1, 1, 13), Decimal("4.000"), datetime(2025, 1, 3)),
+        ],
+        schema=gold_measurements_hourly_schema,
+    )
+
+    # Act
+    gold_adapter.upsert(df_rollup, TableNames.gold_measurements_hourly, key_columns)
+
+    # Assert
+    rows = (
+        spark.read.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements_hourly}")
+        .filter(f"metering_point_id == '{metering_point_id}'")
+        .orderBy("observation_time")
+        .collect()
+    )
+    assert [row.quantity for row in rows] == [Decimal("3.000"), Decimal("4.000")]
@@ -0,0 +1,76 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from opengeh_gold.infrastructure.config.streaming_settings import (
+    StreamingSettings,
+    TriggerType,
+    get_streaming_settings,
+)
+
+
+@patch.dict("os.environ", {}, clear=True)
+def test__get_streaming_settings__when_not_configured__should_return_defaults():
+    # Act
+    result = get_streaming_settings()
+
+    # Assert
+    assert result == StreamingSettings()
+    assert result.read_options() == {}
+
+
+@patch.dict(
+    "os.environ",
+    {
+        "STREAMING_TRIGGER": "available_now",
+        "STREAMING_MAX_FILES_PER_TRIGGER": "10",
+        "STREAMING_MAX_BYTES_PER_TRIGGER": "512m",
+        "STREAMING_SCHEDULER_POOL": "gold",
+        "STREAMING_LATENCY_SLO_SECONDS": "30",
+    },
+)
+def test__get_streaming_settings__when_configured__should_return_configured_settings():
+    # Act
+    result = get_streaming_settings()
+
+    # Assert
+    assert result == StreamingSettings(
+        trigger_type=TriggerType.AVAILABLE_NOW,
+        max_files_per_trigger=10,
+        max_bytes_per_trigger="512m",
+        scheduler_pool="gold",
+        latency_slo_seconds=30.0,
+    )
+    assert result.read_options() == {"maxFilesPerTrigger": "10", "maxBytesPerTrigger": "512m"}
+
+
+def test__apply_trigger__when_processing_time__should_set_processing_time_trigger():
+    # Arrange
+    stream_writer_mock = Mock()
+    streaming_settings = StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="10 seconds")
+
+    # Act
+    result = streaming_settings.apply_trigger(stream_writer_mock)
+
+    # Assert
+    stream_writer_mock.trigger.assert_called_once_with(processingTime="10 seconds")
+    assert result == stream_writer_mock.trigger.return_value
+
+
+@pytest.mark.parametrize(
+    "streaming_settings, expected_interval_ms",
+    [
+        (StreamingSettings(), 0),
+        (StreamingSettings(trigger_type=TriggerType.AVAILABLE_NOW), 0),
+        (StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="30 seconds"), 30_000),
+        (StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="1 minute"), 60_000),
+    ],
+)
+def test__trigger_interval_ms__should_return_interval_of_processing_time_trigger(
+    streaming_settings, expected_interval_ms
+):
+    # Act
+    actual = streaming_settings.trigger_interval_ms()
+
+    # Assert
+    assert actual == expected_interval_ms
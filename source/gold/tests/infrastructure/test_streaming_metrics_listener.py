@@ -0,0 +1,58 @@
+from unittest import mock
+
+from opengeh_gold.infrastructure.config.streaming_settings import StreamingSettings, TriggerType
+from opengeh_gold.infrastructure.streaming_metrics_listener import StreamingMetricsListener
+
+QUERY_NAME = "test_query"
+
+
+def _progress_event(batch_id: int, timestamp: str, batch_duration: int, name: str = QUERY_NAME) -> mock.Mock:
+    event = mock.Mock()
+    event.progress.name = name
+    event.progress.batchId = batch_id
+    event.progress.timestamp = timestamp
+    event.progress.batchDuration = batch_duration
+    event.progress.numInputRows = 100
+    event.progress.processedRowsPerSecond = 50.0
+    event.progress.stateOperators = []
+    return event
+
+
+@mock.patch("opengeh_gold.infrastructure.streaming_metrics_listener.trigger_lag")
+def test__on_query_progress__should_set_delay_after_trigger_interval_as_trigger_lag(mock_trigger_lag):
+    # Arrange
+    streaming_settings = StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="10 seconds")
+    listener = StreamingMetricsListener(QUERY_NAME, streaming_settings)
+
+    # Act
+    listener.onQueryProgress(_progress_event(0, "2025-01-01T00:00:00.000Z", 15000))
+    listener.onQueryProgress(_progress_event(1, "2025-01-01T00:00:15.000Z", 1000))
+
+    # Assert
+    mock_trigger_lag.set.assert_called_once_with(5000.0, {"query_name": QUERY_NAME})
+
+
+@mock.patch("opengeh_gold.infrastructure.streaming_metrics_listener.latency_slo_breaches")
+def test__on_query_progress__when_batch_exceeds_latency_slo__should_flag_batch(mock_latency_slo_breaches, caplog):
+    # Arrange
+    listener = StreamingMetricsListener(QUERY_NAME, StreamingSettings(latency_slo_seconds=10))
+
+    # Act
+    listener.onQueryProgress(_progress_event(0, "2025-01-01T00:00:00.000Z", 5000))
+    listener.onQueryProgress(_progress_event(1, "2025-01-01T00:00:05.000Z", 15000))
+
+    # Assert
+    mock_latency_slo_breaches.add.assert_called_once_with(1, {"query_name": QUERY_NAME})
+    assert "Batch 1 of test_query took 15000 ms" in caplog.text
+
+
+@mock.patch("opengeh_gold.infrastructure.streaming_metrics_listener.input_rows")
+def test__on_query_progress__when_other_query__should_not_export_metrics(mock_input_rows):
+    # Arrange
+    listener = StreamingMetricsListener(QUERY_NAME, StreamingSettings())
+
+    # Act
+    listener.onQueryProgress(_progress_event(0, "2025-01-01T00:00:00.000Z", 5000, name="other_query"))
+
+    # Assert
+    mock_input_rows.add.assert_not_called()
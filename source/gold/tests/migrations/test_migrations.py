@@ -1,14 +1,74 @@
+from datetime import date, datetime
+from decimal import Decimal
+from importlib import resources
+
+import pyspark.sql.functions as F
 import testcommon.dataframes.assert_schemas as assert_schemas
 from pyspark.sql import SparkSession
 
 from opengeh_gold.domain.schemas.gold_measurements import (
     gold_measurements_schema,
 )
+from opengeh_gold.domain.schemas.gold_measurements_daily import gold_measurements_daily_schema
+from opengeh_gold.domain.schemas.gold_measurements_hourly import gold_measurements_hourly_schema
 from opengeh_gold.infrastructure.config.database_names import DatabaseNames
 from opengeh_gold.infrastructure.config.table_names import TableNames
+from opengeh_gold.migrations.migration_scripts.substitutions import substitutions
+from tests.helpers.gold_builder import GoldMeasurementsDataFrameBuilder
 
 
 def test__migrations__should_create_gold_measurements(spark: SparkSession, migrations_executed):
     # Assert
     gold_measurements = spark.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements}")
     assert_schemas.assert_schema(actual=gold_measurements.schema, expected=gold_measurements_schema)
+
+
+def test__migrations__should_enable_change_data_feed_on_gold_measurements(spark: SparkSession, migrations_executed):
+    # Act
+    properties = spark.sql(f"SHOW TBLPROPERTIES {DatabaseNames.gold}.{TableNames.gold_measurements}").collect()
+
+    # Assert
+    assert {row.key: row.value for row in properties}["delta.enableChangeDataFeed"] == "true"
+
+
+def test__migrations__should_create_gold_measurements_rollups(spark: SparkSession, migrations_executed):
+    # Assert
+    hourly = spark.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements_hourly}")
+    daily = spark.table(f"{DatabaseNames.gold}.{TableNames.gold_measurements_daily}")
+    assert_schemas.assert_schema(actual=hourly.schema, expected=gold_measurements_hourly_schema)
+    assert_schemas.assert_schema(actual=daily.schema, expected=gold_measurements_daily_schema)
+
+
+def _execute_migration_script(spark: SparkSession, script_name: str) -> None:
+    script = resources.files("opengeh_gold.migrations.migration_scripts").joinpath(script_name).read_text()
+    for variable, value in substitutions().items():
+        script = script.replace(variable, value)
+    spark.sql(script)
+
+
+def test__migrations__should_backfill_local_date(spark: SparkSession, migrations_executed):
+    # Arrange
+    metering_point_id = "local-date-backfill-test"
+    gold_table = f"{DatabaseNames.gold}.{TableNames.gold_measurements}"
+    # Points written before the local date was added, on both sides of the Danish midnight
+    GoldMeasurementsDataFrameBuilder(spark).add_row(
+        metering_point_id=metering_point_id, observation_time=datetime(2025, 1, 1, 22, 45), quantity=Decimal("1.000")
+    ).add_row(
+        metering_point_id=metering_point_id, observation_time=datetime(2025, 1, 1, 23), quantity=Decimal("2.000")
+    ).add_row(
+        metering_point_id=metering_point_id,
+        observation_time=datetime(2025, 1, 2),
+        quantity=Decimal("3.000"),
+        local_date=date(2025, 1, 2),
+    ).build().write.format("delta").mode("append").saveAsTable(gold_table)
+
+    # Act
+    _execute_migration_script(spark, "20250303080100_backfill_local_date_of_gold_measurements.sql")
+
+    # Assert
+    local_dates = spark.table(gold_table).where(F.col("metering_point_id") == metering_point_id)
+    assert sorted((row.observation_time, row.local_date) for row in local_dates.collect()) == [
+        (datetime(2025, 1, 1, 22, 45), date(2025, 1, 1)),
+        (datetime(2025, 1, 1, 23), date(2025, 1, 2)),
+        (datetime(2025, 1, 2), date(2025, 1, 2)),
+    ]
@@ -0,0 +1,38 @@
+import logging
+import sys
+
+import telemetry_logging.logging_configuration as config
+from opentelemetry.trace import SpanKind
+from telemetry_logging.span_recording import span_record_exception
+
+from opengeh_silver.application.config.spark import initialize_spark
+from opengeh_silver.infrastructure.config.database_names import DatabaseNames
+from opengeh_silver.infrastructure.config.table_names import TableNames
+from opengeh_silver.infrastructure.maintenance.table_maintenance import TableMaintenanceSettings, maintain_table
+
+# The silver measurements are only read by the gold stream, so no statistics are computed for them
+TABLES_TO_MAINTAIN = [
+    TableMaintenanceSettings(
+        table_name=f"{DatabaseNames.silver}.{TableNames.silver_measurements}",
+        min_num_files_to_optimize=50,
+    ),
+]
+
+
+def maintain(applicationinsights_connection_string: str | None = None) -> None:
+    config.configure_logging(
+        cloud_role_name="dbr-measurements-silver",
+        tracer_name="maintenance-silver-job",
+        applicationinsights_connection_string=applicationinsights_connection_string,
+        extras={"Subsystem": "measurements"},
+    )
+    logging.basicConfig(level=logging.INFO)
+
+    with config.get_tracer().start_as_current_span(__name__, kind=SpanKind.SERVER) as span:
+        try:
+            spark = initialize_spark()
+            for settings in TABLES_TO_MAINTAIN:
+                maintain_table(spark, settings)
+        except Exception as e:
+            span_record_exception(e, span)
+            sys.exit(4)
@@ -1,5 +1,5 @@
 import sys
-from typing import Optional
+from typing import Callable, Optional
 
 import telemetry_logging.logging_configuration as config
 from opentelemetry.trace import SpanKind
@@ -9,13 +9,21 @@ from telemetry_logging.span_recording import span_record_exception
 
 from opengeh_silver.application.config.spark import initialize_spark
 from opengeh_silver.domain.transformations.transform_calculated_measurements import transform_calculated_measurements
+from opengeh_silver.infrastructure.config.bronze_calculated_options import BRONZE_CALCULATED_MAX_FILES_PER_TRIGGER
 from opengeh_silver.infrastructure.config.container_names import ContainerNames
-from opengeh_silver.infrastructure.config.database_names import DatabaseNames
 from opengeh_silver.infrastructure.config.table_names import TableNames
-from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_datalake_storage_account
+from opengeh_silver.infrastructure.config.write_mode import WriteMode
+from opengeh_silver.infrastructure.helpers.environment_variable_helper import (
+    get_datalake_storage_account,
+    get_silver_write_mode,
+    get_streaming_settings,
+)
 from opengeh_silver.infrastructure.helpers.path_helper import get_checkpoint_path
 from opengeh_silver.infrastructure.streams import writer
 from opengeh_silver.infrastructure.streams.bronze_repository import BronzeRepository
+from opengeh_silver.infrastructure.streams.silver_repository import SilverRepository
+
+QUERY_NAME = "bronze_calculated_measurements_to_silver_measurements"
 
 
 def execute(applicationinsights_connection_string: Optional[str] = None) -> None:
@@ -38,17 +46,29 @@ def execute(applicationinsights_connection_string: Optional[str] = None) -> None
 
 @use_span()
 def _execute(spark: SparkSession) -> None:
-    bronze_stream = BronzeRepository(spark).read_calculated_measurements()
+    streaming_settings = get_streaming_settings(BRONZE_CALCULATED_MAX_FILES_PER_TRIGGER)
+    bronze_stream = BronzeRepository(spark).read_calculated_measurements(streaming_settings)
     data_lake_storage_account = get_datalake_storage_account()
     checkpoint_path = get_checkpoint_path(
         data_lake_storage_account, ContainerNames.silver, TableNames.silver_measurements
     )
     writer.write_stream(
-        bronze_stream, "bronze_calculated_measurements_to_silver_measurements", checkpoint_path, _batch_operations
+        bronze_stream, QUERY_NAME, checkpoint_path, _create_batch_operations(checkpoint_path), streaming_settings
     )
 
 
-def _batch_operations(df: DataFrame, batchId: int) -> None:
-    df = transform_calculated_measurements(df)
-    target_table_name = f"{DatabaseNames.silver}.{TableNames.silver_measurements}"
-    df.write.format("delta").mode("append").saveAsTable(target_table_name)
+def _create_batch_operations(checkpoint_path: str) -> Callable[[DataFrame, int], None]:
+    txn_app_id = None
+
+    def batch_operations(df: DataFrame, batchId: int) -> None:
+        nonlocal txn_app_id
+        df = transform_calculated_measurements(df)
+        silver_repository = SilverRepository()
+        if get_silver_write_mode() == WriteMode.MERGE:
+            # The app id is read once per start of the query
+            txn_app_id = txn_app_id or writer.get_txn_app_id(df.sparkSession, QUERY_NAME, checkpoint_path)
+            silver_repository.merge(df, batchId, txn_app_id)
+        else:
+            silver_repository.append(df)
+
+    return batch_operations
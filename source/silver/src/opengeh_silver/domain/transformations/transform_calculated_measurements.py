@@ -1,37 +1,65 @@
+from collections.abc import Sequence
+
 from pyspark.sql import DataFrame
-from pyspark.sql import functions as F
 
 from opengeh_silver.domain.constants.col_names_bronze_calculated_measurements import (
     BronzeCalculatedMeasurementsColNames,
 )
 from opengeh_silver.domain.constants.col_names_silver_measurements import SilverMeasurementsColNames
 
+# The projection from the bronze calculated measurements to the silver measurements, by silver column name. It is
+# built once as SQL expressions, so no columns are created in Python for every micro-batch. The session time zone
+# is UTC, so `current_timestamp()` is already the creation time in UTC.
+SILVER_MEASUREMENTS_PROJECTION: dict[str, str] = {
+    SilverMeasurementsColNames.orchestration_type: BronzeCalculatedMeasurementsColNames.orchestration_type,
+    SilverMeasurementsColNames.orchestration_instance_id: BronzeCalculatedMeasurementsColNames.orchestration_instance_id,
+    SilverMeasurementsColNames.metering_point_id: BronzeCalculatedMeasurementsColNames.metering_point_id,
+    SilverMeasurementsColNames.transaction_id: BronzeCalculatedMeasurementsColNames.transaction_id,
+    SilverMeasurementsColNames.transaction_creation_datetime: (
+        BronzeCalculatedMeasurementsColNames.transaction_creation_datetime
+    ),
+    SilverMeasurementsColNames.metering_point_type: BronzeCalculatedMeasurementsColNames.metering_point_type,
+    SilverMeasurementsColNames.product: BronzeCalculatedMeasurementsColNames.product,
+    SilverMeasurementsColNames.unit: BronzeCalculatedMeasurementsColNames.unit,
+    SilverMeasurementsColNames.resolution: BronzeCalculatedMeasurementsColNames.resolution,
+    SilverMeasurementsColNames.start_datetime: BronzeCalculatedMeasurementsColNames.start_datetime,
+    SilverMeasurementsColNames.end_datetime: BronzeCalculatedMeasurementsColNames.end_datetime,
+    SilverMeasurementsColNames.points: BronzeCalculatedMeasurementsColNames.points,
+    SilverMeasurementsColNames.created: "current_timestamp()",
+}
+
+_SILVER_MEASUREMENTS_SELECT_EXPRESSIONS = [
+    f"{expression} AS {column}" for column, expression in SILVER_MEASUREMENTS_PROJECTION.items()
+]
+
+
+def transform_calculated_measurements(
+    df: DataFrame,
+    columns: Sequence[str] | None = None,
+    extra_expressions: Sequence[str] = (),
+    condition: str | None = None,
+) -> DataFrame:
+    """Transform bronze calculated measurements to silver measurements in a single projection.
+
+    Validation and enrichment are added to the same pass, so they do not add stages to the plan. A condition is
+    evaluated in the same stage as the projection.
+
+    Args:
+        df (DataFrame): The bronze calculated measurements.
+        columns (Sequence[str] | None, optional): The silver columns to select. The bronze columns that are not
+            needed, e.g. the points, are pruned from the scan. Defaults to all silver columns.
+        extra_expressions (Sequence[str], optional): SQL expressions of extra columns computed from the bronze
+            columns, e.g. `size(points) > 0 AS has_points`.
+        condition (str | None, optional): A SQL condition on the bronze columns that the measurements must meet.
 
-def transform_calculated_measurements(df: DataFrame) -> DataFrame:
-    select_list = [
-        F.col(BronzeCalculatedMeasurementsColNames.orchestration_type).alias(
-            SilverMeasurementsColNames.orchestration_type
-        ),
-        F.col(BronzeCalculatedMeasurementsColNames.orchestration_instance_id).alias(
-            SilverMeasurementsColNames.orchestration_instance_id
-        ),
-        F.col(BronzeCalculatedMeasurementsColNames.metering_point_id).alias(
-            SilverMeasurementsColNames.metering_point_id
-        ),
-        F.col(BronzeCalculatedMeasurementsColNames.transaction_id).alias(SilverMeasurementsColNames.transaction_id),
-        F.col(BronzeCalculatedMeasurementsColNames.transaction_creation_datetime).alias(
-            SilverMeasurementsColNames.transaction_creation_datetime
-        ),
-        F.col(BronzeCalculatedMeasurementsColNames.metering_point_type).alias(
-            SilverMeasurementsColNames.metering_point_type
-        ),
-        F.col(BronzeCalculatedMeasurementsColNames.product).alias(SilverMeasurementsColNames.product),
-        F.col(BronzeCalculatedMeasurementsColNames.unit).alias(SilverMeasurementsColNames.unit),
-        F.col(BronzeCalculatedMeasurementsColNames.resolution).alias(SilverMeasurementsColNames.resolution),
-        F.col(BronzeCalculatedMeasurementsColNames.start_datetime).alias(SilverMeasurementsColNames.start_datetime),
-        F.col(BronzeCalculatedMeasurementsColNames.end_datetime).alias(SilverMeasurementsColNames.end_datetime),
-        F.col(BronzeCalculatedMeasurementsColNames.points).alias(SilverMeasurementsColNames.points),
-        F.to_utc_timestamp(F.current_timestamp(), "UTC").alias(SilverMeasurementsColNames.created),
-    ]
-
-    return df.select(select_list)
+    Returns:
+        DataFrame: The silver measurements.
+    """
+    select_expressions = (
+        _SILVER_MEASUREMENTS_SELECT_EXPRESSIONS
+        if columns is None
+        else [f"{SILVER_MEASUREMENTS_PROJECTION[column]} AS {column}" for column in columns]
+    )
+    if condition is not None:
+        df = df.where(condition)
+    return df.selectExpr(*select_expressions, *extra_expressions)
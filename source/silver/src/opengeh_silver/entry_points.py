@@ -1,3 +1,4 @@
+import opengeh_silver.application.maintenance.maintain_tables as maintain_tables
 import opengeh_silver.application.streams.calculated_stream as calculated_stream
 import opengeh_silver.migrations.migrations_runner as migrations_runner
 from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_applicationinsights_connection_string
@@ -9,3 +10,7 @@ def stream_calculated_measurements() -> None:
 
 def migrate() -> None:
     migrations_runner.migrate()
+
+
+def maintain() -> None:
+    maintain_tables.maintain(get_applicationinsights_connection_string())
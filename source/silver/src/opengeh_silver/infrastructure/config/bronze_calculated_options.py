@@ -1,5 +1,7 @@
 BRONZE_CALCULATED_OPTIONS = {
     "ignoreDeletes": "true",
     "skipChangeCommits": "true",
-    "maxFilesPerTrigger": 5,
 }
+
+# Used when `STREAMING_MAX_FILES_PER_TRIGGER` is not set.
+BRONZE_CALCULATED_MAX_FILES_PER_TRIGGER = 5
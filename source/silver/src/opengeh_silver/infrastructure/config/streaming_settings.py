@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from pyspark.sql import SparkSession
+from pyspark.sql.streaming import DataStreamWriter
+
+
+class TriggerType(Enum):
+    DEFAULT = "default"
+    PROCESSING_TIME = "processing_time"
+    AVAILABLE_NOW = "available_now"
+
+
+_INTERVAL_UNITS_IN_MS = {
+    "millisecond": 1,
+    "second": 1000,
+    "minute": 60 * 1000,
+    "hour": 60 * 60 * 1000,
+}
+
+
+@dataclass(frozen=True)
+class StreamingSettings:
+    """Trigger, rate limit, scheduler pool and latency SLO of a streaming query.
+
+    `max_files_per_trigger` and `max_bytes_per_trigger` are Delta source options. When both are set, a micro-batch
+    stops at whichever limit is reached first. The scheduler pool is set on the thread that starts the query, so
+    every query can run in its own fair scheduler pool. Micro-batches that take longer than `latency_slo_seconds`
+    are flagged by the streaming metrics.
+    """
+
+    trigger_type: TriggerType = TriggerType.DEFAULT
+    trigger_interval: str | None = None
+    max_files_per_trigger: int | None = None
+    max_bytes_per_trigger: str | None = None
+    scheduler_pool: str | None = None
+    latency_slo_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate that the processing time trigger has an interval."""
+        if self.trigger_type == TriggerType.PROCESSING_TIME and not self.trigger_interval:
+            raise ValueError("A trigger interval is required for the processing time trigger")
+
+    def read_options(self) -> dict[str, str]:
+        options = {}
+        if self.max_files_per_trigger is not None:
+            options["maxFilesPerTrigger"] = str(self.max_files_per_trigger)
+        if self.max_bytes_per_trigger is not None:
+            options["maxBytesPerTrigger"] = self.max_bytes_per_trigger
+        return options
+
+    def trigger_interval_ms(self) -> int:
+        """Return the trigger interval in milliseconds, or 0 when micro-batches are triggered as soon as possible.
+
+        The interval is given as a number and a unit, e.g. `30 seconds` or `1 minute`.
+        """
+        if self.trigger_type != TriggerType.PROCESSING_TIME or not self.trigger_interval:
+            return 0
+        value, unit = self.trigger_interval.split()
+        return int(float(value) * _INTERVAL_UNITS_IN_MS[unit.lower().removesuffix("s")])
+
+    def apply_trigger(self, stream_writer: DataStreamWriter) -> DataStreamWriter:
+        if self.trigger_type == TriggerType.PROCESSING_TIME:
+            return stream_writer.trigger(processingTime=self.trigger_interval)
+        if self.trigger_type == TriggerType.AVAILABLE_NOW:
+            return stream_writer.trigger(availableNow=True)
+        return stream_writer
+
+    def apply_scheduler_pool(self, spark: SparkSession) -> None:
+        if self.scheduler_pool:
+            spark.sparkContext.setLocalProperty("spark.scheduler.pool", self.scheduler_pool)
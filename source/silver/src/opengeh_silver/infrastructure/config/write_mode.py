@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class WriteMode(Enum):
+    APPEND = "append"
+    MERGE = "merge"
@@ -2,11 +2,21 @@ import os
 from enum import Enum
 from typing import Any
 
+from opengeh_silver.infrastructure.config.streaming_settings import StreamingSettings, TriggerType
+from opengeh_silver.infrastructure.config.write_mode import WriteMode
+
 
 class EnvironmentVariable(Enum):
     CATALOG_NAME = "CATALOG_NAME"
     DATALAKE_STORAGE_ACCOUNT = "DATALAKE_STORAGE_ACCOUNT"
     APPLICATIONINSIGHTS_CONNECTION_STRING = "APPLICATIONINSIGHTS_CONNECTION_STRING"
+    SILVER_WRITE_MODE = "SILVER_WRITE_MODE"
+    STREAMING_TRIGGER = "STREAMING_TRIGGER"
+    STREAMING_TRIGGER_INTERVAL = "STREAMING_TRIGGER_INTERVAL"
+    STREAMING_MAX_FILES_PER_TRIGGER = "STREAMING_MAX_FILES_PER_TRIGGER"
+    STREAMING_MAX_BYTES_PER_TRIGGER = "STREAMING_MAX_BYTES_PER_TRIGGER"
+    STREAMING_SCHEDULER_POOL = "STREAMING_SCHEDULER_POOL"
+    STREAMING_LATENCY_SLO_SECONDS = "STREAMING_LATENCY_SLO_SECONDS"
 
 
 def get_applicationinsights_connection_string() -> str:
@@ -21,6 +31,25 @@ def get_datalake_storage_account() -> str:
     return get_env_variable_or_throw(EnvironmentVariable.DATALAKE_STORAGE_ACCOUNT)
 
 
+def get_silver_write_mode() -> WriteMode:
+    return WriteMode(os.getenv(EnvironmentVariable.SILVER_WRITE_MODE.name, WriteMode.APPEND.value).lower())
+
+
+def get_streaming_settings(default_max_files_per_trigger: int | None = None) -> StreamingSettings:
+    max_files_per_trigger = os.getenv(EnvironmentVariable.STREAMING_MAX_FILES_PER_TRIGGER.name)
+    latency_slo_seconds = os.getenv(EnvironmentVariable.STREAMING_LATENCY_SLO_SECONDS.name)
+    return StreamingSettings(
+        trigger_type=TriggerType(
+            os.getenv(EnvironmentVariable.STREAMING_TRIGGER.name, TriggerType.DEFAULT.value).lower()
+        ),
+        trigger_interval=os.getenv(EnvironmentVariable.STREAMING_TRIGGER_INTERVAL.name),
+        max_files_per_trigger=int(max_files_per_trigger) if max_files_per_trigger else default_max_files_per_trigger,
+        max_bytes_per_trigger=os.getenv(EnvironmentVariable.STREAMING_MAX_BYTES_PER_TRIGGER.name),
+        scheduler_pool=os.getenv(EnvironmentVariable.STREAMING_SCHEDULER_POOL.name),
+        latency_slo_seconds=float(latency_slo_seconds) if latency_slo_seconds else None,
+    )
+
+
 def get_env_variable_or_throw(variable: EnvironmentVariable) -> Any:
     env_variable = os.getenv(variable.name)
     if env_variable is None:
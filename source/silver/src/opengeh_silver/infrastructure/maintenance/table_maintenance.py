@@ -0,0 +1,52 @@
+import logging
+from dataclasses import dataclass
+
+from pyspark.sql import SparkSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TableMaintenanceSettings:
+    """Maintenance thresholds of a Delta table.
+
+    OPTIMIZE compacts the small files written by the micro-batches of the streams, and incrementally clusters tables
+    that use liquid clustering. It only runs when the table has at least `min_num_files_to_optimize` files. VACUUM
+    always runs and removes the files that are older than the `delta.deletedFileRetentionDuration` of the table.
+    """
+
+    table_name: str
+    min_num_files_to_optimize: int
+
+
+@dataclass(frozen=True)
+class TableDetail:
+    num_files: int
+    size_in_bytes: int
+
+
+def get_table_detail(spark: SparkSession, table_name: str) -> TableDetail:
+    detail = spark.sql(f"DESCRIBE DETAIL {table_name}").first()
+    return TableDetail(num_files=detail["numFiles"], size_in_bytes=detail["sizeInBytes"])
+
+
+# TODO: Move to shared library
+def maintain_table(spark: SparkSession, settings: TableMaintenanceSettings) -> tuple[TableDetail, TableDetail]:
+    """Run OPTIMIZE and VACUUM on a Delta table and log the change in its number of files and size.
+
+    Returns:
+        The details of the table before and after the maintenance.
+    """
+    before = get_table_detail(spark, settings.table_name)
+
+    if before.num_files >= settings.min_num_files_to_optimize:
+        spark.sql(f"OPTIMIZE {settings.table_name}")
+    spark.sql(f"VACUUM {settings.table_name}")
+
+    after = get_table_detail(spark, settings.table_name)
+    logger.info(
+        f"Maintained {settings.table_name}: "
+        f"files {before.num_files} -> {after.num_files} ({after.num_files - before.num_files:+d}), "
+        f"bytes {before.size_in_bytes} -> {after.size_in_bytes} ({after.size_in_bytes - before.size_in_bytes:+d})"
+    )
+    return before, after
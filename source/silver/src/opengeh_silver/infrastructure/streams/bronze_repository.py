@@ -2,6 +2,7 @@ from pyspark.sql import DataFrame, SparkSession
 
 from opengeh_silver.infrastructure.config.bronze_calculated_options import BRONZE_CALCULATED_OPTIONS
 from opengeh_silver.infrastructure.config.database_names import DatabaseNames
+from opengeh_silver.infrastructure.config.streaming_settings import StreamingSettings
 from opengeh_silver.infrastructure.config.table_names import TableNames
 from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_catalog_name
 
@@ -14,8 +15,8 @@ class BronzeRepository:
         self._spark = spark
         self._catalog_name = get_catalog_name()
 
-    def read_calculated_measurements(self) -> DataFrame:
-        options = BRONZE_CALCULATED_OPTIONS
+    def read_calculated_measurements(self, streaming_settings: StreamingSettings | None = None) -> DataFrame:
+        options = {**BRONZE_CALCULATED_OPTIONS, **(streaming_settings or StreamingSettings()).read_options()}
 
         source_table_name = f"{self._catalog_name + '.' if self._catalog_name else ''}{DatabaseNames.bronze}.{TableNames.bronze_calculated_measurements}"
         return self._spark.readStream.format("delta").options(**options).table(source_table_name)
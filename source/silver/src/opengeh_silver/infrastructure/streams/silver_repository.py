@@ -0,0 +1,50 @@
+from delta.tables import DeltaTable
+from pyspark.sql import DataFrame
+from pyspark.sql import functions as F
+
+from opengeh_silver.domain.constants.col_names_silver_measurements import SilverMeasurementsColNames
+from opengeh_silver.infrastructure.config.database_names import DatabaseNames
+from opengeh_silver.infrastructure.config.table_names import TableNames
+
+MERGE_KEYS = [
+    SilverMeasurementsColNames.orchestration_instance_id,
+    SilverMeasurementsColNames.transaction_id,
+    SilverMeasurementsColNames.metering_point_id,
+    SilverMeasurementsColNames.start_datetime,
+]
+
+TXN_APP_ID_CONF = "spark.databricks.delta.write.txnAppId"
+TXN_VERSION_CONF = "spark.databricks.delta.write.txnVersion"
+
+
+class SilverRepository:
+    def __init__(self) -> None:
+        self._target_table_name = f"{DatabaseNames.silver}.{TableNames.silver_measurements}"
+
+    def append(self, df: DataFrame) -> None:
+        df.write.format("delta").mode("append").saveAsTable(self._target_table_name)
+
+    def merge(self, df: DataFrame, batch_id: int, txn_app_id: str) -> None:
+        """Insert the measurements that are not already in the silver measurements table.
+
+        The batch id is recorded as the Delta transaction version of the writer identified by `txn_app_id`, so a
+        micro-batch that is retried after it was committed is skipped by Delta. Rows that match an existing row on the merge keys
+        are never inserted twice, also when the checkpoint is lost.
+        """
+        spark = df.sparkSession
+        source = df.dropDuplicates(MERGE_KEYS)
+        merge_condition = " AND ".join([f"target.{key} = source.{key}" for key in MERGE_KEYS])
+
+        spark.conf.set(TXN_APP_ID_CONF, txn_app_id)
+        spark.conf.set(TXN_VERSION_CONF, str(batch_id))
+        try:
+            (
+                DeltaTable.forName(spark, self._target_table_name)
+                .alias("target")
+                .merge(source.alias("source"), F.expr(merge_condition))
+                .whenNotMatchedInsertAll()
+                .execute()
+            )
+        finally:
+            spark.conf.unset(TXN_APP_ID_CONF)
+            spark.conf.unset(TXN_VERSION_CONF)
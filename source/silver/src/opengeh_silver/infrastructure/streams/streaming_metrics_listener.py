@@ -0,0 +1,77 @@
+import logging
+from datetime import datetime
+
+from opentelemetry import metrics
+from pyspark.sql.streaming.listener import (
+    QueryProgressEvent,
+    QueryStartedEvent,
+    QueryTerminatedEvent,
+    StreamingQueryListener,
+)
+
+from opengeh_silver.infrastructure.config.streaming_settings import StreamingSettings
+
+logger = logging.getLogger(__name__)
+
+# The instruments are exported with the meter provider set up by `telemetry_logging.configure_logging`
+meter = metrics.get_meter(__name__)
+input_rows = meter.create_counter("streaming.input_rows", unit="{row}", description="Rows read by the micro-batches")
+processed_rows_per_second = meter.create_gauge(
+    "streaming.processed_rows_per_second", unit="{row}/s", description="Rows processed per second by a micro-batch"
+)
+batch_duration = meter.create_histogram("streaming.batch_duration", unit="ms", description="Duration of micro-batches")
+state_size = meter.create_gauge("streaming.state_size", unit="By", description="Memory used by the state stores")
+trigger_lag = meter.create_gauge(
+    "streaming.trigger_lag", unit="ms", description="Delay of the start of a micro-batch after its scheduled trigger"
+)
+latency_slo_breaches = meter.create_counter(
+    "streaming.latency_slo_breaches", unit="{batch}", description="Micro-batches that took longer than the SLO"
+)
+
+
+# TODO: Move to shared library
+class StreamingMetricsListener(StreamingQueryListener):
+    """Export the progress of the micro-batches of a streaming query as OpenTelemetry metrics.
+
+    The trigger lag is how much later a micro-batch started than the trigger interval after the start of the
+    previous micro-batch, so it grows when the micro-batches take longer than the trigger interval. Micro-batches
+    that take longer than the latency SLO of the streaming settings are counted and logged as warnings.
+    """
+
+    def __init__(self, query_name: str, streaming_settings: StreamingSettings) -> None:
+        self.query_name = query_name
+        self.trigger_interval_ms = streaming_settings.trigger_interval_ms()
+        self.latency_slo_ms = (
+            streaming_settings.latency_slo_seconds * 1000 if streaming_settings.latency_slo_seconds else None
+        )
+        self._previous_batch_start: datetime | None = None
+
+    def onQueryStarted(self, event: QueryStartedEvent) -> None:
+        pass
+
+    def onQueryProgress(self, event: QueryProgressEvent) -> None:
+        progress = event.progress
+        if progress.name != self.query_name:
+            return
+
+        attributes = {"query_name": self.query_name}
+        input_rows.add(progress.numInputRows, attributes)
+        processed_rows_per_second.set(progress.processedRowsPerSecond, attributes)
+        batch_duration.record(progress.batchDuration, attributes)
+        state_size.set(sum(operator.memoryUsedBytes for operator in progress.stateOperators), attributes)
+
+        batch_start = datetime.fromisoformat(progress.timestamp.replace("Z", "+00:00"))
+        if self._previous_batch_start is not None:
+            elapsed_ms = (batch_start - self._previous_batch_start).total_seconds() * 1000
+            trigger_lag.set(max(0.0, elapsed_ms - self.trigger_interval_ms), attributes)
+        self._previous_batch_start = batch_start
+
+        if self.latency_slo_ms is not None and progress.batchDuration > self.latency_slo_ms:
+            latency_slo_breaches.add(1, attributes)
+            logger.warning(
+                f"Batch {progress.batchId} of {self.query_name} took {progress.batchDuration} ms, "
+                f"which exceeds the latency SLO of {self.latency_slo_ms:.0f} ms"
+            )
+
+    def onQueryTerminated(self, event: QueryTerminatedEvent) -> None:
+        pass
@@ -1,6 +1,9 @@
 from typing import Callable
 
-from pyspark.sql import DataFrame
+from pyspark.sql import DataFrame, SparkSession
+
+from opengeh_silver.infrastructure.config.streaming_settings import StreamingSettings
+from opengeh_silver.infrastructure.streams.streaming_metrics_listener import StreamingMetricsListener
 
 
 def write_stream(
@@ -8,7 +11,31 @@ def write_stream(
     query_name: str,
     checkpoint_path: str,
     batch_operation: Callable[["DataFrame", int], None],
+    streaming_settings: StreamingSettings | None = None,
 ) -> None:
-    df_source_stream.writeStream.format("delta").queryName(query_name).option(
-        "checkpointLocation", checkpoint_path
-    ).foreachBatch(batch_operation).start().awaitTermination()
+    streaming_settings = streaming_settings or StreamingSettings()
+    streaming_settings.apply_scheduler_pool(df_source_stream.sparkSession)
+
+    df_write_stream = (
+        df_source_stream.writeStream.format("delta")
+        .queryName(query_name)
+        .option("checkpointLocation", checkpoint_path)
+        .foreachBatch(batch_operation)
+    )
+    listener = StreamingMetricsListener(query_name, streaming_settings)
+    df_source_stream.sparkSession.streams.addListener(listener)
+    try:
+        streaming_settings.apply_trigger(df_write_stream).start().awaitTermination()
+    finally:
+        df_source_stream.sparkSession.streams.removeListener(listener)
+
+
+def get_txn_app_id(spark: SparkSession, query_name: str, checkpoint_path: str) -> str:
+    """Get the Delta transaction app id of the micro-batches of a streaming query.
+
+    The batch ids start over when a checkpoint is reset, so the app id includes the id of the query from the metadata
+    of its checkpoint. It is written when the query is started with a new checkpoint, before the first micro-batch,
+    so the micro-batches of a reset checkpoint are not skipped as already committed.
+    """
+    checkpoint_id = spark.read.json(f"{checkpoint_path}/metadata").first()["id"]
+    return f"{query_name}-{checkpoint_id}"
@@ -4,7 +4,7 @@ import pytest
 from pyspark.sql import DataFrame, SparkSession
 
 from opengeh_silver.application.streams.calculated_stream import (
-    _batch_operations,
+    _create_batch_operations,
     _execute,
     execute,
 )
@@ -52,10 +52,13 @@ def test__calculated_stream__should_throw_exception(
     mock_span_record_exception.assert_called_once()
 
 
+@mock.patch("opengeh_silver.application.streams.calculated_stream.get_streaming_settings")
 @mock.patch("opengeh_silver.application.streams.calculated_stream.get_checkpoint_path", return_value="checkpoint")
 @mock.patch("opengeh_silver.application.streams.calculated_stream.BronzeRepository")
 @mock.patch("opengeh_silver.application.streams.calculated_stream.writer")
-def test__calculated_stream_should_read_and_write(mock_writer, mock_BronzeRepository, mock_get_checkpoint_path):
+def test__calculated_stream_should_read_and_write(
+    mock_writer, mock_BronzeRepository, mock_get_checkpoint_path, mock_get_streaming_settings
+):
     # Arrange
     mock_spark = mock.Mock(spec=SparkSession)
     mock_bronze_repository = mock_BronzeRepository.return_value
@@ -67,9 +70,15 @@ def test__calculated_stream_should_read_and_write(mock_writer, mock_BronzeReposi
     # Assert
     mock_get_checkpoint_path.assert_called_once()
     mock_BronzeRepository.assert_called_once_with(mock_spark)
-    mock_bronze_repository.read_calculated_measurements.assert_called_once()
+    mock_bronze_repository.read_calculated_measurements.assert_called_once_with(
+        mock_get_streaming_settings.return_value
+    )
     mock_writer.write_stream.assert_called_once_with(
-        "mock_bronze_stream", "bronze_calculated_measurements_to_silver_measurements", "checkpoint", _batch_operations
+        "mock_bronze_stream",
+        "bronze_calculated_measurements_to_silver_measurements",
+        "checkpoint",
+        mock.ANY,
+        mock_get_streaming_settings.return_value,
     )
 
 
@@ -82,10 +91,38 @@ def test__batch_operations(mock_transform_calculated_measurements):
     expected_target_table_name = f"{DatabaseNames.silver}.{TableNames.silver_measurements}"
 
     # Act
-    _batch_operations(mock_df, 1)
+    _create_batch_operations("checkpoint")(mock_df, 1)
 
     # Assert
     mock_transform_calculated_measurements.assert_called_once_with(mock_df)
     mock_transformed_df.write.format.assert_called_once_with("delta")
     mock_transformed_df.write.format().mode.assert_called_once_with("append")
     mock_transformed_df.write.format().mode().saveAsTable.assert_called_once_with(expected_target_table_name)
+
+
+@mock.patch.dict("os.environ", {"SILVER_WRITE_MODE": "merge"})
+@mock.patch("opengeh_silver.application.streams.calculated_stream.writer")
+@mock.patch("opengeh_silver.application.streams.calculated_stream.SilverRepository")
+@mock.patch("opengeh_silver.application.streams.calculated_stream.transform_calculated_measurements")
+def test__batch_operations__when_merge_write_mode__should_merge_with_batch_id_of_checkpoint(
+    mock_transform_calculated_measurements, mock_SilverRepository, mock_writer
+):
+    # Arrange
+    mock_df = mock.Mock(spec=DataFrame)
+    mock_transformed_df = mock.Mock(spec=DataFrame)
+    mock_transform_calculated_measurements.return_value = mock_transformed_df
+    mock_writer.get_txn_app_id.return_value = "txn_app_id"
+    batch_operations = _create_batch_operations("checkpoint")
+
+    # Act
+    batch_operations(mock_df, 7)
+    batch_operations(mock_df, 8)
+
+    # Assert
+    mock_writer.get_txn_app_id.assert_called_once_with(
+        mock_transformed_df.sparkSession, "bronze_calculated_measurements_to_silver_measurements", "checkpoint"
+    )
+    mock_SilverRepository.return_value.merge.assert_has_calls(
+        [mock.call(mock_transformed_df, 7, "txn_app_id"), mock.call(mock_transformed_df, 8, "txn_app_id")]
+    )
+    mock_SilverRepository.return_value.append.assert_not_called()
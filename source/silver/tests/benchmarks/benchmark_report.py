@@ -0,0 +1,94 @@
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from delta.tables import DeltaTable
+from pyspark.sql import SparkSession
+
+from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_silver_write_mode
+
+BENCHMARK_OUTPUT_PATH = os.getenv("BENCHMARK_OUTPUT_PATH", "benchmark-results")
+
+# The operation metric of the rows written to the silver measurements table by each write mode
+_WRITTEN_ROWS_METRICS = {"WRITE": "numOutputRows", "MERGE": "numTargetRowsInserted"}
+
+
+@dataclass
+class SilverBenchmarkResult:
+    """The throughput of the silver stream, measured from the commits of the micro-batches to the silver table.
+
+    Every micro-batch is one commit, so the interval between consecutive commits is the latency of a micro-batch
+    when the stream runs with an `availableNow` trigger.
+    """
+
+    name: str
+    scale: dict
+    write_mode: str
+    transactions: int
+    duration_seconds: float
+    batches: int
+    commit_interval_ms: dict
+    output_files: int
+    spark_version: str
+    created: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @property
+    def transactions_per_second(self) -> float:
+        return round(self.transactions / self.duration_seconds, 1) if self.duration_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "transactions_per_second": self.transactions_per_second}
+
+    def write(self, output_path: str = BENCHMARK_OUTPUT_PATH) -> str:
+        os.makedirs(output_path, exist_ok=True)
+        file_path = os.path.join(output_path, f"{self.name}.json")
+        with open(file_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+        return file_path
+
+
+def percentiles(values: list[int]) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {f"p{p}": ordered[round(p / 100 * (len(ordered) - 1))] for p in (50, 90, 95, 99)}
+    result["max"] = ordered[-1]
+    return result
+
+
+def run_silver_stream_benchmark(
+    spark: SparkSession, name: str, run_stream, scale: dict, silver_table_name: str
+) -> SilverBenchmarkResult:
+    """Run the silver stream until it terminates and measure it from the commits it made to the silver table."""
+    silver_table = DeltaTable.forName(spark, silver_table_name)
+    version_before = silver_table.history(1).collect()[0]["version"]
+
+    started = time.perf_counter()
+    run_stream()
+    duration_seconds = time.perf_counter() - started
+
+    commits = (
+        silver_table.history()
+        .filter(f"version > {version_before}")
+        .filter(f"operation IN ({', '.join(repr(operation) for operation in _WRITTEN_ROWS_METRICS)})")
+        .orderBy("version")
+        .collect()
+    )
+    commit_times = [commit["timestamp"] for commit in commits]
+    return SilverBenchmarkResult(
+        name=name,
+        scale=scale,
+        write_mode=get_silver_write_mode().value,
+        transactions=sum(
+            int(commit["operationMetrics"].get(_WRITTEN_ROWS_METRICS[commit["operation"]], 0)) for commit in commits
+        ),
+        duration_seconds=round(duration_seconds, 3),
+        batches=len(commits),
+        commit_interval_ms=percentiles(
+            [int((later - earlier).total_seconds() * 1000) for earlier, later in zip(commit_times, commit_times[1:])]
+        ),
+        output_files=silver_table.detail().collect()[0]["numFiles"],
+        spark_version=spark.version,
+    )
@@ -0,0 +1,84 @@
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.types import DecimalType, IntegerType, StringType
+
+from opengeh_silver.domain.constants.col_names_bronze_calculated_measurements import (
+    BronzeCalculatedMeasurementsColNames,
+)
+
+# Danish midnight of 2024-01-01 in UTC
+START_DATETIME = datetime(2023, 12, 31, 23)
+
+_TRANSACTION_NUMBER = "id"
+
+
+@dataclass(frozen=True)
+class BenchmarkScale:
+    """The size of the generated bronze calculated measurements.
+
+    Every transaction is a day of its own metering point. The first `duplicated_transactions` transactions are
+    written to bronze twice with the same keys, like transactions that are delivered again, which the merge write
+    mode inserts once.
+    """
+
+    transactions: int
+    points_per_transaction: int
+    duplicated_transactions: int
+
+    @staticmethod
+    def from_env() -> "BenchmarkScale":
+        return BenchmarkScale(
+            transactions=int(os.getenv("BENCHMARK_TRANSACTIONS", "10000")),
+            points_per_transaction=int(os.getenv("BENCHMARK_POINTS_PER_TRANSACTION", "96")),
+            duplicated_transactions=int(os.getenv("BENCHMARK_DUPLICATED_TRANSACTIONS", "0")),
+        )
+
+    @property
+    def bronze_rows(self) -> int:
+        return self.transactions + min(self.duplicated_transactions, self.transactions)
+
+
+def generate_bronze_calculated_measurements(spark: SparkSession, scale: BenchmarkScale) -> DataFrame:
+    transactions = spark.range(scale.transactions)
+    duplicates = spark.range(min(scale.duplicated_transactions, scale.transactions))
+    transaction_number = F.col(_TRANSACTION_NUMBER)
+    resolution = "PT15M" if scale.points_per_transaction > 24 else "PT1H"
+
+    return transactions.unionAll(duplicates).select(
+        F.lit("calculated").alias(BronzeCalculatedMeasurementsColNames.orchestration_type),
+        # The keys are derived from the transaction number, so a duplicated transaction has the same keys
+        F.format_string("00000000-0000-0000-0000-%012d", transaction_number).alias(
+            BronzeCalculatedMeasurementsColNames.orchestration_instance_id
+        ),
+        F.format_string("57%016d", transaction_number).alias(BronzeCalculatedMeasurementsColNames.metering_point_id),
+        F.format_string("transaction-%d", transaction_number).alias(
+            BronzeCalculatedMeasurementsColNames.transaction_id
+        ),
+        F.current_timestamp().alias(BronzeCalculatedMeasurementsColNames.transaction_creation_datetime),
+        F.lit("consumption").alias(BronzeCalculatedMeasurementsColNames.metering_point_type),
+        F.lit("energy_active").alias(BronzeCalculatedMeasurementsColNames.product),
+        F.lit("kWh").alias(BronzeCalculatedMeasurementsColNames.unit),
+        F.lit(resolution).alias(BronzeCalculatedMeasurementsColNames.resolution),
+        F.lit(START_DATETIME).alias(BronzeCalculatedMeasurementsColNames.start_datetime),
+        F.lit(START_DATETIME + timedelta(days=1)).alias(BronzeCalculatedMeasurementsColNames.end_datetime),
+        F.transform(
+            F.sequence(F.lit(1), F.lit(scale.points_per_transaction)),
+            lambda position: _point(position, transaction_number),
+        ).alias(BronzeCalculatedMeasurementsColNames.points),
+        F.lit(None).cast(StringType()).alias(BronzeCalculatedMeasurementsColNames.rescued_data),
+        F.current_timestamp().alias(BronzeCalculatedMeasurementsColNames.created),
+    )
+
+
+def _point(position: Column, transaction_number: Column) -> Column:
+    return F.struct(
+        position.cast(IntegerType()).alias(BronzeCalculatedMeasurementsColNames.Points.position),
+        (F.pmod(transaction_number + position, F.lit(1_000_000)) / 1000)
+        .cast(DecimalType(18, 3))
+        .alias(BronzeCalculatedMeasurementsColNames.Points.quantity),
+        F.lit("measured").alias(BronzeCalculatedMeasurementsColNames.Points.quality),
+    )
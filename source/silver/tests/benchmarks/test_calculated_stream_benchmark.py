@@ -0,0 +1,48 @@
+import os
+from dataclasses import asdict
+from unittest import mock
+
+import pytest
+from pyspark.sql import SparkSession
+
+from opengeh_silver.application.streams.calculated_stream import _execute
+from opengeh_silver.infrastructure.config.database_names import DatabaseNames
+from opengeh_silver.infrastructure.config.table_names import TableNames
+from opengeh_silver.infrastructure.config.write_mode import WriteMode
+from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_silver_write_mode
+from tests.benchmarks.benchmark_report import run_silver_stream_benchmark
+from tests.benchmarks.synthetic_data import BenchmarkScale, generate_bronze_calculated_measurements
+
+# Run with `RUN_BENCHMARKS=1 pytest tests/benchmarks`. The scale is set with `BENCHMARK_TRANSACTIONS`,
+# `BENCHMARK_POINTS_PER_TRANSACTION` and `BENCHMARK_DUPLICATED_TRANSACTIONS`, the write mode with
+# `SILVER_WRITE_MODE`, and the result is written as JSON to `BENCHMARK_OUTPUT_PATH`.
+
+
+@pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="Benchmarks only run when RUN_BENCHMARKS is set")
+@mock.patch.dict("os.environ", {"STREAMING_TRIGGER": "available_now"})
+@mock.patch("opengeh_silver.application.streams.calculated_stream.get_checkpoint_path")
+def test__calculated_stream_benchmark__should_write_all_bronze_transactions(
+    mock_get_checkpoint_path, spark: SparkSession, migrate, tmp_path, record_property
+) -> None:
+    # Arrange
+    scale = BenchmarkScale.from_env()
+    spark.sql(f"CREATE DATABASE IF NOT EXISTS {DatabaseNames.bronze}")
+    df_bronze = generate_bronze_calculated_measurements(spark, scale)
+    df_bronze.write.format("delta").mode("overwrite").option("overwriteSchema", "true").saveAsTable(
+        f"{DatabaseNames.bronze}.{TableNames.bronze_calculated_measurements}"
+    )
+    mock_get_checkpoint_path.return_value = str(tmp_path / "checkpoint")
+
+    # Act
+    result = run_silver_stream_benchmark(
+        spark,
+        name="bronze_calculated_measurements_to_silver_measurements",
+        run_stream=lambda: _execute(spark),
+        scale=asdict(scale),
+        silver_table_name=f"{DatabaseNames.silver}.{TableNames.silver_measurements}",
+    )
+    record_property("benchmark_result", result.write())
+
+    # Assert
+    expected_transactions = scale.transactions if get_silver_write_mode() == WriteMode.MERGE else scale.bronze_rows
+    assert result.transactions == expected_transactions
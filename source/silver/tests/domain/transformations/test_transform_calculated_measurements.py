@@ -14,3 +14,36 @@ def test__transform_calculated_measurements__should_return_transformed_df(spark)
     # Assert
     assert result.count() == 1
     assert result.columns == [field.name for field in expected_schema.fields]
+
+
+def _read_from_parquet(spark, tmp_path):
+    path = str(tmp_path / "bronze_calculated_measurements")
+    BronzeMeasurementsDataFrameBuilder(spark).add_row().build().write.parquet(path)
+    return spark.read.parquet(path)
+
+
+def test__transform_calculated_measurements__plan_is_single_project_over_scan(spark, tmp_path):
+    # Arrange
+    bronze_calculated_df = _read_from_parquet(spark, tmp_path)
+
+    # Act
+    result = transform_calculated_measurements(bronze_calculated_df, extra_expressions=["size(points) AS point_count"])
+
+    # Assert
+    plan = result._jdf.queryExecution().executedPlan().toString()
+    operators = [line.strip(" +-:*()0123456789").split(" ")[0] for line in plan.splitlines()]
+    # The vectorized Parquet reader adds a conversion from columns to rows, which is not a stage of its own
+    assert [operator for operator in operators if operator != "ColumnarToRow"] == ["Project", "FileScan"]
+
+
+def test__transform_calculated_measurements__with_columns__prunes_other_columns_from_scan(spark, tmp_path):
+    # Arrange
+    bronze_calculated_df = _read_from_parquet(spark, tmp_path)
+
+    # Act
+    result = transform_calculated_measurements(bronze_calculated_df, columns=["metering_point_id", "created"])
+
+    # Assert
+    plan = result._jdf.queryExecution().executedPlan().toString()
+    assert result.columns == ["metering_point_id", "created"]
+    assert "ReadSchema: struct<metering_point_id:string>" in plan
@@ -0,0 +1,106 @@
+from unittest import mock
+
+import pytest
+
+from opengeh_silver.infrastructure.config.streaming_settings import StreamingSettings, TriggerType
+from opengeh_silver.infrastructure.helpers.environment_variable_helper import get_streaming_settings
+
+
+@mock.patch.dict("os.environ", {}, clear=True)
+def test__get_streaming_settings__when_not_configured__should_return_defaults():
+    # Act
+    actual = get_streaming_settings(default_max_files_per_trigger=5)
+
+    # Assert
+    assert actual == StreamingSettings(max_files_per_trigger=5)
+    assert actual.read_options() == {"maxFilesPerTrigger": "5"}
+
+
+@mock.patch.dict(
+    "os.environ",
+    {
+        "STREAMING_TRIGGER": "processing_time",
+        "STREAMING_TRIGGER_INTERVAL": "30 seconds",
+        "STREAMING_MAX_FILES_PER_TRIGGER": "100",
+        "STREAMING_MAX_BYTES_PER_TRIGGER": "1g",
+        "STREAMING_SCHEDULER_POOL": "silver",
+        "STREAMING_LATENCY_SLO_SECONDS": "60",
+    },
+)
+def test__get_streaming_settings__when_configured__should_return_configured_settings():
+    # Act
+    actual = get_streaming_settings(default_max_files_per_trigger=5)
+
+    # Assert
+    assert actual == StreamingSettings(
+        trigger_type=TriggerType.PROCESSING_TIME,
+        trigger_interval="30 seconds",
+        max_files_per_trigger=100,
+        max_bytes_per_trigger="1g",
+        scheduler_pool="silver",
+        latency_slo_seconds=60.0,
+    )
+    assert actual.read_options() == {"maxFilesPerTrigger": "100", "maxBytesPerTrigger": "1g"}
+
+
+def test__streaming_settings__when_processing_time_without_interval__should_raise():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME)
+
+
+@pytest.mark.parametrize(
+    "streaming_settings, expected_trigger",
+    [
+        (StreamingSettings(), None),
+        (
+            StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="1 minute"),
+            {"processingTime": "1 minute"},
+        ),
+        (StreamingSettings(trigger_type=TriggerType.AVAILABLE_NOW), {"availableNow": True}),
+    ],
+)
+def test__apply_trigger__should_set_expected_trigger(streaming_settings, expected_trigger):
+    # Arrange
+    mock_stream_writer = mock.Mock()
+
+    # Act
+    actual = streaming_settings.apply_trigger(mock_stream_writer)
+
+    # Assert
+    if expected_trigger is None:
+        mock_stream_writer.trigger.assert_not_called()
+        assert actual is mock_stream_writer
+    else:
+        mock_stream_writer.trigger.assert_called_once_with(**expected_trigger)
+        assert actual is mock_stream_writer.trigger.return_value
+
+
+def test__apply_scheduler_pool__should_set_local_property():
+    # Arrange
+    mock_spark = mock.Mock()
+
+    # Act
+    StreamingSettings(scheduler_pool="silver").apply_scheduler_pool(mock_spark)
+
+    # Assert
+    mock_spark.sparkContext.setLocalProperty.assert_called_once_with("spark.scheduler.pool", "silver")
+
+
+@pytest.mark.parametrize(
+    "streaming_settings, expected_interval_ms",
+    [
+        (StreamingSettings(), 0),
+        (StreamingSettings(trigger_type=TriggerType.AVAILABLE_NOW), 0),
+        (StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="30 seconds"), 30_000),
+        (StreamingSettings(trigger_type=TriggerType.PROCESSING_TIME, trigger_interval="1 minute"), 60_000),
+    ],
+)
+def test__trigger_interval_ms__should_return_interval_of_processing_time_trigger(
+    streaming_settings, expected_interval_ms
+):
+    # Act
+    actual = streaming_settings.trigger_interval_ms()
+
+    # Assert
+    assert actual == expected_interval_ms
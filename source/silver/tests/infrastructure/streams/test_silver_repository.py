@@ -0,0 +1,70 @@
+from pyspark.sql import SparkSession
+from pyspark.sql import functions as F
+
+from opengeh_silver.domain.transformations.transform_calculated_measurements import transform_calculated_measurements
+from opengeh_silver.infrastructure.config.database_names import DatabaseNames
+from opengeh_silver.infrastructure.config.table_names import TableNames
+from opengeh_silver.infrastructure.streams.silver_repository import SilverRepository
+from tests.builders.bronze_calculated_measurements_builder import BronzeMeasurementsDataFrameBuilder
+
+
+def _count_transaction(spark: SparkSession, transaction_id: str) -> int:
+    return (
+        spark.table(f"{DatabaseNames.silver}.{TableNames.silver_measurements}")
+        .where(F.col("transaction_id") == transaction_id)
+        .count()
+    )
+
+
+def test__merge__when_batch_is_replayed__should_not_duplicate_rows(spark: SparkSession, migrate):
+    # Arrange
+    transaction_id = "merge-replayed-batch"
+    df = transform_calculated_measurements(
+        BronzeMeasurementsDataFrameBuilder(spark).add_row(transaction_id=transaction_id).build()
+    )
+    repository = SilverRepository()
+
+    # Act
+    repository.merge(df, 0, "test_merge_replayed_batch")
+    repository.merge(df, 0, "test_merge_replayed_batch")
+
+    # Assert
+    assert _count_transaction(spark, transaction_id) == 1
+
+
+def test__merge__when_rows_already_exist__should_only_insert_new_rows(spark: SparkSession, migrate):
+    # Arrange
+    transaction_id = "merge-existing-rows"
+    df = transform_calculated_measurements(
+        BronzeMeasurementsDataFrameBuilder(spark)
+        .add_row(transaction_id=transaction_id, metering_point_id="1")
+        .add_row(transaction_id=transaction_id, metering_point_id="2")
+        .build()
+    )
+    repository = SilverRepository()
+    repository.merge(df.where(F.col("metering_point_id") == "1"), 0, "test_merge_existing_rows")
+
+    # Act
+    repository.merge(df, 1, "test_merge_existing_rows")
+
+    # Assert
+    assert _count_transaction(spark, transaction_id) == 2
+
+
+def test__merge__when_checkpoint_is_reset__should_insert_rows_of_restarted_batch_ids(spark: SparkSession, migrate):
+    # Arrange
+    transaction_id = "merge-reset-checkpoint"
+    df = transform_calculated_measurements(
+        BronzeMeasurementsDataFrameBuilder(spark)
+        .add_row(transaction_id=transaction_id, metering_point_id="1")
+        .add_row(transaction_id=transaction_id, metering_point_id="2")
+        .build()
+    )
+    repository = SilverRepository()
+    repository.merge(df.where(F.col("metering_point_id") == "1"), 0, "test_merge_reset_checkpoint-before")
+
+    # Act
+    repository.merge(df, 0, "test_merge_reset_checkpoint-after")
+
+    # Assert
+    assert _count_transaction(spark, transaction_id) == 2
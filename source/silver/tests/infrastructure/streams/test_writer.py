@@ -0,0 +1,14 @@
+from pyspark.sql import SparkSession
+
+from opengeh_silver.infrastructure.streams.writer import get_txn_app_id
+
+
+def test__get_txn_app_id__should_include_id_of_checkpoint(spark: SparkSession, tmp_path) -> None:
+    # Arrange
+    (tmp_path / "metadata").write_text('{"id":"9e2f4b1c-5c6f-4f5e-9d0a-3b1f2c7d8e9f"}\n')
+
+    # Act
+    actual = get_txn_app_id(spark, "query", str(tmp_path))
+
+    # Assert
+    assert actual == "query-9e2f4b1c-5c6f-4f5e-9d0a-3b1f2c7d8e9f"